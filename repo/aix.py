@@ -0,0 +1,287 @@
+"""
+aixlib 도구 단일 진입점
+
+    python repo/aix.py testcase [--psum-stream]            # 단일 레이어 testcase (testcase_args.json)
+    python repo/aix.py multilayer2                         # multilayer / multilayer1 / multilayer2
+    python repo/aix.py yolo-image -- --no-cache -j 4       # make_yolo_image.py 인자 그대로
+    python repo/aix.py verify -- expect.hex dump.bin       # compare_results.py 인자 그대로
+    python repo/aix.py pack                                # testcase weight / affine 패킹 (param_packed/*.hex)
+    python repo/aix.py param-archive                       # YOLO 파라미터 archive (decode 결과 mmap 파일) 생성
+    python repo/aix.py split16 mem_32b.hex mem_16b.hex     # 32b hex -> 16b hex (--join: 반대)
+    python repo/aix.py memory --ifm ... --out mem_16b.hex  # 만들어진 hex로 memory 이미지만 다시 구성
+    python repo/aix.py all -j 0                            # hw/inout_data 전체 재생성 (job 병렬)
+
+all: 각 builder를 독립 job으로 프로세스 풀에서 실행하고 job별 시간을 보고한다.
+testcase 입력(IFM / FILTER / BIAS / SCALE hex)은 풀을 만들기 전에 한 번만 decode해서
+worker가 공유한다 (fork면 그대로 상속, spawn이면 worker마다 한 번 전달).
+
+pack / split16 / memory는 aixlib.hexlite만 쓰므로 numpy를 import하지 않는다 (regression 스크립트에서
+수백 번 호출되는 경로). builder / numpy 모듈은 해당 명령에서만 import한다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shlex
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_ARGS = ROOT_DIR / "repo" / "testcase_args.json"
+TESTCASE_JOBS = ("testcase", "multilayer", "multilayer1", "multilayer2")     # make_testcase.BUILDERS
+ALL_JOBS = ("yolo-image",) + TESTCASE_JOBS          # 오래 걸리는 것부터
+DEFAULT_PARAM_ARCHIVE = ROOT_DIR / "repo" / ".param_archive.bin"
+
+
+# ------------------------------
+# job
+# ------------------------------
+def run_job(job: str, args_path: Path = DEFAULT_ARGS, root: Path = ROOT_DIR,
+            yolo_argv: list[str] | None = None, psum_stream: bool = False,
+            mmap_dir: Path | None = None) -> None:
+    if job in TESTCASE_JOBS:
+        import make_testcase
+        kwargs = {"args_path": args_path, "root": root}
+        if job == "testcase":
+            kwargs["psum_stream"] = psum_stream
+            kwargs["mmap_dir"] = mmap_dir
+        make_testcase.BUILDERS[job](**kwargs)
+    elif job == "yolo-image":
+        import make_yolo_image
+        make_yolo_image.main(yolo_argv or [])
+    else:
+        raise ValueError(f"unknown job: {job}")
+
+
+def _timed_job(job: str, kwargs: dict, capture: bool) -> dict:
+    """worker에서 job 하나 실행. 출력은 모아서 반환 (여러 job 출력이 섞이지 않게)"""
+    buf = io.StringIO()
+    t0 = time.perf_counter()
+    error = None
+    with contextlib.redirect_stdout(buf) if capture else contextlib.nullcontext():
+        try:
+            run_job(job, **kwargs)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            traceback.print_exc(file=buf if capture else sys.stdout)
+        finally:
+            # job 안에서 만든 conv 풀(aixlib.parallel)은 atexit로만 닫히는데,
+            # 풀 worker 프로세스에서는 atexit이 돌지 않아 종료 시 자식 join에서 멈춘다
+            parallel = sys.modules.get("aixlib.parallel")
+            if parallel is not None:
+                parallel.shutdown_pools()
+    return {"job": job, "ok": error is None, "seconds": time.perf_counter() - t0,
+            "pid": os.getpid(), "error": error, "output": buf.getvalue()}
+
+
+def run_jobs(jobs: list[str], workers: int = 0, log=print, **kwargs) -> list[dict]:
+    """
+    jobs를 프로세스 풀에서 실행. 반환: job별 {"job", "ok", "seconds", "pid", "error", "output"}\n
+    workers: 0 이하면 CPU 개수 (job 수 이상은 만들지 않음), 1이면 현재 프로세스에서 차례로
+    """
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    import make_testcase
+
+    workers = min(workers if workers > 0 else (os.cpu_count() or 1), len(jobs))
+    inputs = {}
+    if any(j in TESTCASE_JOBS for j in jobs):
+        inputs = make_testcase.preload_inputs(kwargs.get("args_path"), kwargs.get("root"))
+
+    results = []
+    if workers <= 1:
+        for job in jobs:
+            results.append(_timed_job(job, kwargs, capture=False))
+            if log:
+                log(_status(results[-1]))
+        return results
+
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+    spawn = ctx.get_start_method() != "fork"
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=make_testcase.share_inputs if spawn else None,
+                             initargs=(inputs,) if spawn else ()) as pool:
+        futures = {pool.submit(_timed_job, job, kwargs, True): job for job in jobs}
+        for f in as_completed(futures):
+            res = f.result()
+            results.append(res)
+            if log:
+                if res["output"]:
+                    log(f"----- {res['job']} -----")
+                    log(res["output"].rstrip())
+                log(_status(res))
+    return sorted(results, key=lambda r: jobs.index(r["job"]))
+
+
+def _status(res: dict) -> str:
+    state = "OK" if res["ok"] else f"FAIL ({res['error']})"
+    return f"[{state}] {res['job']} {res['seconds']:.2f}s (pid {res['pid']})"
+
+
+# ------------------------------
+# CLI
+# ------------------------------
+def _cmd_testcase(args) -> int:
+    run_job(args.cmd, args.args, args.root, psum_stream=getattr(args, "psum_stream", False),
+            mmap_dir=getattr(args, "mmap_dir", None))
+    return 0
+
+
+def _cmd_yolo_image(args) -> int:
+    import make_yolo_image
+    return make_yolo_image.main(args.rest)
+
+
+def _cmd_verify(args) -> int:
+    import compare_results
+    return compare_results.main(args.rest)
+
+
+def _cmd_pack(args) -> int:
+    from aixlib.hexlite import pack_weight_hex, pack_affine_hex
+    from aixlib.tcparams import load_params
+
+    params = load_params(args.args, args.root)
+    n = pack_weight_hex(params.filter_hex, params.out_weight_hex, params.cin, params.cout)
+    print(f"saved: {params.out_weight_hex} ({n} lines)")
+    n = pack_affine_hex(params.bias_hex, params.scale_hex, params.out_affine_hex, params.cout)
+    print(f"saved: {params.out_affine_hex} ({n} lines)")
+    return 0
+
+
+def _cmd_param_archive(args) -> int:
+    from aixlib.params import ParamStore
+
+    store = ParamStore(args.param_dir, args.out)
+    if store.archive_is_fresh() and not args.force:
+        print(f"param archive up to date: {args.out}")
+        return 0
+    t0 = time.perf_counter()
+    store.save_archive()
+    print(f"param archive saved: {args.out} ({len(store.files)} tensors, {time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+def _cmd_split16(args) -> int:
+    from aixlib.hexlite import split_hex32, join_hex16
+
+    n = (join_hex16 if args.join else split_hex32)(args.src, args.dst)
+    print(f"saved: {args.dst} ({n} lines)")
+    return 0
+
+
+def _cmd_memory(args) -> int:
+    from aixlib.hexlite import build_memory_hex
+
+    info = build_memory_hex(args.ifm, args.filter, args.bias, args.scale, args.out, args.out_32b, args.cout)
+    print(f"saved: {args.out} ({info['total_lines_16b']} lines, offsets ifm={info['ifm_offset']} "
+          f"filter={info['filter_offset']} bias={info['bias_offset']} scale={info['scale_offset']})")
+    if args.out_32b is not None:
+        print(f"saved: {args.out_32b}")
+    return 0
+
+
+def _cmd_all(args) -> int:
+    jobs = args.jobs or list(ALL_JOBS)
+    unknown = [j for j in jobs if j not in ALL_JOBS]
+    if unknown:
+        raise ValueError(f"unknown job(s): {unknown} (choices: {', '.join(ALL_JOBS)})")
+    t0 = time.perf_counter()
+    results = run_jobs(jobs, args.workers, log=None if args.quiet else print,
+                       args_path=args.args, root=args.root, yolo_argv=shlex.split(args.yolo_args))
+    wall = time.perf_counter() - t0
+    busy = sum(r["seconds"] for r in results)
+
+    print()
+    print(f"{'job':<12} {'status':<6} {'seconds':>8}")
+    for r in results:
+        print(f"{r['job']:<12} {'ok' if r['ok'] else 'FAIL':<6} {r['seconds']:>8.2f}")
+    print(f"wall {wall:.2f}s, job total {busy:.2f}s (x{busy / wall if wall else 0:.2f})")
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        doc = {"wall_s": wall, "jobs": [{k: v for k, v in r.items() if k != "output"} for r in results]}
+        args.json.write_text(json.dumps(doc, indent=2))
+        print(f"saved: {args.json}")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="aix", description="aixlib testcase / DRAM image tools")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def testcase_opts(p):
+        p.add_argument("--args", type=Path, default=DEFAULT_ARGS, help="testcase 인자 JSON")
+        p.add_argument("--root", type=Path, default=ROOT_DIR, help="입력 / hw/inout_data 기준 디렉토리")
+
+    p = sub.add_parser("testcase", help="단일 레이어 testcase")
+    testcase_opts(p)
+    p.add_argument("--psum-stream", action="store_true", help="tile 순서 partial sum도 기록")
+    p.add_argument("--mmap-dir", type=Path, default=None, help="IFM / conv 결과 / memory를 memmap 파일로 (큰 입력용)")
+    p.set_defaults(func=_cmd_testcase)
+    for name in TESTCASE_JOBS[1:]:
+        p = sub.add_parser(name, help=f"{name} testcase")
+        testcase_opts(p)
+        p.set_defaults(func=_cmd_testcase)
+
+    for name, func, help_text in (("yolo-image", _cmd_yolo_image, "make_yolo_image.py (나머지 인자 전달)"),
+                                  ("verify", _cmd_verify, "compare_results.py (나머지 인자 전달)")):
+        p = sub.add_parser(name, help=help_text, add_help=False)
+        p.add_argument("rest", nargs=argparse.REMAINDER)
+        p.set_defaults(func=func)
+
+    p = sub.add_parser("pack", help="testcase weight / affine 패킹 (numpy 없이)")
+    testcase_opts(p)
+    p.set_defaults(func=_cmd_pack)
+
+    p = sub.add_parser("param-archive", help="YOLO 파라미터 archive 생성")
+    p.add_argument("--param-dir", type=Path, default=ROOT_DIR / "repo" / "data" / "param")
+    p.add_argument("--out", type=Path, default=DEFAULT_PARAM_ARCHIVE)
+    p.add_argument("--force", action="store_true", help="최신이어도 다시 생성")
+    p.set_defaults(func=_cmd_param_archive)
+
+    p = sub.add_parser("split16", help="32b hex -> 16b hex (numpy 없이)")
+    p.add_argument("src", type=Path)
+    p.add_argument("dst", type=Path)
+    p.add_argument("--join", action="store_true", help="반대로 16b -> 32b")
+    p.set_defaults(func=_cmd_split16)
+
+    p = sub.add_parser("memory", help="32b hex 섹션으로 memory 이미지 구성 (numpy 없이)")
+    p.add_argument("--ifm", type=Path, required=True, help="IFM 32b hex")
+    p.add_argument("--filter", type=Path, required=True, help="32b 패킹된 FILTER hex (weight_32b)")
+    p.add_argument("--bias", type=Path, required=True, help="BIAS 32b hex")
+    p.add_argument("--scale", type=Path, required=True, help="SCALE 32b hex")
+    p.add_argument("--out", type=Path, required=True, help="memory 16b hex")
+    p.add_argument("--out-32b", type=Path, default=None, help="memory 32b hex도 기록")
+    p.add_argument("--cout", type=int, default=None, help="BIAS / SCALE은 앞 cout줄만 사용")
+    p.set_defaults(func=_cmd_memory)
+
+    p = sub.add_parser("all", help="여러 builder를 병렬 실행 (hw/inout_data 전체 재생성)")
+    testcase_opts(p)
+    p.add_argument("--jobs", type=lambda t: [j for j in t.split(",") if j], default=None,
+                   help=f"실행할 job (기본: {','.join(ALL_JOBS)})")
+    p.add_argument("-j", "--workers", type=int, default=0, help="동시 job 수 (0: CPU 개수)")
+    p.add_argument("--yolo-args", default="", help="yolo-image job에 넘길 인자 (예: \"--no-cache\")")
+    p.add_argument("--quiet", action="store_true", help="job 출력 생략 (시간 요약만)")
+    p.add_argument("--json", type=Path, default=None, help="job별 시간 JSON")
+    p.set_defaults(func=_cmd_all)
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = build_parser()
+    args, extra = ap.parse_known_args(argv)
+    if hasattr(args, "rest"):
+        # yolo-image / verify: 나머지 인자는 그대로 해당 스크립트로 ("--" 구분은 생략 가능)
+        rest = extra + args.rest
+        args.rest = rest[1:] if rest[:1] == ["--"] else rest
+    elif extra:
+        ap.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+aixlib 공개 API
+
+    from aixlib import read_hex_words, run_conv, ParamStore
+
+하위 모듈은 이름을 처음 쓸 때 import한다 (`import aixlib`만으로는 numpy를 읽지 않음).
+hex 텍스트만 다루는 경로(aixlib.hexlite)는 numpy 없이 동작한다.
+"""
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_EXPORTS = {
+    # hex 입출력
+    "read_hex_words": "io_hex", "write_hex_words": "io_hex", "iter_hex_words": "io_hex",
+    "decode_hex_words": "io_hex", "format_hex_words": "io_hex", "hex_lines_to_words": "io_hex",
+    "words_to_hex_lines": "io_hex", "read_32b_hex_lines": "io_hex", "write_hex_lines": "io_hex",
+    "read_hex_lines": "hexlite", "split_hex32": "hexlite", "join_hex16": "hexlite",
+    "build_memory_hex": "hexlite", "pack_weight_hex": "hexlite", "pack_affine_hex": "hexlite", "align_up": "hexlite",
+    # testcase
+    "TCParams": "tcparams", "load_params": "tcparams", "KERNEL_SIZE": "utils",
+    "verify_inputs": "verify",
+    "FeatureMap": "feamap", "WORD_CHANNELS": "feamap",
+    "pack_filter_72b": "packers", "pack_filter_32b": "packers", "pack_affine": "packers",
+    "run_conv": "ops_conv", "run_affine_from_conv": "ops_conv", "run_layer_fused": "ops_conv",
+    "maxpool_from_affine_words": "ops_conv", "upsample_words": "ops_conv", "concat_words": "ops_conv",
+    "memory_builder_monolayer": "memory",
+    # YOLO
+    "ConvLayer": "yolo", "YOLO_LAYERS": "yolo", "YOLO_INPUT": "yolo", "build_yolo_graph": "yolo",
+    "ParamStore": "params", "load_layer_params": "params",
+    "LayerCache": "cache", "GraphExecutor": "graph", "BatchExecutor": "batch",
+    "LayoutConfig": "layout", "plan_layout": "layout", "build_image": "layout",
+    "write_dram_bin": "dram_image", "open_dram_bin": "dram_image",
+    "compare_files": "compare",
+    # 모델 / 분석
+    "load_hw_config": "perf", "load_layer_table": "perf", "estimate": "perf", "sweep": "perf",
+    "iter_trace": "trace", "write_trace": "trace", "read_trace": "trace", "summarize_trace": "trace",
+    "profiled": "profiling", "stage": "profiling",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value         # 다음 접근부터는 일반 속성
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from .feamap import FeatureMap, WORD_CHANNELS
+from .graph import Graph, GraphExecutor
+from .io_hex import read_hex_words
+
+
+class BatchExecutor:
+    """
+    Graph를 batch 축이 붙은 FeatureMap (N, H, W, C)으로 실행\n
+    노드 평가 / liveness / fusion은 GraphExecutor 그대로이고, 모든 프레임이 conv matmul 하나를 공유한다.\n
+    batch_size: 한 번에 계산할 프레임 수 (im2col 메모리 ~ batch_size * H*W*C*9*8 byte)
+    """
+
+    def __init__(self, graph: Graph, params: Mapping[str, Mapping[str, Any]], batch_size: int = 8,
+                 log: Callable[[str], None] | None = print):
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive: {batch_size}")
+        self.executor = GraphExecutor(graph, params, log=None)
+        self.batch_size = batch_size
+        self.log = log
+
+    def run(self, frames: FeatureMap, input_name: str,
+            sink: Callable[[int, list[np.ndarray]], None] | None = None) -> list[np.ndarray] | None:
+        """
+        frames (batch FeatureMap)를 batch_size씩 나눠 실행\n
+        프레임마다 출력 워드(그래프 출력 순서로 이어 붙인 uint32)를 만든다.
+        sink(i, [출력별 워드])가 있으면 넘기고 (메모리에 모으지 않음), 없으면 목록을 반환
+        """
+        if frames.frames is None:
+            raise ValueError(f"batch input must be (N, H, W, C): {frames}")
+        results = [] if sink is None else None
+        for s in range(0, frames.frames, self.batch_size):
+            chunk = FeatureMap(frames.data[s:s + self.batch_size], frames.channels)
+            if self.log:
+                self.log(f"[batch] frames {s}..{s + chunk.frames - 1} / {frames.frames}")
+            outs = self.executor.run({input_name: chunk})
+            for j in range(chunk.frames):
+                words = [out.frame(j).to_words() for out in outs.values()]
+                if sink is not None:
+                    sink(s + j, words)
+                else:
+                    results.append(np.concatenate(words))
+        return results
+
+
+# ------------------------------
+# 입력 프레임
+# ------------------------------
+def load_frames(src: Path, H: int, W: int, C: int) -> tuple[FeatureMap, list[str]]:
+    """
+    입력 이미지 stack 읽기. 반환: (batch FeatureMap (N, H, W, C), 프레임 이름 목록)\n
+    - 디렉토리: *.hex (32b, 프레임당 H*W*C/4 줄) / *.bin (raw little-endian) 파일을 이름 순으로\n
+    - .npy: (N, H, W, C) uint8 또는 (N, H*W*C/4) uint32\n
+    - 그 외 파일: 32b hex 또는 raw little-endian 파일 하나에 N 프레임이 연속
+    """
+    if C % WORD_CHANNELS:
+        raise ValueError(f"input channels must be padded to multiple of 4: C={C}")
+    frame_words = H * W * C // WORD_CHANNELS
+    if src.is_dir():
+        files = sorted(p for p in src.iterdir() if p.suffix.lower() in (".hex", ".bin"))
+        if not files:
+            raise FileNotFoundError(f"no .hex / .bin frames in {src}")
+        data = np.empty((len(files), frame_words), dtype="<u4")
+        for i, p in enumerate(files):
+            words = _read_words(p)
+            if words.size != frame_words:
+                raise ValueError(f"{p}: {words.size} words, expected {frame_words} ({H}x{W}x{C})")
+            data[i] = words
+        return _frames_from_words(data, H, W, C), [p.stem for p in files]
+
+    if not src.is_file():
+        raise FileNotFoundError(f"input not found: {src}")
+    if src.suffix.lower() == ".npy":
+        arr = np.load(src, mmap_mode="r")
+        if arr.dtype == np.uint8 and arr.shape[1:] == (H, W, C):
+            batch = FeatureMap(np.ascontiguousarray(arr), C)
+        else:
+            batch = _frames_from_words(np.asarray(arr).reshape(-1), H, W, C)
+    else:
+        words = _read_words(src)
+        if words.size % frame_words:
+            raise ValueError(f"{src}: {words.size} words is not a multiple of one frame ({frame_words})")
+        batch = _frames_from_words(words, H, W, C)
+    return batch, [f"frame{i:04d}" for i in range(batch.frames)]
+
+
+def _frames_from_words(words: np.ndarray, H: int, W: int, C: int) -> FeatureMap:
+    """(N, H*W*C/4) 또는 연속된 N 프레임의 32b 워드 -> uint8 (N, H, W, C)"""
+    return FeatureMap(np.ascontiguousarray(words, dtype="<u4").view(np.uint8).reshape(-1, H, W, C), C)
+
+
+def _read_words(path: Path) -> np.ndarray:
+    if path.suffix.lower() == ".hex":
+        return read_hex_words(path)
+    if path.stat().st_size % 4:
+        raise ValueError(f"{path}: size is not a multiple of 4 bytes")
+    return np.fromfile(path, dtype="<u4")
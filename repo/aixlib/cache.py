@@ -0,0 +1,132 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .feamap import FeatureMap
+from .profiling import profiled
+
+
+CACHE_VERSION = 1                   # 연산 구현이 바뀌어 결과가 달라지면 올릴 것
+DEFAULT_CACHE_BYTES = 1 << 30       # 1 GiB
+
+
+def _update(h: "hashlib._Hash", obj: Any) -> None:
+    """obj 내용을 타입 태그와 함께 해시에 반영"""
+    if isinstance(obj, FeatureMap):
+        h.update(b"F")
+        _update(h, obj.channels)
+        _update(h, obj.data)
+    elif isinstance(obj, np.ndarray):
+        h.update(f"A{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"B%d:" % len(obj))
+        h.update(obj)
+    elif isinstance(obj, str):
+        b = obj.encode()
+        h.update(b"S%d:" % len(b))
+        h.update(b)
+    elif isinstance(obj, (bool, int, float)) or obj is None:
+        h.update(f"N{obj!r};".encode())
+    elif isinstance(obj, (list, tuple)):
+        if obj and all(isinstance(v, str) for v in obj):
+            # hex 문자열 리스트는 한 번에
+            _update(h, "\n".join(obj))
+        else:
+            h.update(b"L%d:" % len(obj))
+            for v in obj:
+                _update(h, v)
+    elif isinstance(obj, dict):
+        h.update(b"D%d:" % len(obj))
+        for k in sorted(obj):
+            _update(h, k)
+            _update(h, obj[k])
+    else:
+        raise TypeError(f"cannot hash {type(obj).__name__}")
+
+
+class LayerCache:
+    """
+    레이어(노드) 결과의 content-addressed 디스크 캐시\n
+    key = sha256(연산 이름, shape/attr, 파라미터, 입력 텐서 내용)\n
+    값은 {key}_{channels}.npy 로 저장. 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 파일부터 삭제(LRU, 파일 mtime 기준).
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        h = hashlib.sha256()
+        _update(h, CACHE_VERSION)
+        for p in parts:
+            _update(h, p)
+        return h.hexdigest()
+
+    def _find(self, key: str) -> Path | None:
+        for p in self.root.glob(f"{key}_*.npy"):
+            return p
+        return None
+
+    @profiled("cache.get")
+    def get(self, key: str) -> FeatureMap | None:
+        path = self._find(key)
+        if path is None:
+            self.misses += 1
+            return None
+        try:
+            data = np.load(path, allow_pickle=False)
+            channels = int(path.stem.rsplit("_", 1)[1])
+            fm = FeatureMap(data, channels)
+        except (OSError, ValueError):
+            # 깨진 파일은 버리고 miss 처리
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        os.utime(path)      # LRU 갱신
+        self.hits += 1
+        return fm
+
+    @profiled("cache.put")
+    def put(self, key: str, fm: FeatureMap) -> None:
+        path = self.root / f"{key}_{fm.channels}.npy"
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            np.save(f, np.ascontiguousarray(fm.data), allow_pickle=False)
+        os.replace(tmp, path)
+        self.evict()
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.root.glob("*.npy"))
+
+    def evict(self) -> int:
+        """max_bytes 이하가 될 때까지 LRU 순으로 삭제. 반환: 삭제한 파일 수"""
+        entries = []
+        for p in self.root.glob("*.npy"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for p in self.root.glob("*.npy"):
+            p.unlink(missing_ok=True)
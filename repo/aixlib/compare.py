@@ -0,0 +1,302 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .dram_image import MAGIC, open_dram_bin
+from .feamap import WORD_CHANNELS
+from .io_hex import iter_hex_words
+from .profiling import profiled
+from .yolo import yolo_layer
+
+
+DEFAULT_CHUNK_WORDS = 1 << 22      # 16 MiB / stream
+
+
+@dataclass(frozen=True)
+class OutputRegion:
+    """
+    expect 안의 feature map 하나 (HWC, 채널 4개 = 32b 워드 1개)\n
+    워드 index = offset + (y * W + x) * (C/4) + channel group
+    """
+    name: str
+    height: int
+    width: int
+    channels: int
+    offset: int = 0         # 32b 워드 기준
+
+    @property
+    def groups(self) -> int:
+        return -(-self.channels // WORD_CHANNELS)
+
+    @property
+    def words(self) -> int:
+        return self.height * self.width * self.groups
+
+
+def make_regions(shapes: Iterable[tuple[str, int, int, int]]) -> list[OutputRegion]:
+    """(name, H, W, C) 목록 -> 연속 배치된 OutputRegion 목록"""
+    regions, pos = [], 0
+    for name, H, W, C in shapes:
+        r = OutputRegion(name, H, W, C, pos)
+        regions.append(r)
+        pos += r.words
+    return regions
+
+
+def yolo_output_regions() -> list[OutputRegion]:
+    """yolo_engine_expect.hex 배치: L08 결과(L09 save) + L14 결과(L15 save)"""
+    return make_regions((l.name, l.height, l.width, l.cout)
+                        for l in (yolo_layer("L08"), yolo_layer("L14")))
+
+
+def parse_layout(text: str) -> list[OutputRegion]:
+    """'yolo' 또는 '[NAME=]HxWxC,...' (예: 8x8x196,L14=16x16x196)"""
+    if text == "yolo":
+        return yolo_output_regions()
+    shapes = []
+    for i, item in enumerate(p.strip() for p in text.split(",") if p.strip()):
+        name, _, dims = item.rpartition("=")
+        try:
+            H, W, C = (int(d) for d in dims.lower().split("x"))
+        except ValueError:
+            raise ValueError(f"bad layout entry: {item!r} (expected [NAME=]HxWxC)") from None
+        shapes.append((name or f"R{i}", H, W, C))
+    return make_regions(shapes)
+
+
+# ------------------------------
+# 결과
+# ------------------------------
+@dataclass
+class Mismatch:
+    index: int              # 32b 워드 index (expect 기준)
+    layer: str              # 영역 밖이면 "-"
+    y: int
+    x: int
+    group: int              # 채널 그룹 (채널 4*group ~ 4*group+3)
+    expect: int
+    actual: int
+
+
+@dataclass
+class LayerStats:
+    region: OutputRegion
+    mismatches: int = 0
+    by_row: np.ndarray = field(init=False)      # (H,) 행별 불일치 워드 수
+    by_group: np.ndarray = field(init=False)    # (C/4,) 채널 그룹별
+    by_lane: np.ndarray = field(init=False)     # (4,) 워드 안 byte lane(채널 4g+i)별
+
+    def __post_init__(self):
+        r = self.region
+        self.by_row = np.zeros(r.height, dtype=np.int64)
+        self.by_group = np.zeros(r.groups, dtype=np.int64)
+        self.by_lane = np.zeros(WORD_CHANNELS, dtype=np.int64)
+
+
+@dataclass
+class CompareResult:
+    expect_words: int = 0           # 비교 중 읽은 워드 수 (조기 종료 시 그 시점까지)
+    actual_words: int = 0
+    mismatches: int = 0             # 워드 단위 (길이 차이 제외)
+    stopped_early: bool = False
+    layers: dict[str, LayerStats] = field(default_factory=dict)
+    outside: int = 0                # 영역 밖 워드의 불일치
+    records: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.mismatches == 0 and self.expect_words == self.actual_words
+
+    def summary(self) -> dict:
+        return {
+            "ok": self.ok,
+            "expect_words": self.expect_words,
+            "actual_words": self.actual_words,
+            "mismatches": self.mismatches,
+            "stopped_early": self.stopped_early,
+            "outside": self.outside,
+            "layers": {name: {"words": s.region.words, "mismatches": s.mismatches,
+                              "by_row": s.by_row.tolist(), "by_group": s.by_group.tolist(),
+                              "by_lane": s.by_lane.tolist()}
+                       for name, s in self.layers.items()},
+            "records": [vars(m) for m in self.records],
+        }
+
+
+# ------------------------------
+# 입력 stream
+# ------------------------------
+def iter_words(path: Path, offset_words: int = 0,
+               chunk_words: int = DEFAULT_CHUNK_WORDS) -> Iterator[np.ndarray]:
+    """
+    32b hex / DRAM 이미지(.bin, header 포함) / raw little-endian 덤프를 uint32 chunk로\n
+    offset_words: 앞에서 건너뛸 워드 수 (예: DRAM 덤프에서 OFM 영역만 비교)
+    """
+    if not path.is_file():
+        raise FileNotFoundError(f"file not found: {path}")
+    with path.open("rb") as f:
+        head = f.read(len(MAGIC))
+    if head == MAGIC:
+        mem = open_dram_bin(path)[1]
+    elif path.suffix.lower() in (".bin", ".raw", ".dump"):
+        mem = np.memmap(path, dtype="<u4", mode="r") if path.stat().st_size >= 4 else np.empty(0, "<u4")
+    else:
+        yield from _rechunk(iter_hex_words(path, 8), chunk_words, offset_words)
+        return
+    for s in range(offset_words, mem.size, chunk_words):
+        yield np.asarray(mem[s:s + chunk_words])
+
+
+def _rechunk(chunks: Iterator[np.ndarray], n: int, skip: int = 0) -> Iterator[np.ndarray]:
+    """임의 크기 chunk -> n 워드 chunk (마지막만 짧음), 앞의 skip 워드는 버림"""
+    pending = np.empty(0, dtype=np.uint32)
+    for c in chunks:
+        if skip:
+            drop = min(skip, c.size)
+            c, skip = c[drop:], skip - drop
+        if pending.size:
+            take = n - pending.size
+            pending = np.concatenate([pending, c[:take]])
+            c = c[take:]
+            if pending.size < n:
+                continue
+            yield pending
+        s = 0
+        while c.size - s >= n:
+            yield c[s:s + n]
+            s += n
+        pending = c[s:]
+    if pending.size:
+        yield pending
+
+
+# ------------------------------
+# 비교
+# ------------------------------
+def _locate(regions: list[OutputRegion], idx: np.ndarray) -> tuple[np.ndarray, ...]:
+    """워드 index -> (region 번호(-1: 영역 밖), y, x, group)"""
+    starts = np.array([r.offset for r in regions] or [0], dtype=np.int64)
+    ends = np.array([r.offset + r.words for r in regions] or [0], dtype=np.int64)
+    wpp = np.array([r.groups for r in regions] or [1], dtype=np.int64)
+    W = np.array([r.width for r in regions] or [1], dtype=np.int64)
+
+    ri = np.searchsorted(starts, idx, side="right") - 1
+    inside = (ri >= 0) & (idx < ends[np.maximum(ri, 0)])
+    rc = np.maximum(ri, 0)
+    pix, group = np.divmod(idx - starts[rc], wpp[rc])
+    y, x = np.divmod(pix, W[rc])
+    return np.where(inside, ri, -1), y, x, group
+
+
+@profiled()
+def compare_streams(expect: Iterable[np.ndarray], actual: Iterable[np.ndarray],
+                    regions: list[OutputRegion], max_errors: int | None = None,
+                    keep: int = 100, trim_actual: bool = False) -> CompareResult:
+    """
+    같은 길이로 잘린 uint32 chunk stream 두 개를 비교\n
+    max_errors: 불일치 워드가 이만큼 나오면 중단. keep: 상세 기록(Mismatch) 개수\n
+    trim_actual: actual이 더 큰 덤프의 일부일 때. expect가 끝나면 actual은 더 읽지 않고
+    길이에도 넣지 않는다 (actual이 expect보다 짧을 때만 길이 차이)
+    """
+    res = CompareResult(layers={r.name: LayerStats(r) for r in regions})
+    stats = list(res.layers.values())
+    exp_it, act_it = iter(expect), iter(actual)
+    base = 0
+    while True:
+        e = next(exp_it, None)
+        a = None if e is None and trim_actual else next(act_it, None)
+        if e is None or a is None:
+            # 남은 쪽은 길이만 센다
+            res.expect_words += 0 if e is None else e.size + sum(c.size for c in exp_it)
+            res.actual_words += 0 if a is None else a.size + sum(c.size for c in act_it)
+            break
+        n = min(e.size, a.size)
+        if trim_actual:
+            a = a[:n]
+        res.expect_words += e.size
+        res.actual_words += a.size
+        bad = np.flatnonzero(e[:n] != a[:n])
+        if max_errors is not None and res.mismatches + bad.size >= max_errors:
+            bad = bad[:max_errors - res.mismatches]
+            res.stopped_early = True
+        if bad.size:
+            _accumulate(res, stats, regions, base + bad, e[bad], a[bad], keep)
+        if res.stopped_early or e.size != a.size:
+            # chunk 길이가 다르면 한쪽 stream이 끝난 것
+            if not res.stopped_early:
+                res.expect_words += sum(c.size for c in exp_it)
+                res.actual_words += 0 if trim_actual else sum(c.size for c in act_it)
+            break
+        base += n
+    return res
+
+
+def _accumulate(res: CompareResult, stats: list[LayerStats], regions: list[OutputRegion],
+                idx: np.ndarray, e: np.ndarray, a: np.ndarray, keep: int) -> None:
+    ri, y, x, group = _locate(regions, idx)
+    res.mismatches += idx.size
+    res.outside += int((ri < 0).sum())
+    # byte lane: xor의 각 byte가 0이 아닌 곳 (채널 4g+i)
+    lanes = (((e ^ a)[:, None] >> (8 * np.arange(WORD_CHANNELS, dtype=np.uint32))) & 0xFF) != 0
+    for k, s in enumerate(stats):
+        m = ri == k
+        if not m.any():
+            continue
+        s.mismatches += int(m.sum())
+        s.by_row += np.bincount(y[m], minlength=s.region.height)
+        s.by_group += np.bincount(group[m], minlength=s.region.groups)
+        s.by_lane += lanes[m].sum(axis=0)
+
+    for j in range(min(keep - len(res.records), idx.size)):
+        inside = ri[j] >= 0
+        res.records.append(Mismatch(int(idx[j]), regions[ri[j]].name if inside else "-",
+                                    int(y[j]) if inside else -1, int(x[j]) if inside else -1,
+                                    int(group[j]) if inside else -1, int(e[j]), int(a[j])))
+
+
+def compare_files(expect_path: Path, actual_path: Path, regions: list[OutputRegion] | None = None,
+                  max_errors: int | None = None, keep: int = 100, actual_offset: int = 0,
+                  chunk_words: int = DEFAULT_CHUNK_WORDS, trim_actual: bool | None = None) -> CompareResult:
+    """
+    expect / actual 파일 비교 (hex, DRAM 이미지 .bin, raw 덤프)\n
+    actual_offset: actual의 byte 오프셋 (예: DRAM 덤프면 YOLO_DRAM_OFM_OFFSET)\n
+    trim_actual: actual을 expect 길이에서 자른다 (compare_streams). 기본은 actual_offset을 줬을 때
+    """
+    if actual_offset % 4:
+        raise ValueError(f"actual_offset must be word aligned: {actual_offset}")
+    if trim_actual is None:
+        trim_actual = actual_offset > 0
+    return compare_streams(iter_words(expect_path, 0, chunk_words),
+                           iter_words(actual_path, actual_offset // 4, chunk_words),
+                           yolo_output_regions() if regions is None else regions,
+                           max_errors, keep, trim_actual)
+
+
+def format_report(res: CompareResult, show: int = 20) -> list[str]:
+    """testbench의 'MIS idx=...' 형식 + 레이어별 요약"""
+    out = []
+    for m in res.records[:show]:
+        out.append(f"MIS idx={m.index} layer={m.layer} y={m.y} x={m.x} cg={m.group} "
+                   f"exp={m.expect:08x} got={m.actual:08x}")
+    if res.mismatches > show:
+        out.append(f"... ({res.mismatches - show} more)")
+    for name, s in res.layers.items():
+        r = s.region
+        line = f"{name:<6} {r.height}x{r.width}x{r.channels} words={r.words} mismatches={s.mismatches}"
+        if s.mismatches:
+            rows = np.flatnonzero(s.by_row)
+            groups = np.flatnonzero(s.by_group)
+            line += (f" rows={rows.min()}..{rows.max()} ({rows.size})"
+                     f" cgroups={groups.min()}..{groups.max()} ({groups.size})"
+                     f" lanes={s.by_lane.tolist()}")
+        out.append(line)
+    if res.outside:
+        out.append(f"outside layout: {res.outside} mismatches")
+    if res.expect_words != res.actual_words and not res.stopped_early:
+        out.append(f"length differs: expect={res.expect_words} actual={res.actual_words} words")
+    if res.stopped_early:
+        out.append(f"stopped after {res.mismatches} mismatches")
+    out.append("PASS" if res.ok else "FAIL")
+    return out
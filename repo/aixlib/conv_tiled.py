@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .ops_conv import conv2d_int8
+from .io_hex import format_hex_words
+
+
+TIN = 4     # controller_params.vh: 입력 채널 tile
+TOUT = 4    # controller_params.vh: 출력 채널 tile
+
+
+@dataclass
+class PsumTile:
+    """
+    입력 채널 tile 하나를 누산한 직후의 partial sum\n
+    tout / tin : 출력 / 입력 채널 tile 번호\n
+    row0       : band 첫 행 (band 행 수 = psum.shape[0])\n
+    psum       : (band, W, Tout) int32. 다음 tile 누산 시 덮어쓰므로 보관하려면 복사할 것
+    """
+    tout: int
+    tin: int
+    row0: int
+    psum: np.ndarray
+
+
+def _ifm_band(ifm: np.ndarray, y0: int, rows: int, c0: int, c1: int, pad: int) -> np.ndarray:
+    """IFM 행 [y0-pad, y0-pad+rows) x 채널 [c0, c1)을 zero padding 포함해서 잘라온다"""
+    H, W = ifm.shape[:2]
+    band = np.zeros((rows, W + 2 * pad, c1 - c0), dtype=np.int8)
+    s0, s1 = max(0, y0 - pad), min(H, y0 - pad + rows)
+    if s0 < s1:
+        band[s0 - (y0 - pad):s1 - (y0 - pad), pad:pad + W] = ifm[s0:s1, :, c0:c1]
+    return band
+
+
+def conv2d_int8_tiled(ifm: np.ndarray, weights: np.ndarray, pad: int = 1,
+                      band_rows: int = 1, tin: int = TIN, tout: int = TOUT,
+                      out: np.ndarray | None = None,
+                      psum_sink: Callable[[PsumTile], None] | None = None) -> np.ndarray:
+    """
+    하드웨어(cnn_ctrl) 순서를 따르는 tiled conv\n
+    출력 채널 tile(Tout) → 행 band → 입력 채널 tile(Tin) 순으로 돌면서
+    band 하나 분량의 partial sum (band_rows, W, Tout) 만 유지한다. (band_rows=1 이 하드웨어와 같음)\n
+    ifm: (H, W, C) int8 (np.memmap 가능), weights: (M, C, K, K) int8\n
+    out: 결과를 받을 (H_out, W_out, M) int32 배열 (np.memmap 가능). 없으면 새로 할당\n
+    psum_sink: 입력 tile 누산이 끝날 때마다 PsumTile로 호출\n
+    반환: out. 값은 conv2d_int8(...).transpose(1, 2, 0)와 동일 (32b wrap-around 포함)
+    """
+    M, C, K, _ = weights.shape
+    H, W = ifm.shape[:2]
+    H_out, W_out = H + 2 * pad - K + 1, W + 2 * pad - K + 1
+    if out is None:
+        out = np.empty((H_out, W_out, M), dtype=np.int32)
+    elif out.shape != (H_out, W_out, M) or out.dtype != np.int32:
+        raise ValueError(f"out must be int32 {(H_out, W_out, M)}, got {out.dtype} {out.shape}")
+
+    psum = np.empty((band_rows, W_out, tout), dtype=np.int32)
+    for to, m0 in enumerate(range(0, M, tout)):
+        m1 = min(m0 + tout, M)
+        for y0 in range(0, H_out, band_rows):
+            rows = min(band_rows, H_out - y0)
+            acc = psum[:rows, :, :m1 - m0]
+            acc[...] = 0
+            for ti, c0 in enumerate(range(0, C, tin)):
+                c1 = min(c0 + tin, C)
+                x = _ifm_band(ifm, y0, rows + K - 1, c0, c1, pad)
+                # int32 덧셈은 wrap-around -> 하드웨어 32b psum과 같은 결과
+                acc += conv2d_int8(x, weights[m0:m1, c0:c1], pad=0).transpose(1, 2, 0)
+                if psum_sink is not None:
+                    psum_sink(PsumTile(to, ti, y0, acc))
+            out[y0:y0 + rows, :, m0:m1] = acc
+    return out
+
+
+# ------------------------------
+# psum stream
+# ------------------------------
+class PsumStreamWriter:
+    """
+    PsumTile을 hex 파일로 스트리밍 기록 (psum_sink로 사용)\n
+    한 줄 = int32 partial sum 1개 (32b hex). 기록 순서 = conv2d_int8_tiled 호출 순서:\n
+      출력 채널 tile (tout) → 행 band → 입력 채널 tile (tin) → 레코드\n
+    레코드 하나 = 해당 tin까지 누산한 band 전체, 안쪽은 행 → x → tile 안 출력 채널 순
+    (rows * W_out * nm 줄, nm = 마지막 tile에서만 Tout보다 작음).
+    같은 출력 위치가 tin 개수만큼 반복되며 마지막 tin 레코드가 최종 conv 값이다.
+    줄 번호 -> 위치 변환은 locate_psum_line
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.lines = 0
+        self._f = path.open("wb")
+
+    def __call__(self, tile: PsumTile) -> None:
+        words = np.ascontiguousarray(tile.psum).view("<u4").reshape(-1)
+        self._f.write(format_hex_words(words))
+        self.lines += words.size
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "PsumStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def locate_psum_line(line: int, H: int, W: int, C: int, M: int, K: int = 3, pad: int = 1,
+                     band_rows: int = 1, tin: int = TIN, tout: int = TOUT) -> dict:
+    """
+    psum stream의 줄 번호(0-based) -> tile 위치\n
+    반환: {"tout", "tin", "row", "x", "m"} (row/x는 출력 좌표, m은 출력 채널)
+    """
+    H_out, W_out = H + 2 * pad - K + 1, W + 2 * pad - K + 1
+    n_tin = -(-C // tin)
+    for to, m0 in enumerate(range(0, M, tout)):
+        nm = min(tout, M - m0)
+        tile_lines = H_out * W_out * nm * n_tin
+        if line >= tile_lines:
+            line -= tile_lines
+            continue
+        for y0 in range(0, H_out, band_rows):
+            rows = min(band_rows, H_out - y0)
+            rec = rows * W_out * nm
+            if line >= rec * n_tin:
+                line -= rec * n_tin
+                continue
+            ti, r = divmod(line, rec)
+            dy, r = divmod(r, W_out * nm)
+            x, dm = divmod(r, nm)
+            return {"tout": to, "tin": ti, "row": y0 + dy, "x": x, "m": m0 + dm}
+    raise ValueError(f"psum line {line} out of range")
@@ -0,0 +1,160 @@
+import json
+import struct
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from .io_hex import iter_hex_words, write_hex_words
+from .profiling import profiled
+
+
+# ------------------------------
+# binary DRAM image
+#   [0, 4096)   header: struct(magic, version, header_bytes, json_len) + JSON
+#   [4096, ...) payload: little-endian uint32 워드 (DRAM 주소 0부터)
+# payload가 페이지 경계에서 시작하므로 np.memmap / mmap으로 바로 열 수 있다.
+# ------------------------------
+MAGIC = b"AIXDRAM\0"
+VERSION = 1
+HEADER_BYTES = 4096
+_HEAD = struct.Struct("<8sIII")     # magic, version, header_bytes, json_len
+
+SECTIONS = ("ifm", "filter", "bias", "scale")
+
+
+def sections_from_info(info: dict, ofm_offset: int | None = None, ofm_bytes: int = 0) -> dict:
+    """
+    memory_builder_monolayer 결과 -> 섹션 표 (byte 단위)\n
+    {"ifm": {"offset": .., "bytes": ..}, ..., "ofm": {...}}\n
+    ofm_offset: 출력이 저장될 DRAM 영역 (이미지 payload 밖이어도 됨)
+    """
+    offs = [info[f"{s}_offset"] for s in SECTIONS] + [info["total_lines"]]
+    table = {s: {"offset": offs[i] * 4, "bytes": (offs[i + 1] - offs[i]) * 4}
+             for i, s in enumerate(SECTIONS)}
+    if ofm_offset is not None:
+        table["ofm"] = {"offset": ofm_offset, "bytes": ofm_bytes}
+    return table
+
+
+def _pack_header(total_words: int, sections: dict, meta: dict | None) -> bytes:
+    doc = {"word_bytes": 4, "endian": "little", "total_words": total_words,
+           "sections": sections, "meta": meta or {}}
+    js = json.dumps(doc, separators=(",", ":")).encode()
+    if _HEAD.size + len(js) > HEADER_BYTES:
+        raise ValueError(f"DRAM image header too large: {len(js)} bytes")
+    head = _HEAD.pack(MAGIC, VERSION, HEADER_BYTES, len(js)) + js
+    return head + b"\0" * (HEADER_BYTES - len(head))
+
+
+def read_dram_header(path: Path) -> dict:
+    """header JSON + payload 위치 ("payload_offset") 반환"""
+    with path.open("rb") as f:
+        raw = f.read(HEADER_BYTES)
+    if len(raw) < _HEAD.size:
+        raise ValueError(f"{path}: not a DRAM image (too short)")
+    magic, version, header_bytes, js_len = _HEAD.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: bad magic {magic!r}")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported DRAM image version {version}")
+    doc = json.loads(raw[_HEAD.size:_HEAD.size + js_len])
+    doc["payload_offset"] = header_bytes
+    return doc
+
+
+@profiled()
+def write_dram_bin(path: Path, words: np.ndarray, sections: dict | None = None,
+                   meta: dict | None = None) -> None:
+    """uint32 워드 배열(memory_32b 등) -> header + raw little-endian payload"""
+    words = np.ascontiguousarray(words, dtype="<u4").reshape(-1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.write(_pack_header(words.size, sections or {}, meta))
+        f.write(memoryview(words).cast("B"))
+
+
+def update_dram_sections(path: Path, sections: dict) -> dict:
+    """header의 섹션 표만 제자리 갱신 (payload는 그대로). 반환: 갱신된 header"""
+    header = read_dram_header(path)
+    header["sections"].update(sections)
+    with path.open("r+b") as f:
+        f.write(_pack_header(header["total_words"], header["sections"], header.get("meta")))
+    return header
+
+
+def open_dram_bin(path: Path, mode: str = "r") -> tuple[dict, np.memmap]:
+    """반환: (header, uint32 memmap). mode="r+" 이면 제자리 수정 가능"""
+    header = read_dram_header(path)
+    mem = np.memmap(path, dtype="<u4", mode=mode, offset=header["payload_offset"],
+                    shape=(header["total_words"],))
+    return header, mem
+
+
+def dram_section(path: Path, name: str) -> np.ndarray:
+    """섹션 하나를 uint32 memmap view로 (ofm 등 payload 밖 영역은 ValueError)"""
+    header, mem = open_dram_bin(path)
+    sec = header["sections"].get(name)
+    if sec is None:
+        raise KeyError(f"{path}: no section '{name}'")
+    start, end = sec["offset"] // 4, (sec["offset"] + sec["bytes"]) // 4
+    if end > mem.size:
+        raise ValueError(f"{path}: section '{name}' is outside the image payload")
+    return mem[start:end]
+
+
+# ------------------------------
+# 변환 (binary <-> 16b / 32b hex)
+# ------------------------------
+@profiled()
+def bin_to_hex(bin_path: Path, hex_path: Path, digits: int = 4,
+               chunk_words: int = 1 << 22) -> int:
+    """binary image -> $readmemh용 hex (digits=4: 16b 하위→상위, 8: 32b). 반환: 줄 수"""
+    _, mem = open_dram_bin(bin_path)
+    view = mem.view("<u2") if digits == 4 else mem
+    step = chunk_words * (2 if digits == 4 else 1)
+    return write_hex_words(hex_path, (view[i:i + step] for i in range(0, view.size, step)), digits)
+
+
+@profiled()
+def hex_to_bin(hex_path: Path, bin_path: Path, digits: int = 4,
+               sections: dict | None = None, meta: dict | None = None) -> int:
+    """
+    16b(digits=4) / 32b(digits=8) hex -> binary image (chunk 단위 streaming)\n
+    hex에는 섹션 정보가 없으므로 필요하면 sections로 넘긴다. 반환: 32b 워드 수
+    """
+    bin_path.parent.mkdir(parents=True, exist_ok=True)
+    n_bytes = 0
+    with bin_path.open("wb") as f:
+        f.write(b"\0" * HEADER_BYTES)          # 길이를 모르므로 header는 마지막에 기록
+        for chunk in iter_hex_words(hex_path, digits):
+            b = chunk.astype("<u2" if digits == 4 else "<u4", copy=False).tobytes()
+            f.write(b)
+            n_bytes += len(b)
+        if n_bytes % 4:
+            raise ValueError(f"{hex_path}: odd number of 16b lines ({n_bytes // 2})")
+        f.seek(0)
+        f.write(_pack_header(n_bytes // 4, sections or {}, meta))
+    return n_bytes // 4
+
+
+def _pair_u16(chunks: Iterator[np.ndarray], path: Path) -> Iterator[np.ndarray]:
+    """16b 워드 chunk -> 32b 워드 chunk (chunk 경계에 걸친 홀수 워드는 다음 chunk로)"""
+    carry = np.empty(0, dtype="<u2")
+    for chunk in chunks:
+        buf = np.concatenate([carry, chunk.astype("<u2", copy=False)])
+        even = buf.size & ~1
+        carry = buf[even:]
+        yield buf[:even].view("<u4")
+    if carry.size:
+        raise ValueError(f"{path}: odd number of 16b lines")
+
+
+def hex16_to_hex32(src: Path, dst: Path) -> int:
+    """16b hex (하위16, 상위16 순) -> 32b hex. 반환: 줄 수"""
+    return write_hex_words(dst, _pair_u16(iter_hex_words(src, 4), src))
+
+
+def hex32_to_hex16(src: Path, dst: Path) -> int:
+    """32b hex -> 16b hex (하위16, 상위16 순). 반환: 줄 수"""
+    return write_hex_words(dst, (c.astype("<u4").view("<u2") for c in iter_hex_words(src, 8)), digits=4)
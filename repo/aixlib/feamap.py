@@ -0,0 +1,128 @@
+import numpy as np
+
+from .io_hex import hex_lines_to_words, words_to_hex_lines
+
+
+WORD_CHANNELS = 4   # 32b 워드 하나 = uint8 4채널 (LSB = c0)
+
+
+def _ceil4(c: int) -> int:
+    return ((c + WORD_CHANNELS - 1) // WORD_CHANNELS) * WORD_CHANNELS
+
+
+class FeatureMap:
+    """
+    HWC feature map\n
+    - data: (H, W, Cp) ndarray, 여러 프레임이면 앞에 batch 축 (N, H, W, Cp)\n
+        uint8 : activation. Cp는 4의 배수이고 패딩 채널은 0\n
+        int32 : conv 누산 결과. 채널당 32b 워드 1개\n
+    - channels: 실제 채널 수 (<= Cp)\n
+    hex/DRAM 워드 배열과는 from_words()/to_words()로 복사 없이 변환한다.
+    hex 문자열은 파일 경계(from_hex/to_hex)에서만 사용.
+    """
+
+    __slots__ = ("data", "channels")
+
+    def __init__(self, data: np.ndarray, channels: int | None = None):
+        if data.ndim not in (3, 4):
+            raise ValueError(f"feature map must be (H, W, C) or (N, H, W, C), got shape={data.shape}")
+        if data.dtype == np.uint8 and data.shape[-1] % WORD_CHANNELS:
+            raise ValueError(f"uint8 feature map channels must be padded to multiple of 4: C={data.shape[-1]}")
+        if data.dtype not in (np.uint8, np.int32):
+            raise ValueError(f"unsupported feature map dtype: {data.dtype}")
+
+        self.data = data
+        self.channels = data.shape[-1] if channels is None else channels
+        if not 0 < self.channels <= data.shape[-1]:
+            raise ValueError(f"channels={self.channels} out of range for C={data.shape[-1]}")
+
+    # ------------------------------
+    # shape
+    # ------------------------------
+    @property
+    def height(self) -> int:
+        return self.data.shape[-3]
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[-2]
+
+    @property
+    def padded_channels(self) -> int:
+        return self.data.shape[-1]
+
+    @property
+    def frames(self) -> int | None:
+        """batch 프레임 수 (batch 축이 없으면 None)"""
+        return self.data.shape[0] if self.data.ndim == 4 else None
+
+    def frame(self, i: int) -> "FeatureMap":
+        """batch의 i번째 프레임 (view)"""
+        return FeatureMap(self.data[i], self.channels)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """(H, W, C) - C는 실제 채널 수"""
+        return (self.height, self.width, self.channels)
+
+    @property
+    def words_per_pixel(self) -> int:
+        if self.data.dtype == np.uint8:
+            return self.padded_channels // WORD_CHANNELS
+        return self.padded_channels
+
+    def __repr__(self) -> str:
+        n = "" if self.frames is None else f"N={self.frames}, "
+        return (f"FeatureMap({n}H={self.height}, W={self.width}, C={self.channels}, "
+                f"Cp={self.padded_channels}, dtype={self.data.dtype})")
+
+    # ------------------------------
+    # 생성
+    # ------------------------------
+    @classmethod
+    def zeros(cls, H: int, W: int, C: int, dtype=np.uint8) -> "FeatureMap":
+        Cp = _ceil4(C) if np.dtype(dtype) == np.uint8 else C
+        return cls(np.zeros((H, W, Cp), dtype=dtype), C)
+
+    @classmethod
+    def from_mhw(cls, arr: np.ndarray) -> "FeatureMap":
+        """(M, H, W) -> FeatureMap. uint8이면 채널을 4의 배수로 zero-padding"""
+        M, H, W = arr.shape
+        if arr.dtype == np.uint8 and M % WORD_CHANNELS:
+            fm = cls.zeros(H, W, M, dtype=np.uint8)
+            fm.data[:, :, :M] = arr.transpose(1, 2, 0)
+            return fm
+        return cls(np.ascontiguousarray(arr.transpose(1, 2, 0)), M)
+
+    @classmethod
+    def from_words(cls, words: np.ndarray, H: int, W: int, C: int, dtype=np.uint8) -> "FeatureMap":
+        """
+        32b 워드 배열(y → x → 채널 그룹 순) 위의 view\n
+        uint8: 워드당 4채널, int32: 워드당 1채널
+        """
+        dtype = np.dtype(dtype)
+        words = np.ascontiguousarray(words, dtype="<u4")
+        Cp = _ceil4(C) if dtype == np.uint8 else C
+        n_words = H * W * (Cp // WORD_CHANNELS if dtype == np.uint8 else Cp)
+        if words.size < n_words:
+            raise ValueError(f"not enough words: have={words.size} need={n_words}")
+        view = words[:n_words].view(np.uint8 if dtype == np.uint8 else "<i4")
+        return cls(view.reshape(H, W, Cp), C)
+
+    @classmethod
+    def from_hex(cls, lines: list[str], H: int, W: int, C: int, dtype=np.uint8) -> "FeatureMap":
+        return cls.from_words(hex_lines_to_words(lines), H, W, C, dtype)
+
+    # ------------------------------
+    # 변환
+    # ------------------------------
+    def to_words(self) -> np.ndarray:
+        """32b 워드 배열 (y → x → 채널 그룹 순, batch면 프레임 순으로 이어짐). 연속 메모리면 복사 없음"""
+        return np.ascontiguousarray(self.data).view("<u4").reshape(-1)
+
+    def to_hex(self) -> list[str]:
+        return words_to_hex_lines(self.to_words())
+
+    def to_mhw(self) -> np.ndarray:
+        """(C, H, W) view (batch면 (N, C, H, W)) - 실제 채널만"""
+        return np.moveaxis(self.data[..., :self.channels], -1, -3)
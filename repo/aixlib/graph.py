@@ -0,0 +1,266 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
+
+from .feamap import FeatureMap
+from .cache import LayerCache
+from .profiling import stage
+from .ops_conv import (run_conv, run_affine_from_conv, maxpool_from_affine_words,
+                       upsample_words, concat_words, run_layer_fused, conv_work_bytes)
+
+
+OPS = ("input", "conv", "affine", "maxpool", "upsample", "route", "save")
+CACHED_OPS = ("conv", "affine", "maxpool", "upsample")
+
+
+@dataclass
+class Node:
+    name: str
+    op: str
+    inputs: tuple[str, ...] = ()
+    param: str | None = None                # conv/affine: 레이어 파라미터 key
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class Graph:
+    """
+    레이어 그래프 (노드 추가 순서 = 실행 순서)\n
+    각 builder 메서드는 출력 텐서 이름(= 노드 이름)을 반환한다.
+    """
+
+    def __init__(self):
+        self.nodes: list[Node] = []
+        self._by_name: dict[str, Node] = {}
+
+    def _add(self, node: Node) -> str:
+        if node.op not in OPS:
+            raise ValueError(f"unknown op: {node.op}")
+        if node.name in self._by_name:
+            raise ValueError(f"duplicate node name: {node.name}")
+        for src in node.inputs:
+            if src not in self._by_name:
+                raise ValueError(f"{node.name}: unknown input '{src}'")
+        self.nodes.append(node)
+        self._by_name[node.name] = node
+        return node.name
+
+    def __getitem__(self, name: str) -> Node:
+        return self._by_name[name]
+
+    # ------------------------------
+    # builder
+    # ------------------------------
+    def input(self, name: str) -> str:
+        return self._add(Node(name, "input"))
+
+    def conv(self, name: str, src: str, param: str, cout: int) -> str:
+        return self._add(Node(name, "conv", (src,), param, {"cout": cout}))
+
+    def affine(self, name: str, src: str, param: str) -> str:
+        return self._add(Node(name, "affine", (src,), param))
+
+    def maxpool(self, name: str, src: str, stride: int) -> str:
+        if stride not in (1, 2):
+            raise ValueError(f"{name}: maxpool stride must be 1 or 2")
+        return self._add(Node(name, "maxpool", (src,), attrs={"stride": stride}))
+
+    def upsample(self, name: str, src: str, scale: int = 2) -> str:
+        return self._add(Node(name, "upsample", (src,), attrs={"scale": scale}))
+
+    def route(self, name: str, *srcs: str) -> str:
+        """src 1개: 이전 텐서 재사용, 2개 이상: 채널 concat"""
+        if not srcs:
+            raise ValueError(f"{name}: route needs at least one source")
+        return self._add(Node(name, "route", tuple(srcs)))
+
+    def save(self, name: str, src: str) -> str:
+        """DRAM save (그래프 출력)"""
+        return self._add(Node(name, "save", (src,)))
+
+    # ------------------------------
+    # 분석
+    # ------------------------------
+    @property
+    def outputs(self) -> list[str]:
+        return [n.name for n in self.nodes if n.op == "save"]
+
+    def consumers(self) -> dict[str, list[str]]:
+        """텐서별 소비 노드 이름 목록"""
+        users: dict[str, list[str]] = {n.name: [] for n in self.nodes}
+        for node in self.nodes:
+            for src in node.inputs:
+                users[src].append(node.name)
+        return users
+
+    def fusion_groups(self) -> dict[str, list[Node]]:
+        """
+        conv → affine (→ maxpool) 체인 중 중간 텐서의 소비자가 하나뿐인 것\n
+        반환: 체인 첫 노드(conv) 이름 -> 체인 노드 목록
+        """
+        users = self.consumers()
+        groups: dict[str, list[Node]] = {}
+        for node in self.nodes:
+            if node.op != "conv":
+                continue
+            chain = [node]
+            for op in ("affine", "maxpool"):
+                tail = users[chain[-1].name]
+                if len(tail) != 1 or self[tail[0]].op != op:
+                    break
+                chain.append(self[tail[0]])
+            if len(chain) > 1 and chain[1].param == node.param:
+                groups[node.name] = chain
+        return groups
+
+    def last_use(self) -> dict[str, int]:
+        """텐서별 마지막 소비 노드 index. 출력(save)은 끝까지 유지"""
+        last: dict[str, int] = {}
+        for i, node in enumerate(self.nodes):
+            last.setdefault(node.name, i)
+            for src in node.inputs:
+                last[src] = i
+        end = len(self.nodes)
+        for name in self.outputs:
+            last[name] = end
+        return last
+
+
+def _nbytes(fm: FeatureMap) -> int:
+    return fm.data.nbytes
+
+
+def _work_bytes(node: Node, chain: list[Node] | None, args: list[FeatureMap]) -> int:
+    """
+    노드 실행 중에만 존재하는 임시 버퍼 (live 텐서에는 안 잡힘)\n
+    conv: im2col + matmul 버퍼. fused: 여기에 int32 누산 배열, affine의 int64 임시 배열,
+    (maxpool 전) affine 결과까지. batch feature map이면 프레임 수만큼
+    """
+    if node.op != "conv":
+        return 0
+    src, M = args[0], node.attrs["cout"]
+    work = conv_work_bytes(src.height, src.width, src.padded_channels, M)
+    if chain:
+        work += src.height * src.width * M * (4 + 8)
+        if len(chain) > 2:
+            work += src.height * src.width * -(-M // 4) * 4
+    return work * (src.frames or 1)
+
+
+class GraphExecutor:
+    """
+    Graph를 순서대로 실행하면서 liveness 분석 결과에 따라
+    마지막 소비자가 끝난 중간 텐서를 즉시 해제한다.\n
+    params: 레이어 파라미터 key -> {"filt_72b": ..., "affine": ...}\n
+    cache가 주어지면 연산 노드 결과를 (연산, attr, 파라미터, 입력 내용) 해시로 재사용한다.\n
+    workers: conv 프로세스 풀 크기 (1: 직렬, 0 이하: CPU 개수)\n
+    fuse=True 이면 conv → affine (→ maxpool) 체인을 run_layer_fused 한 번으로 계산한다.\n
+    peak_bytes: live 텐서 + 실행 중인 노드의 임시 버퍼(_work_bytes, 직렬 conv 기준)의 최대값
+    """
+
+    def __init__(self, graph: Graph, params: Mapping[str, Mapping[str, Any]],
+                 log: Callable[[str], None] | None = print,
+                 cache: LayerCache | None = None, workers: int = 1, fuse: bool = True):
+        self.graph = graph
+        self.params = params
+        self.log = log
+        self.cache = cache
+        self.workers = workers
+        self.fuse = fuse
+        self.peak_bytes = 0
+        self.peak_node: str | None = None
+
+    def _node_params(self, node: Node) -> Any:
+        """노드가 사용하는 파라미터 (캐시 key용)"""
+        if node.op == "conv":
+            return self.params[node.param]["filt_72b"]
+        if node.op == "affine":
+            return self.params[node.param]["affine"]
+        return None
+
+    def _eval_cached(self, node: Node, args: list[FeatureMap]) -> FeatureMap:
+        if self.cache is None or node.op not in CACHED_OPS:
+            return self._eval(node, args)
+        key = self.cache.key(node.op, node.attrs, self._node_params(node), args)
+        out = self.cache.get(key)
+        if out is None:
+            out = self._eval(node, args)
+            self.cache.put(key, out)
+        return out
+
+    def _eval_fused(self, chain: list[Node], args: list[FeatureMap]) -> FeatureMap:
+        conv, affine = chain[0], chain[1]
+        stride = chain[2].attrs["stride"] if len(chain) > 2 else 0
+        p = self.params[conv.param]
+        if self.cache is None:
+            return run_layer_fused(args[0], p["filt_72b"], p["affine"], conv.attrs["cout"],
+                                   stride, workers=self.workers)
+        key = self.cache.key("fused", [(n.op, n.attrs, self._node_params(n)) for n in chain], args)
+        out = self.cache.get(key)
+        if out is None:
+            out = run_layer_fused(args[0], p["filt_72b"], p["affine"], conv.attrs["cout"],
+                                  stride, workers=self.workers)
+            self.cache.put(key, out)
+        return out
+
+    def _eval(self, node: Node, args: list[FeatureMap]) -> FeatureMap:
+        if node.op == "conv":
+            return run_conv(args[0], self.params[node.param]["filt_72b"], node.attrs["cout"],
+                            workers=self.workers)
+        if node.op == "affine":
+            return run_affine_from_conv(args[0], self.params[node.param]["affine"])
+        if node.op == "maxpool":
+            return maxpool_from_affine_words(args[0], stride=node.attrs["stride"])
+        if node.op == "upsample":
+            s = node.attrs["scale"]
+            return upsample_words(args[0], s, s)
+        if node.op == "route":
+            out = args[0]
+            for fm in args[1:]:
+                out = concat_words(out, fm)
+            return out
+        if node.op == "save":
+            return args[0]
+        raise ValueError(f"{node.name}: cannot evaluate op '{node.op}'")
+
+    def run(self, inputs: Mapping[str, FeatureMap]) -> dict[str, FeatureMap]:
+        """반환: save 노드 이름 -> FeatureMap (그래프 순서)"""
+        last = self.graph.last_use()
+        groups = self.graph.fusion_groups() if self.fuse else {}
+        fused: set[str] = set()             # 체인 안에서 이미 계산된 노드
+        live: dict[str, FeatureMap] = {}
+        self.peak_bytes = 0
+
+        for i, node in enumerate(self.graph.nodes):
+            work = 0
+            if node.name in fused:
+                pass
+            elif node.op == "input":
+                if node.name not in inputs:
+                    raise KeyError(f"missing graph input '{node.name}'")
+                live[node.name] = inputs[node.name]
+            else:
+                if self.log and node.op == "conv":
+                    src = live[node.inputs[0]]
+                    self.log(f"[{node.param}] width={src.width} height={src.height} "
+                             f"cin={src.padded_channels} cout={node.attrs['cout']}")
+                args = [live[s] for s in node.inputs]
+                chain = groups.get(node.name)
+                work = _work_bytes(node, chain, args)
+                if chain:
+                    # 중간 텐서(conv/affine 결과)는 만들지 않고 체인 마지막 노드 이름으로 저장
+                    with stage("+".join(n.name for n in chain), op="fused", layer=node.param):
+                        live[chain[-1].name] = self._eval_fused(chain, args)
+                    fused.update(n.name for n in chain[1:])
+                else:
+                    with stage(node.name, op=node.op, layer=node.param):
+                        live[node.name] = self._eval_cached(node, args)
+
+            # 현재 live 크기 (같은 배열을 공유하는 alias는 한 번만) + 노드 실행 중 임시 버퍼
+            cur = sum(_nbytes(fm) for fm in {id(fm): fm for fm in live.values()}.values()) + work
+            if cur > self.peak_bytes:
+                self.peak_bytes, self.peak_node = cur, node.name
+
+            # 마지막 소비자가 끝난 텐서 해제
+            for name in [n for n in live if last[n] <= i]:
+                del live[name]
+
+        return {name: live[name] for name in self.graph.outputs}
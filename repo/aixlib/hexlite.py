@@ -0,0 +1,158 @@
+from pathlib import Path
+from typing import Sequence
+
+
+# ------------------------------
+# numpy 없이 hex 텍스트만 다루는 경량 경로
+#   이미 만들어진 hex를 16b로 나누거나, weight / affine을 패킹하거나, memory 이미지로 이어붙이는 일은
+#   값 연산이 필요 없으므로 줄 단위 bytes 처리로 끝낸다 (numpy / profiling import 비용 없이 시작).
+#   출력은 io_hex.write_hex_words, packers와 같은 형식
+#   (packers / memory_builder_monolayer를 일부러 다시 구현한 것. 결과가 같은지는 tests/test_hexlite.py)
+# ------------------------------
+SECTION_ALIGN = 16     # 섹션 시작을 16줄(32b) 단위로 정렬
+KERNEL_TAPS = 9        # packers.KERNEL_TAPS
+TOUT = 4               # packers.TOUT
+
+_HEX_DIGITS = b"0123456789abcdef"
+_ZERO32 = b"00000000"
+
+
+def align_up(n: int, align: int = SECTION_ALIGN) -> int:
+    """align의 배수로 올림 (기본: 섹션 뒤 '00000000' 패딩 16줄). memory / layout / params 공용"""
+    return n + (-n) % align
+
+
+def _normalize_lines(raw: list[bytes], digits: int, path: Path) -> list[bytes]:
+    """느린 경로: hex 문자만으로 된 digits자리 이하가 아닌 줄은 int(s, 16)의 하위 digits자리로"""
+    mask = (1 << (4 * digits)) - 1
+    out = []
+    for i, l in enumerate(raw, 1):
+        l = l.strip()
+        if not l:
+            continue
+        if l.translate(None, _HEX_DIGITS) or len(l) > digits:
+            try:
+                l = b"%0*x" % (digits, int(l, 16) & mask)
+            except ValueError:
+                raise ValueError(f"{path}: invalid hex at line {i}: {l.decode('utf-8', errors='replace')!r}") from None
+        out.append(l if len(l) == digits else l.rjust(digits, b"0"))
+    return out
+
+
+def read_hex_lines(path: Path, digits: int = 8) -> list[bytes]:
+    """
+    hex 파일 -> 소문자, digits자리로 맞춘 줄 리스트 (bytes, 줄바꿈 제외)\n
+    빈 줄은 무시, 자리수가 부족한 줄은 상위 0으로 채움.
+    '0x' 접두어 / digits보다 긴 줄은 하위 digits자리로 (io_hex.decode_hex_words와 같음). 잘못된 줄이면 ValueError
+    """
+    if digits not in (4, 8):
+        raise ValueError(f"digits must be 4 or 8, got {digits}")
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"hex not found: {path}")
+    raw = path.read_bytes().lower().splitlines()
+    lines = [l.strip() for l in raw]
+    lines = [l for l in lines if l]
+    if b"".join(lines).translate(None, _HEX_DIGITS) or any(len(l) > digits for l in lines):
+        return _normalize_lines(raw, digits, path)
+    return [l if len(l) == digits else l.rjust(digits, b"0") for l in lines]
+
+
+def _write_lines(path: Path, lines: Sequence[bytes]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"".join(l + b"\n" for l in lines))
+    return len(lines)
+
+
+def _split16(lines32: Sequence[bytes]) -> list[bytes]:
+    """32b 줄 -> 16b 줄 (하위16, 상위16 순)"""
+    out = [b""] * (2 * len(lines32))
+    out[0::2] = [l[4:] for l in lines32]
+    out[1::2] = [l[:4] for l in lines32]
+    return out
+
+
+def _take(lines: list[bytes], need: int, path: Path, what: str) -> list[bytes]:
+    """앞 need줄 (verify_inputs와 같은 길이 검사)"""
+    if len(lines) < need:
+        raise ValueError(f"{path}: {what} data not enough: have={len(lines)} need={need}")
+    return lines[:need]
+
+
+# ------------------------------
+# 변환
+# ------------------------------
+def split_hex32(src: Path, dst: Path) -> int:
+    """32b hex -> 16b hex (dram_image.hex32_to_hex16과 같은 결과). 반환: 줄 수"""
+    return _write_lines(dst, _split16(read_hex_lines(src, 8)))
+
+
+def join_hex16(src: Path, dst: Path) -> int:
+    """16b hex (하위16, 상위16 순) -> 32b hex. 반환: 줄 수"""
+    lines = read_hex_lines(src, 4)
+    if len(lines) % 2:
+        raise ValueError(f"{src}: odd number of 16b lines")
+    return _write_lines(dst, [hi + lo for lo, hi in zip(lines[0::2], lines[1::2])])
+
+
+# ------------------------------
+# 파라미터 패킹
+# ------------------------------
+def pack_weight_hex(src: Path, dst: Path, cin: int, cout: int) -> int:
+    """
+    weight hex (한 줄에 weight 하나, 하위 1바이트 사용) -> 32b 패킹 weight hex
+    (packers.pack_filter_32b와 같은 결과: cout 4개씩 같은 (cin, k) weight를 한 워드로, LSB = 그룹 첫 채널)\n
+    반환: 줄 수
+    """
+    if cout % TOUT:
+        raise ValueError(f"cout must be multiple of {TOUT}: cout={cout}")
+    taps = cin * KERNEL_TAPS
+    lsb = [l[-2:] for l in _take(read_hex_lines(src, 8), cout * taps, src, "FILTER")]
+    out: list[bytes] = []
+    for m in range(0, cout, TOUT):
+        w0, w1, w2, w3 = (lsb[(m + i) * taps:(m + i + 1) * taps] for i in range(TOUT))
+        out += [b3 + b2 + b1 + b0 for b0, b1, b2, b3 in zip(w0, w1, w2, w3)]
+    return _write_lines(dst, out)
+
+
+def pack_affine_hex(bias: Path, scale: Path, dst: Path, cout: int) -> int:
+    """bias cout줄 + scale cout줄 -> affine hex (packers.pack_affine과 같은 결과). 반환: 줄 수"""
+    return _write_lines(dst, _take(read_hex_lines(bias, 8), cout, bias, "BIAS")
+                        + _take(read_hex_lines(scale, 8), cout, scale, "SCALE"))
+
+
+# ------------------------------
+# memory 이미지
+# ------------------------------
+def build_memory_hex(ifm: Path, filt: Path, bias: Path, scale: Path,
+                     out_16b: Path | None = None, out_32b: Path | None = None,
+                     cout: int | None = None) -> dict:
+    """
+    이미 만들어진 32b hex(IFM / 32b 패킹 FILTER / BIAS / SCALE)를 memory_builder_monolayer와 같은
+    배치(섹션마다 16줄 정렬, 패딩 0)로 이어붙여 기록\n
+    cout을 주면 BIAS / SCALE은 앞 cout줄만 사용 (verify_inputs와 같음, 원본 param 파일을 그대로 넘길 때)\n
+    반환: memory_builder_monolayer와 같은 오프셋 키 (배열 제외)
+    """
+    mem: list[bytes] = []
+    offsets = []
+    for path, what in ((ifm, None), (filt, None), (bias, "BIAS"), (scale, "SCALE")):
+        sec = read_hex_lines(path, 8)
+        if what is not None and cout is not None:
+            sec = _take(sec, cout, path, what)
+        offsets.append(len(mem))
+        mem += sec
+        mem += [_ZERO32] * (align_up(len(sec)) - len(sec))
+
+    if out_32b is not None:
+        _write_lines(out_32b, mem)
+    if out_16b is not None:
+        _write_lines(out_16b, _split16(mem))
+    start_ifm, start_flt, start_bias, start_scale = offsets
+    return {
+        "ifm_offset": start_ifm,
+        "filter_offset": start_flt,
+        "bias_offset": start_bias,
+        "scale_offset": start_scale,
+        "total_lines": len(mem),
+        "total_lines_16b": 2 * len(mem),
+    }
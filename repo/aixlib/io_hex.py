@@ -1,24 +1,255 @@
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List
 
+import numpy as np
 
+from .profiling import profiled
 
-def read_32b_hex_lines(path: Path) -> List[str]:
-    lines: List[str] = []
-    with path.open("r", encoding="utf-8") as f:
-        for raw in f:
-            s = raw.strip()
-            if not s:
+
+# ------------------------------
+# bulk hex codec
+#   파일 전체(또는 chunk)를 bytes로 읽어 nibble LUT로 한 번에 decode/encode
+#   한 줄 = 워드 하나 (digits=8: 32b, digits=4: 16b)
+# ------------------------------
+_HEX_INVALID = 0xFF
+
+_HEX_LUT = np.full(256, _HEX_INVALID, dtype=np.uint8)
+_HEX_LUT[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_LUT[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_LUT[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+_HEX_CHARS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+_WS = np.zeros(256, dtype=bool)
+_WS[np.frombuffer(b" \t\r\v\f", dtype=np.uint8)] = True
+
+_NL = 0x0A
+
+_GATHER_LINES = 1 << 18     # 불규칙 파일 decode시 index 배열 크기 제한
+
+DEFAULT_CHUNK_BYTES = 16 << 20
+DEFAULT_CHUNK_WORDS = 1 << 22
+
+
+def _word_dtype(digits: int) -> np.dtype:
+    if digits == 8:
+        return np.dtype(np.uint32)
+    if digits == 4:
+        return np.dtype(np.uint16)
+    raise ValueError(f"digits must be 4 or 8, got {digits}")
+
+
+def _line_bounds(raw: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """줄 단위 [start, end) (공백 strip 후)"""
+    nl = np.flatnonzero(raw == _NL)
+    starts = np.concatenate(([0], nl + 1))
+    ends = np.concatenate((nl, [raw.size]))
+
+    # 앞/뒤 공백 제거 (\r\n 포함). 보통 1~2회 반복
+    while True:
+        m = (ends > starts) & _WS[raw[np.maximum(ends - 1, 0)]]
+        if not m.any():
+            break
+        ends = ends - m
+    while True:
+        m = (ends > starts) & _WS[raw[np.minimum(starts, raw.size - 1)]]
+        if not m.any():
+            break
+        starts = starts + m
+    return starts, ends
+
+
+def _raise_bad_line(raw: np.ndarray, start: int, end: int, lineno: int, path: Any, reason: str) -> None:
+    text = raw[start:end].tobytes().decode("utf-8", errors="replace")
+    where = f"{path}:{lineno}" if path is not None else f"line {lineno}"
+    raise ValueError(f"{where}: {reason}: {text!r}")
+
+
+def decode_hex_words(buf: bytes, digits: int = 8, path: Any = None, first_line: int = 1) -> np.ndarray:
+    """
+    hex 텍스트(bytes) -> uint32(digits=8) / uint16(digits=4) 배열\n
+    빈 줄은 무시, 자리수가 부족한 줄은 상위 0으로 간주.\n
+    LUT로 못 읽는 줄('0x' 접두어, digits보다 긴 줄 등)은 기존 reader처럼 int(s, 16)으로 읽고
+    하위 digits자리(4*digits bit)만 쓴다. int(s, 16)도 실패하면 ValueError (줄 번호 포함)
+    """
+    dtype = _word_dtype(digits)
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    if raw.size == 0:
+        return np.empty(0, dtype=dtype)
+
+    slow = ()
+    nib = _decode_fixed_width(raw, digits)
+    if nib is None or (nib == _HEX_INVALID).any():
+        # 일반 경로 (빈 줄/공백/짧은 줄 허용)
+        lines = _nibbles_by_line(raw, digits)
+        if lines is None:
+            return np.empty(0, dtype=dtype)
+        nib, starts, ends = lines
+        slow = np.flatnonzero((nib == _HEX_INVALID).any(axis=1))
+        nib[slow] = 0
+
+    acc = np.zeros(nib.shape[0], dtype=np.uint32)
+    for d in range(digits):
+        acc <<= 4
+        acc |= nib[:, d]
+
+    # 느린 경로: 줄마다 int(s, 16)
+    mask = (1 << (4 * digits)) - 1
+    for i in slow:
+        text = raw[starts[i]:ends[i]].tobytes().decode("utf-8", errors="replace")
+        try:
+            acc[i] = int(text, 16) & mask
+        except ValueError:
+            _raise_bad_line(raw, starts[i], ends[i], first_line + int(np.count_nonzero(raw[:starts[i]] == _NL)),
+                            path, "invalid hex")
+    return acc.astype(dtype, copy=False)
+
+
+def _decode_fixed_width(raw: np.ndarray, digits: int) -> np.ndarray | None:
+    """
+    모든 줄이 정확히 digits자리 + '\n' (또는 '\r\n')인 파일이면 (n, digits) nibble 배열,
+    아니면 None
+    """
+    for eol in (b"\n", b"\r\n"):
+        stride = digits + len(eol)
+        size = raw.size
+        if size % stride:
+            if (size + len(eol)) % stride:       # 마지막 줄 개행 누락 허용
+                continue
+            size += len(eol)
+        n = size // stride
+        full = raw[:(n - 1) * stride].reshape(n - 1, stride) if n > 1 else raw[:0].reshape(0, stride)
+        eol_arr = np.frombuffer(eol, dtype=np.uint8)
+        if not (full[:, digits:] == eol_arr).all():
+            continue
+        last = raw[(n - 1) * stride:]
+        if last.size < digits or not (last[digits:] == eol_arr[:last.size - digits]).all():
+            continue
+        nib = np.empty((n, digits), dtype=np.uint8)
+        nib[:n - 1] = _HEX_LUT[full[:, :digits]]
+        nib[n - 1] = _HEX_LUT[last[:digits]]
+        return nib
+    return None
+
+
+def _nibbles_by_line(raw: np.ndarray, digits: int) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    일반 경로: 줄 경계를 찾아 오른쪽 정렬로 nibble 배열 구성\n
+    digits보다 긴 줄은 전체를 _HEX_INVALID로 표시 (느린 경로 대상)\n
+    반환: (nib, 빈 줄 제외 줄 시작, 끝). 빈 파일이면 None
+    """
+    starts, ends = _line_bounds(raw)
+    lengths = ends - starts
+    keep = np.flatnonzero(lengths > 0)
+    starts, ends, lengths = starts[keep], ends[keep], lengths[keep]
+    n = starts.size
+    if n == 0:
+        return None
+
+    nib = np.empty((n, digits), dtype=np.uint8)
+    cols = np.arange(digits)
+    for s in range(0, n, _GATHER_LINES):
+        e = min(s + _GATHER_LINES, n)
+        idx = ends[s:e, None] - digits + cols          # 오른쪽 정렬
+        valid = idx >= starts[s:e, None]
+        blk = _HEX_LUT[raw[np.where(valid, idx, 0)]]
+        blk[~valid] = 0
+        nib[s:e] = blk
+    nib[lengths > digits] = _HEX_INVALID
+
+    return nib, starts, ends
+
+
+def iter_hex_words(path: Path, digits: int = 8, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[np.ndarray]:
+    """
+    hex 파일을 chunk 단위로 decode (메모리보다 큰 파일용)\n
+    각 chunk는 줄 경계에서 잘리며, 오류 메시지의 줄 번호는 파일 기준
+    """
+    lineno = 1
+    tail = b""
+    with path.open("rb") as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                tail = block
                 continue
-            int(s, 16)  # ValueError 유발 용도
-            lines.append(s.lower())
-    return lines
+            body, tail = block[:cut], block[cut:]
+            yield decode_hex_words(body, digits, path, lineno)
+            lineno += body.count(b"\n")
+    if tail:
+        yield decode_hex_words(tail, digits, path, lineno)
+
+
+@profiled()
+def read_hex_words(path: Path, digits: int = 8) -> np.ndarray:
+    """hex 파일 전체 -> uint32(digits=8) / uint16(digits=4) 배열"""
+    return decode_hex_words(path.read_bytes(), digits, path)
+
+
+def hex_lines_to_words(lines: Iterable[str], digits: int = 8) -> np.ndarray:
+    """hex 문자열 리스트 -> 워드 배열"""
+    return decode_hex_words("\n".join(lines).encode("ascii", errors="replace"), digits)
+
+
+def format_hex_words(words: np.ndarray, digits: int = 8) -> bytes:
+    """워드 배열 -> '%0{digits}x\\n' 텍스트 버퍼"""
+    w = np.asarray(words).reshape(-1).astype(np.uint32, copy=False)
+    if digits == 4:
+        w = w & 0xFFFF
+    _word_dtype(digits)
 
+    out = np.empty((w.size, digits + 1), dtype=np.uint8)
+    for d in range(digits):
+        out[:, d] = _HEX_CHARS[(w >> (4 * (digits - 1 - d))) & 0xF]
+    out[:, digits] = _NL
+    return out.tobytes()
 
 
+def words_to_hex_lines(words: np.ndarray, digits: int = 8) -> List[str]:
+    return format_hex_words(words, digits).decode("ascii").split()
+
+
+@profiled()
+def write_hex_words(out_path: Path, words: np.ndarray | Iterable[np.ndarray], digits: int = 8,
+                    chunk_words: int = DEFAULT_CHUNK_WORDS) -> int:
+    """
+    워드 배열(또는 배열 iterable, streaming)을 hex 파일로 기록\n
+    chunk_words 단위로 포맷 버퍼를 만들어 한 번에 write. 반환: 기록한 줄 수
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    chunks = [words] if isinstance(words, np.ndarray) else words
+
+    n = 0
+    with out_path.open("wb") as fw:
+        for arr in chunks:
+            arr = np.asarray(arr).reshape(-1)
+            for s in range(0, arr.size, chunk_words):
+                blk = arr[s:s + chunk_words]
+                fw.write(format_hex_words(blk, digits))
+                n += blk.size
+    return n
+
+
+# ------------------------------
+# 문자열 리스트 API
+# ------------------------------
+@profiled()
+def read_32b_hex_lines(path: Path) -> List[str]:
+    """
+    32b hex 파일 -> 8자리 소문자 hex 문자열 리스트 (decode_hex_words 규칙)\n
+    '0x' 접두어 / 8자리보다 긴 줄도 읽지만 하위 32b로 정규화된다 (원문 문자열은 보존하지 않음)
+    """
+    return words_to_hex_lines(read_hex_words(path, 8), 8)
+
+
+
+@profiled()
 def write_hex_lines(out_path: Path, hex: list[str]) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     with out_path.open("w", encoding="utf-8") as fw:
-        for s in hex:
-            fw.write(s + "\n")
\ No newline at end of file
+        fw.write("".join(s + "\n" for s in hex))
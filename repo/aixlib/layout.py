@@ -0,0 +1,252 @@
+import re
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+from .hexlite import align_up
+from .memory import _as_words
+from .profiling import profiled
+from .yolo import ConvLayer, YOLO_DRAM_OFM_OFFSET
+
+
+SECTIONS = ("ifm", "filter", "bias", "scale")
+
+
+@dataclass(frozen=True)
+class LayoutConfig:
+    """
+    DRAM 배치 / DMA 모델 설정 (byte 단위)\n
+    section_align : 섹션 시작 정렬 (기본 64 = 32b 16줄, memory_builder_monolayer와 동일)\n
+    block_align   : 섹션 안 레이어별 sub-block 정렬 (기본 4 = 빈틈 없이 이어 붙임)\n
+    burst_beats   : 엔진이 한 번에 요청하는 워드 수 (yolo_engine.v num_trans = 16)\n
+    max_burst_beats : axi_dma_rd.v FIXED_BURST_SIZE (요청 하나를 이 길이 burst로 나눔)\n
+    page_bytes    : AXI burst가 넘으면 안 되는 경계 (4KB)
+    """
+    section_align: int = 64
+    block_align: int = 4
+    burst_beats: int = 16
+    max_burst_beats: int = 256
+    beat_bytes: int = 4
+    page_bytes: int = 4096
+    ofm_offset: int = YOLO_DRAM_OFM_OFFSET
+
+    def __post_init__(self):
+        for name in ("section_align", "block_align", "page_bytes"):
+            v = getattr(self, name)
+            if v < 4 or v & (v - 1):
+                raise ValueError(f"{name} must be a power of two >= 4: {v}")
+        if self.burst_beats <= 0 or self.max_burst_beats <= 0:
+            raise ValueError(f"bad burst length: {self.burst_beats}/{self.max_burst_beats}")
+
+    @property
+    def burst_bytes(self) -> int:
+        return self.burst_beats * self.beat_bytes
+
+
+@dataclass
+class Block:
+    section: str
+    layer: str | None       # 섹션 전체면 None
+    offset: int             # byte
+    nbytes: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.nbytes
+
+
+@dataclass
+class DramLayout:
+    config: LayoutConfig
+    layers: list[ConvLayer]
+    sections: dict[str, Block] = field(default_factory=dict)
+    blocks: dict[tuple[str, str], Block] = field(default_factory=dict)     # (section, layer)
+    ofm: Block | None = None
+
+    @property
+    def total_bytes(self) -> int:
+        """이미지(IFM ~ SCALE) 크기"""
+        return self.sections["scale"].end
+
+    def block(self, section: str, layer: str) -> Block:
+        return self.blocks[(section, layer)]
+
+    def info(self) -> dict:
+        """memory_builder_monolayer 반환값과 같은 키의 32b 오프셋"""
+        out = {f"{s}_offset": self.sections[s].offset // 4 for s in SECTIONS}
+        out["total_lines"] = self.total_bytes // 4
+        return out
+
+
+def layer_bytes(layer: ConvLayer) -> dict[str, int]:
+    """레이어 하나의 섹션별 크기 (하드웨어 shape 기준)"""
+    return {"filter": layer.cout * layer.cin * 9, "bias": layer.cout * 4, "scale": layer.cout * 4}
+
+
+def plan_layout(layers: Sequence[ConvLayer], ifm_bytes: int, config: LayoutConfig | None = None,
+                ofm_bytes: int = 0) -> DramLayout:
+    """
+    IFM -> FILTER -> BIAS -> SCALE 순서로 섹션과 레이어별 sub-block 배치\n
+    config=None(기본 설정)이면 memory_builder_monolayer와 같은 오프셋 (filter 262144, bias 6068800, ...)
+    """
+    config = config or LayoutConfig()
+    plan = DramLayout(config, list(layers))
+    pos = 0
+    for section in SECTIONS:
+        pos = align_up(pos, config.section_align)
+        start = pos
+        if section == "ifm":
+            pos += ifm_bytes
+        else:
+            for layer in layers:
+                pos = align_up(pos, config.block_align)
+                size = layer_bytes(layer)[section]
+                plan.blocks[(section, layer.name)] = Block(section, layer.name, pos, size)
+                pos += size
+        plan.sections[section] = Block(section, None, start, align_up(pos, config.section_align) - start)
+
+    if config.ofm_offset < plan.total_bytes:
+        raise ValueError(f"OFM offset {config.ofm_offset} overlaps the image (ends at {plan.total_bytes})")
+    plan.ofm = Block("ofm", None, config.ofm_offset, ofm_bytes)
+    return plan
+
+
+# ------------------------------
+# DMA burst 모델
+# ------------------------------
+def dma_bursts(offset: int, nbytes: int, config: LayoutConfig | None = None) -> int:
+    """
+    offset부터 nbytes를 읽는 AXI burst 수 (config=None: 기본 LayoutConfig)\n
+    엔진은 burst_beats 워드씩 요청하고, axi_dma_rd는 요청을 max_burst_beats 이하 burst로 나눈다.
+    burst가 page 경계를 넘으면 (AXI 규칙상) 둘로 나뉜다고 센다.
+    """
+    config = config or LayoutConfig()
+    if nbytes <= 0:
+        return 0
+    req = min(config.burst_beats, config.max_burst_beats) * config.beat_bytes
+    starts = offset + np.arange(0, nbytes, req, dtype=np.int64)
+    ends = np.minimum(starts + req, offset + nbytes) - 1
+    return int(starts.size + (starts // config.page_bytes != ends // config.page_bytes).sum())
+
+
+def dma_report(plan: DramLayout) -> list[dict]:
+    """레이어별 filter / bias / scale fetch의 burst 수 (min: 정렬됐을 때 최소값)"""
+    cfg = plan.config
+    rows = []
+    for layer in plan.layers:
+        row = {"layer": layer.name, "param": layer.param}
+        for section in ("filter", "bias", "scale"):
+            b = plan.block(section, layer.name)
+            row[section] = {
+                "offset": b.offset,
+                "bytes": b.nbytes,
+                "bursts": dma_bursts(b.offset, b.nbytes, cfg),
+                "min_bursts": -(-b.nbytes // cfg.burst_bytes),
+                "aligned": b.offset % cfg.burst_bytes == 0,
+            }
+        rows.append(row)
+    return rows
+
+
+# ------------------------------
+# 이미지 / 헤더 생성
+# ------------------------------
+@profiled()
+def build_image(plan: DramLayout, ifm: np.ndarray | list[str], filters: Sequence[np.ndarray],
+                biases: Sequence[np.ndarray], scales: Sequence[np.ndarray]) -> dict:
+    """
+    plan 위치에 각 sub-block을 복사한 DRAM 이미지\n
+    filters / biases / scales: plan.layers 순서의 레이어별 32b 워드 배열\n
+    반환 형식은 memory_builder_monolayer와 같다 (memory, memory_32b, *_offset, total_lines)
+    """
+    mem32 = np.zeros(plan.total_bytes // 4, dtype="<u4")
+    ifm = _as_words(ifm)
+    if ifm.size * 4 > plan.sections["ifm"].nbytes:
+        raise ValueError(f"IFM larger than planned: {ifm.size * 4} > {plan.sections['ifm'].nbytes}")
+    mem32[:ifm.size] = ifm
+    for section, arrays in (("filter", filters), ("bias", biases), ("scale", scales)):
+        if len(arrays) != len(plan.layers):
+            raise ValueError(f"{section}: expected {len(plan.layers)} layers, got {len(arrays)}")
+        for layer, arr in zip(plan.layers, arrays):
+            b = plan.block(section, layer.name)
+            words = _as_words(arr)
+            if words.size * 4 != b.nbytes:
+                raise ValueError(f"{section} {layer.name}: {words.size * 4} bytes, planned {b.nbytes}")
+            mem32[b.offset // 4:b.end // 4] = words
+
+    info = plan.info()
+    info["memory_32b"] = mem32
+    info["memory"] = mem32.view("<u2")
+    info["total_lines_16b"] = mem32.size * 2
+    return info
+
+
+def render_layout_vh(plan: DramLayout, expect_lines: int | None = None) -> str:
+    """섹션 / 레이어별 sub-block 오프셋 Verilog define"""
+    cfg = plan.config
+    out = ["`ifndef __YOLO_DRAM_LAYOUT_VH__", "`define __YOLO_DRAM_LAYOUT_VH__", "",
+           f"// generated by plan_dram_layout.py (section_align={cfg.section_align}, "
+           f"block_align={cfg.block_align}, burst={cfg.burst_beats}x{cfg.beat_bytes}B, "
+           f"page={cfg.page_bytes})", ""]
+    for s in SECTIONS:
+        out.append(f"`define {f'YOLO_DRAM_{s.upper()}_OFFSET':<32}{plan.sections[s].offset}")
+    out.append(f"`define {'YOLO_DRAM_OFM_OFFSET':<32}{plan.ofm.offset}")
+    if expect_lines is not None:
+        out.append(f"`define {'YOLO_EXPECT_LINE':<32}{expect_lines}")
+    out.append("")
+    for layer in plan.layers:
+        for s in ("filter", "bias", "scale"):
+            b = plan.block(s, layer.name)
+            out.append(f"`define {f'{layer.name}_{s.upper()}_OFFSET':<32}{b.offset}")
+            out.append(f"`define {f'{layer.name}_{s.upper()}_BYTES':<32}{b.nbytes}")
+        out.append("")
+    out += ["`endif", ""]
+    return "\n".join(out)
+
+
+_CFG_DEFINE = re.compile(r"^(`define\s+YOLO_DRAM_(IFM|FILTER|BIAS|SCALE|OFM)_OFFSET\s+)(\d+)", re.M)
+_CFG_EXPECT = re.compile(r"^(`define\s+YOLO_EXPECT_LINE\s+)(\d+)", re.M)
+
+
+def patch_layer_cfg(text: str, plan: DramLayout, expect_lines: int | None = None) -> str:
+    """yolo_layer_cfg.vh의 YOLO_DRAM_*_OFFSET (와 YOLO_EXPECT_LINE) 값만 교체"""
+    offsets = {s.upper(): plan.sections[s].offset for s in SECTIONS}
+    offsets["OFM"] = plan.ofm.offset
+    text, n = _CFG_DEFINE.subn(lambda m: f"{m[1]}{offsets[m[2]]}", text)
+    if n == 0:
+        raise ValueError("no YOLO_DRAM_*_OFFSET define found")
+    if expect_lines is not None:
+        text = _CFG_EXPECT.sub(lambda m: f"{m[1]}{expect_lines}", text)
+    return text
+
+
+def base_addr_config(plan: DramLayout) -> np.ndarray:
+    """
+    firmware base_addr_config[2*NUM_CONV_LAYER] 값 (uint32)\n
+    [2*i] = conv 레이어 i filter 주소, [2*i+1] = bias 주소.
+    scale은 bias + (SCALE_OFFSET - BIAS_OFFSET) (레이어별 bias / scale block 크기가 같으므로)
+    """
+    return np.array([plan.block(s, layer.name).offset for layer in plan.layers for s in ("filter", "bias")],
+                    dtype="<u4")
+
+
+def render_base_addr_c(plan: DramLayout) -> str:
+    table = base_addr_config(plan)
+    delta = plan.sections["scale"].offset - plan.sections["bias"].offset
+    out = ["// generated by plan_dram_layout.py",
+           "// [2*i] = filter base, [2*i+1] = bias base (scale = bias + SCALE_BIAS_DELTA)",
+           f"#define NUM_CONV_LAYER {len(plan.layers)}",
+           f"#define SCALE_BIAS_DELTA {delta}",
+           "int base_addr_config[2*NUM_CONV_LAYER] = {"]
+    for i, layer in enumerate(plan.layers):
+        sep = "," if i + 1 < len(plan.layers) else ""
+        out.append(f"    {table[2 * i]:>10}, {table[2 * i + 1]:>10}{sep}    // {layer.name} ({layer.param})")
+    out += ["};", ""]
+    return "\n".join(out)
+
+
+def cfg_records(plan: DramLayout) -> bytes:
+    """MODE_STORE_CFG UART payload: (index, value) little-endian 32b 쌍 2*NUM_CONV_LAYER개"""
+    table = base_addr_config(plan)
+    return np.stack([np.arange(table.size, dtype="<u4"), table], axis=1).astype("<u4").tobytes()
@@ -1,83 +1,75 @@
-from dataclasses import dataclass
-from typing import Any, List, Tuple
-from .utils import TCParams
+from pathlib import Path
+from typing import List
 
+import numpy as np
 
+from .io_hex import hex_lines_to_words
+from .hexlite import align_up
+from .profiling import profiled
 
-def _pad_to_mult16(lines: List[str]) -> Tuple[List[str], int]:
-    """16의 배수가 될 때까지 '00000000'으로 패딩. 반환: (패딩후라인, 추가패딩수)"""
-    pad_needed = (-len(lines)) % 16
-    if pad_needed:
-        lines = lines + ["00000000"] * pad_needed
-    return lines, pad_needed
 
+def _as_words(src: list[str] | np.ndarray) -> np.ndarray:
+    """hex 문자열 리스트 또는 워드 배열 -> uint32 배열"""
+    if isinstance(src, np.ndarray):
+        return src.reshape(-1).astype("<u4", copy=False)
+    return hex_lines_to_words(src)
 
-def _split32_to_16_lines(lines32: List[str]) -> List[str]:
-    """
-    32b 문자열 리스트를 16b 문자열 리스트로 분할.
-    hi_lo=True : [상위16, 하위16]
-    hi_lo=False: [하위16, 상위16]
-    모든 결과는 4자리 소문자 hex로 zero-padding.
-    """
-    out16: List[str] = []
-    for s in lines32:
-        v = int(s, 16) & 0xFFFFFFFF
-        hi = (v >> 16) & 0xFFFF
-        lo = v & 0xFFFF
-        
-        out16.append(f"{lo:04x}")
-        out16.append(f"{hi:04x}")
-        
-    return out16
 
 
-
-def memory_builder_monolayer(ifm_src: list[str], filt_src: list[str], bias_src: list[str], scale_src: list[str]) -> dict:
+@profiled()
+def memory_builder_monolayer(ifm_src: list[str] | np.ndarray, filt_src: list[str] | np.ndarray,
+                             bias_src: list[str] | np.ndarray, scale_src: list[str] | np.ndarray,
+                             mmap_path: Path | None = None) -> dict:
     """
     단일 레이어 연산을 위한 memory builder\n
     섹션 순서: IFM -> FILTER -> BIAS -> SCALE\n
+    섹션 오프셋을 먼저 계산하고, uint32 버퍼 하나를 할당해 각 섹션을 제자리에 복사한다.
+    mmap_path를 주면 버퍼를 np.memmap(raw little-endian)으로 만든다.\n
     반환:\n
       {
-        "memory": all16_lines,          # 16b 라인(하위16→상위16 순) 리스트
+        "memory": mem16,                # 16b 워드 배열(하위16→상위16 순), memory_32b의 view
+        "memory_32b": mem32,            # 32b 워드 배열
         "ifm_offset": start_ifm,        # 32b 기준 오프셋
         "filter_offset": start_flt,     # 32b 기준 오프셋
         "bias_offset": start_bias,      # 32b 기준 오프셋
         "scale_offset": start_scale,    # 32b 기준 오프셋
-        "total_lines": len(all32_lines),
-        "total_lines_16b": len(all16_lines),
+        "total_lines": len(mem32),
+        "total_lines_16b": len(mem16),
       }
     """
-    
-    
-    ifm_lines   = list(ifm_src)
-    filt_lines  = list(filt_src)
-    bias_lines  = list(bias_src)
-    scale_lines = list(scale_src)
 
-    # --- 16줄 정렬 패딩 및 오프셋 계산(32b 기준) ---
-    start_ifm = 0
-    ifm_lines, _ = _pad_to_mult16(ifm_lines)
+    sections = [_as_words(s) for s in (ifm_src, filt_src, bias_src, scale_src)]
+
+    # --- 16줄 정렬 오프셋 계산(32b 기준) ---
+    offsets: List[int] = []
+    pos = 0
+    for sec in sections:
+        offsets.append(pos)
+        pos += align_up(sec.size)
+    total = pos
+    start_ifm, start_flt, start_bias, start_scale = offsets
 
-    start_flt = len(ifm_lines)
-    filt_lines, _ = _pad_to_mult16(filt_lines)
+    # --- 버퍼 할당 후 섹션 복사 (패딩 영역은 0) ---
+    if mmap_path is not None:
+        mmap_path.parent.mkdir(parents=True, exist_ok=True)
+        mem32 = np.memmap(mmap_path, dtype="<u4", mode="w+", shape=(total,))
+    else:
+        mem32 = np.zeros(total, dtype="<u4")
 
-    start_bias = start_flt + len(filt_lines)
-    bias_lines, _ = _pad_to_mult16(bias_lines)
+    for off, sec in zip(offsets, sections):
+        mem32[off:off + sec.size] = sec
 
-    start_scale = start_bias + len(bias_lines)
-    scale_lines, _ = _pad_to_mult16(scale_lines)
+    # little-endian이므로 16b view는 [하위16, 상위16] 순
+    mem16 = mem32.view("<u2")
 
-    # --- 최종 32b/16b 라인 구성 ---
-    all32_lines = ifm_lines + filt_lines + bias_lines + scale_lines
-    all16_lines = _split32_to_16_lines(all32_lines) 
-    
 
     return {
-        "memory": all16_lines,
+        "memory": mem16,
+        "memory_32b": mem32,
         "ifm_offset": start_ifm,
         "filter_offset": start_flt,
         "bias_offset": start_bias,
         "scale_offset": start_scale,
-        "total_lines": len(all32_lines),
-        "total_lines_16b": len(all16_lines),
-    }
\ No newline at end of file
+        "total_lines": len(mem32),
+        "total_lines_16b": len(mem16),
+    }
@@ -1,43 +1,68 @@
 import numpy as np
-import math
-
-
-def run_conv(ifm_data: list[str], filt_72b: list[str],
-             H: int, W: int, C: int, M: int, K: int = 3, pad: int = 1) -> list[str]:
-    
-    GROUPS_PER_PIXEL = C // 4
-    ifm = np.zeros((H, W, C), dtype=np.int8)
-    
-    idx = 0
-    for y in range(H):
-        for x in range(W):
-            for g in range(GROUPS_PER_PIXEL):
-                word = ifm_data[idx]; idx += 1
-                word_int32 = int(word, 16) & 0xFFFFFFFF
-                b = word_int32.to_bytes(4, "little", signed=False)
-                ch_base = 4 * g
-                ifm[y, x, ch_base:ch_base+4] = np.frombuffer(b, dtype=np.int8)
-                
-                
+from typing import Callable
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .feamap import FeatureMap
+from .io_hex import hex_lines_to_words
+from .profiling import profiled
+
+
+def _decode_filter_72b(filt_72b: list[str] | np.ndarray, M: int, C: int, K: int) -> np.ndarray:
+    """72b 워드(상위 바이트가 마지막 tap) 리스트 또는 (N, 9) uint8 배열 -> (M, C, K, K) int8"""
+    if isinstance(filt_72b, np.ndarray):
+        raw = filt_72b.reshape(-1, K * K)[:M * C, ::-1]
+    else:
+        raw = np.frombuffer(bytes.fromhex("".join(filt_72b[:M * C])), dtype=np.uint8)
+        raw = raw.reshape(M * C, K * K)[:, ::-1]   # hex 문자열은 big-endian 순서
+    return np.ascontiguousarray(raw).view(np.int8).reshape(M, C, K, K)
+
+
+def conv2d_int8(ifm: np.ndarray, weights: np.ndarray, pad: int = 1) -> np.ndarray:
+    """
+    int8 x int8 -> int32 convolution (stride 1, zero padding)\n
+    ifm: (..., H, W, C) int8 (앞쪽 batch 축 허용), weights: (M, C, K, K) int8\n
+    반환: (..., M, H_out, W_out) int32 ((..., H_out, W_out, M) 연속 메모리의 view)
+
+    im2col(sliding window view) + matmul로 계산한다. batch 축이 있으면 모든 프레임의 im2col을
+    세로로 쌓아 matmul 한 번으로 계산한다.
+    누산 범위가 2^53 미만이면 float64 matmul(BLAS)로 정확히 계산되므로 그 경로를 사용하고,
+    그 이상이면 int64 matmul로 계산한다.
+    """
+    M, C, K, _ = weights.shape
+    lead = ifm.shape[:-3]
+    x = np.pad(ifm, ((0, 0),) * len(lead) + ((pad, pad), (pad, pad), (0, 0)), mode="constant", constant_values=0)
+
+    win = sliding_window_view(x, (K, K), axis=(-3, -2))     # (..., H_out, W_out, C, K, K)
+    H_out, W_out = win.shape[-5:-3]
+
+    acc_dtype = np.float64 if C * K * K * (128 * 128) < 2**53 else np.int64
+    cols = win.reshape(-1, C * K * K).astype(acc_dtype)
+    wmat = weights.reshape(M, C * K * K).astype(acc_dtype).T
+
+    acc = (cols @ wmat).astype(np.int64).astype(np.int32)    # (N*H_out*W_out, M)
+    return np.moveaxis(acc.reshape(*lead, H_out, W_out, M), -1, -3)
+
+
+def conv_work_bytes(H: int, W: int, C: int, M: int, K: int = 3, pad: int = 1) -> int:
+    """
+    conv2d_int8 한 번이 잡는 임시 버퍼 크기 (byte)\n
+    im2col 행렬 (H_out*W_out, C*K*K) + matmul 결과와 int64 변환본 (H_out*W_out, M) x 2, 원소 8B.
+    반환하는 int32 누산 배열은 포함하지 않는다
+    """
+    H_out, W_out = H + 2 * pad - K + 1, W + 2 * pad - K + 1
+    return H_out * W_out * (C * K * K + 2 * M) * 8
+
+
+def _conv_reference(ifm: np.ndarray, weights: np.ndarray, pad: int = 1) -> np.ndarray:
+    """conv2d_int8의 기준(loop) 구현. 동치성 확인용"""
+    M, C, K, _ = weights.shape
+    H, W = ifm.shape[:2]
     ifm_padded = np.pad(
         ifm, pad_width=((pad, pad), (pad, pad), (0, 0)),
         mode="constant", constant_values=0
     )
-    
-    
-    weights = np.zeros((M, C, K, K), dtype=np.int8)
-    pos = 0
-    for m in range(M):
-        for c_idx in range(C):
-            word72 = filt_72b[pos]; pos += 1
-            word72_int = int(word72, 16)
-            b = word72_int.to_bytes(K*K, "little", signed=False)
-            w = np.frombuffer(b, dtype=np.int8).reshape(K, K)
-            weights[m, c_idx] = w
 
-    # -------------------------------
-    # Convolution
-    H_out, W_out = H, W
+    H_out, W_out = H + 2 * pad - K + 1, W + 2 * pad - K + 1
     output = np.zeros((M, H_out, W_out), dtype=np.int32)
     for m in range(M):
         for y in range(H_out):
@@ -47,255 +72,180 @@ def run_conv(ifm_data: list[str], filt_72b: list[str],
                     patch = ifm_padded[y:y+K, x:x+K, c_idx].astype(np.int32)
                     acc += int(np.sum(patch * weights[m, c_idx].astype(np.int32)))
                 output[m, y, x] = acc
+    return output
+
+
+@profiled()
+def run_conv(ifm: FeatureMap, filt_72b: list[str] | np.ndarray, M: int,
+             K: int = 3, pad: int = 1, reference: bool = False,
+             workers: int = 1, tiled: bool = False,
+             psum_sink: Callable | None = None, out: np.ndarray | None = None) -> FeatureMap:
+    """
+    반환: conv 누산 결과 FeatureMap (int32, 채널=M)\n
+    reference=True 이면 기존 loop 구현(_conv_reference)으로 계산\n
+    workers != 1 이면 출력 채널 tile 단위로 프로세스 풀에서 계산 (0 이하: CPU 개수). 결과는 동일\n
+    tiled=True 이면 하드웨어 tile 순서로 계산 (conv_tiled.conv2d_int8_tiled). psum_sink는 tile별 partial sum 수신\n
+    out: 결과를 받을 (H, W, M) int32 배열 (np.memmap 가능, tiled 경로). ifm.data도 memmap이면
+    메모리에는 partial sum band 하나만 남는다
+    """
+    C = ifm.padded_channels
+    weights = _decode_filter_72b(filt_72b, M, C, K)
+    if ifm.frames is not None and (tiled or reference or psum_sink is not None or out is not None):
+        raise ValueError("tiled / reference conv does not support batch feature maps")
+
+    # -------------------------------
+    # Convolution
+    x = ifm.data.view(np.int8)
+    if tiled or psum_sink is not None or out is not None:
+        from .conv_tiled import conv2d_int8_tiled
+        out = conv2d_int8_tiled(x, weights, pad, out=out, psum_sink=psum_sink)
+        return FeatureMap(out, M)
+
+    if reference:
+        output = _conv_reference(x, weights, pad)
+    elif workers != 1:
+        from .parallel import conv2d_int8_parallel
+        output = conv2d_int8_parallel(x, weights, pad, workers)
+    else:
+        output = conv2d_int8(x, weights, pad)
+
+    return FeatureMap(np.ascontiguousarray(np.moveaxis(output, -3, -1)), M)
+
 
-    print("result shape =", output.shape)
-    
-    out: list[str] = []
-    
-    for y in range(H_out):
-        for x in range(W_out):
-            for m in range(M):
-                v = output[m, y, x] & 0xFFFFFFFF
-                out.append(f"{v:08x}")
+def scale_shift_table(scale_words: np.ndarray) -> np.ndarray:
+    """
+    scale 워드 -> 채널별 right shift 양 (int32)\n
+    v > 0 이면 floor(log2(v)) + 1 (= v의 bit 길이), v == 0 이면 0.
+    uint32는 float64로 정확히 표현되므로 frexp 지수가 곧 bit 길이다.
+    """
+    return np.frexp(scale_words.astype(np.float64))[1].astype(np.int32)
 
+
+def _decode_affine(affine: list[str] | np.ndarray, M: int) -> tuple[np.ndarray, np.ndarray]:
+    """packed affine(bias M개 + scale M개, hex 리스트 또는 워드 배열) -> (bias int32 (M,), right shift int32 (M,))"""
+    if isinstance(affine, np.ndarray):
+        words = np.ascontiguousarray(affine[:2 * M], dtype="<u4")
+    else:
+        words = hex_lines_to_words(affine[:2 * M])
+    if words.size < 2 * M:
+        raise ValueError(f"not enough affine words: have={words.size} need={2 * M}")
+    bias = words[:M].view("<i4")            # two's complement 그대로 재해석
+    return bias, scale_shift_table(words[M:2 * M])
+
+
+def _affine_u8(acc: np.ndarray, bias: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """
+    (..., H, W, M) int32 누산값 -> (..., H, W, Mp) uint8 (Mp = 4의 배수, 패딩 채널 0)\n
+    bias add → ReLU → 채널별 right-shift(scale) → [0, 255] clamp\n
+    bias add는 기존 모델과 같이 int64로 (int32 wrap-around 없음)
+    """
+    *lead, M = acc.shape
+    x = acc.astype(np.int64) + bias
+    np.maximum(x, 0, out=x)             # ReLU. 음수가 없으므로 산술/논리 shift 동일
+    np.right_shift(x, shift, out=x)
+    out = np.zeros((*lead, -(-M // 4) * 4), dtype=np.uint8)
+    np.minimum(x, 255, out=x)
+    out[..., :M] = x
     return out
 
 
-def run_affine_from_conv(conv_result: list[str], affine: list[str],
-                            H: int, W: int, M: int) -> list[str]:
-    
-    aff_words = affine
-    
-    bias_words  = aff_words[:M]
-    scale_words = aff_words[M:M*2]
-
-    bias = []
-    
-    for v in bias_words:
-        v_int = int(v, 16)
-        if v_int >= 0x8000_0000:
-            v_int -= 0x1_0000_0000  # twos-complement to signed
-        bias.append(v_int)
-    bias = np.array(bias, dtype=np.int32)
-    
-    
-    scale_shift_list = []
-    for v in scale_words[:M]:
-        v_int = int(v, 16)
-        if v_int <= 0:
-            shift = 0
-        else:
-            shift = int(math.log2(v_int)) + 1
-        scale_shift_list.append(shift)
-    scale_shift = np.array(scale_shift_list, dtype=np.int32)  # (M,)
-
-
-    # expect 텐서 복원: (M,H,W)로 보관
-    ofm_list = []
-    for v in conv_result:
-        v_int = int(v, 16)
-        if v_int >= 0x8000_0000:
-            v_int -= 0x1_0000_0000  # twos-complement to signed
-        ofm_list.append(v_int)
-
-    ofm_int32 = np.asarray(ofm_list).reshape(H, W, M)
-    ofm_int32 = ofm_int32.transpose(2, 0, 1) 
-    
-    # -------------------------------
+def _maxpool_2x2(x: np.ndarray, stride: int) -> np.ndarray:
+    """
+    (..., H, W, C) 2x2 maxpool (앞쪽 batch 축은 그대로)\n
+    stride 1: top/left zero padding 1칸 (출력 H x W)\n
+    그 외   : VALID (출력 1 + (H-2)//stride)\n
+    sliding_window_view로 창을 잡고, 창 안 4개 tap은 np.maximum으로 합친다.
+    (.max(axis=(3, 4)) 축소보다 uint8에서 훨씬 빠름)
+    """
+    if stride == 1:
+        x = np.pad(x, ((0, 0),) * (x.ndim - 3) + ((1, 0), (1, 0), (0, 0)), mode="constant", constant_values=0)
+    win = sliding_window_view(x, (2, 2), axis=(-3, -2))[..., ::stride, ::stride, :, :, :]  # (.., oH, oW, C, 2, 2)
+    return np.maximum(np.maximum(win[..., 0, 0], win[..., 0, 1]),
+                      np.maximum(win[..., 1, 0], win[..., 1, 1]))
+
+
+_AFFINE_BAND_PIXELS = 1 << 16      # affine 한 번에 처리할 픽셀 수 (memmap 입력도 band씩만 읽음)
+
+
+@profiled()
+def run_affine_from_conv(conv_result: FeatureMap, affine: list[str] | np.ndarray) -> FeatureMap:
+    """
+    conv 누산 결과(int32) -> affine 결과 (uint8, 4채널씩 1워드, 부족한 채널은 0 패딩)\n
+    행 band 단위로 계산해서 임시 배열은 band 크기로 제한된다
+    """
+    M = conv_result.channels
+    bias, scale_shift = _decode_affine(affine, M)
+    data, H = conv_result.data, conv_result.height
+    out = np.empty((*data.shape[:-1], -(-M // 4) * 4), dtype=np.uint8)
+    rows = max(1, _AFFINE_BAND_PIXELS // (data.size // (data.shape[-1] * H)))    # 행당 픽셀 (batch 포함)
+    for y in range(0, H, rows):
+        out[..., y:y + rows, :, :] = _affine_u8(data[..., y:y + rows, :, :M], bias, scale_shift)
+    return FeatureMap(out, M)
+
+
+@profiled()
+def run_layer_fused(ifm: FeatureMap, filt_72b: list[str] | np.ndarray, affine: list[str] | np.ndarray, M: int,
+                    pool_stride: int = 0, K: int = 3, pad: int = 1, workers: int = 1,
+                    intermediates: dict | None = None) -> FeatureMap:
+    """
+    conv → affine → (maxpool) 를 한 번에 계산\n
+    int32 누산 배열을 (H, W, M) 그대로 affine/maxpool에 넘기고, 중간 FeatureMap을 만들지 않는다.\n
+    ifm에 batch 축이 있으면 (N, H, W, C) 전체를 conv matmul 한 번으로 계산한다.\n
+    pool_stride: 0 = maxpool 없음, 1 = top/left pad, 2 = VALID\n
+    intermediates에 dict를 주면 "conv", "affine" 중간 결과를 담아준다 (expect 파일 출력용)\n
+    반환: 마지막 단계 결과 FeatureMap (uint8)
+    """
+    C = ifm.padded_channels
+    weights = _decode_filter_72b(filt_72b, M, C, K)
+    x = ifm.data.view(np.int8)
+    if workers != 1:
+        from .parallel import conv2d_int8_parallel
+        acc = conv2d_int8_parallel(x, weights, pad, workers)
+    else:
+        acc = conv2d_int8(x, weights, pad)
+    acc = np.moveaxis(acc, -3, -1)      # (..., H, W, M). conv2d_int8 결과는 이 순서로 연속 메모리
 
-    # 2) Affine: bias add → ReLU → right-shift(scale) → clamp to [0,255]
-    # 채널별로 처리 (브로드캐스팅)
-    # acc(m,y,x) + bias(m)
-    ofm_int32 = ofm_int32 + bias[:, None, None]
-    
-    # ReLU
-    np.maximum(ofm_int32, 0, out=ofm_int32)
+    bias, scale_shift = _decode_affine(affine, M)
+    out = _affine_u8(acc, bias, scale_shift)
+    if intermediates is not None:
+        intermediates["conv"] = FeatureMap(np.ascontiguousarray(acc), M)
+        intermediates["affine"] = FeatureMap(out, M)
+    if pool_stride:
+        out = _maxpool_2x2(out, pool_stride)
+    return FeatureMap(out, M)
 
-    # 채널별 시프트: (m,y,x) >> scale(m)
-    # 음수가 아니므로 산술/논리 동일, 안전하게 np.right_shift 사용
-    # right_shift는 피연산자 dtype에 따라 동작하므로 int32 유지
-    # 브로드캐스트 위해 scale을 (M,1,1)로 reshape
-    ofm_shifted = np.right_shift(ofm_int32, scale_shift.astype(np.int32)[:, None, None])
 
-    # clamp to uint8
-    ofm_u8 = np.clip(ofm_shifted, 0, 255).astype(np.uint8)  # (M,H,W)
 
-    # -------------------------------
-    # 3) 저장: m → x → y 순, 4채널씩 1워드(리틀엔디언)
-    
-    out: list[str] = []
-    for y in range(H):
-        for x in range(W):
-            m = 0
-            while m < M:
-                # 부족하면 0 패딩
-                v0 = int(ofm_u8[m+0, y, x]) if (m+0) < M else 0
-                v1 = int(ofm_u8[m+1, y, x]) if (m+1) < M else 0
-                v2 = int(ofm_u8[m+2, y, x]) if (m+2) < M else 0
-                v3 = int(ofm_u8[m+3, y, x]) if (m+3) < M else 0
-                word = (v0 & 0xFF) | ((v1 & 0xFF) << 8) | ((v2 & 0xFF) << 16) | ((v3 & 0xFF) << 24)
-                word_str = f"{word:08x}"
-                out.append(word_str.lower())
-                m += 4
+@profiled()
+def maxpool_from_affine_words(fm: FeatureMap, stride: int) -> FeatureMap:
+    """
+    2x2 maxpool (패딩 채널 포함 전체 텐서를 한 번에)\n
+    stride 1: top/left zero padding, 같은 크기. stride 2: VALID\n
+    결과는 (H, W, Cp) uint8 연속 배열이라 to_words()가 그대로 LSB-first 32b 워드가 된다.
+    """
+    return FeatureMap(_maxpool_2x2(fm.data, stride), fm.channels)
 
-    return out
 
 
+@profiled()
+def upsample_words(fm: FeatureMap, sy: int = 2, sx: int = 2) -> FeatureMap:
 
-def maxpool_from_affine_words(
-    words: list[str],
-    H: int,
-    W: int,
-    M: int,
-    stride: int
-) -> list[str]:
-    
-    kernel = 2
-    N = M * W * H
-    
-    arr = []
-    for v in words:
-        v0 = v[6:8]
-        v1 = v[4:6]
-        v2 = v[2:4]
-        v3 = v[0:2]
-        
-        v0_int = int(v0, 16)
-        v1_int = int(v1, 16)
-        v2_int = int(v2, 16)
-        v3_int = int(v3, 16)
-        arr.append(v0_int)
-        arr.append(v1_int)
-        arr.append(v2_int)
-        arr.append(v3_int)
-        
-    ofm = np.asarray(arr).reshape(H, W, M)
-    ofm = ofm.transpose(2, 0, 1) 
-    
-    
-    if stride == 1:
-        outH, outW = H, W
-        # top/left에만 zero padding 1칸
-        pad = np.pad(ofm, ((0,0), (1,0), (1,0)), mode='constant', constant_values=0)
-        mp_out = np.empty((M, outH, outW), dtype=np.uint8)
-        for m in range(M):
-            for y in range(outH):
-                for x in range(outW):
-                    window = pad[m, y:y+2, x:x+2]
-                    mp_out[m, y, x] = window.max()
-    
-    else:
-        # 2) maxpool (VALID, padding 없음)
-        outH = 1 + (H - kernel) // stride
-        outW = 1 + (W - kernel) // stride
-        mp_out = np.zeros((M, outH, outW), dtype=np.uint8)
-        
-        for m in range(M):
-            for oy in range(outH):
-                ys = oy * stride
-                for ox in range(outW):
-                    xs = ox * stride
-                    window = ofm[m, ys:ys+kernel, xs:xs+kernel]
-                    mp_out[m, oy, ox] = window.max()
-                
-                
-    out_words: list[str] = []
-    
-    acc = 0
-    cnt = 0
-    
-    for y in range(outH):
-        for x in range(outW):
-            for m in range(M):
-                byte = int(mp_out[m, y, x]) & 0xFF
-                acc |= (byte << (8 * (cnt % 4)))   # LSB-first
-                cnt += 1
-                if cnt % 4 == 0:
-                    out_words.append(f"{acc:08x}")
-                    acc = 0
-
-    return out_words
-
-
-
-def upsample_words(
-    words: list[str],
-    H: int, W: int, M: int,
-    sy: int = 2, sx: int = 2
-) -> list[str]:
-
-    words_per_pix = M // 4
-    expected_words = H * W * words_per_pix
-
-
-    # 1) 32b hex -> uint32 배열
-    def _to_u32(s: str) -> int:
-        s = s.lower().replace("0x", "")
-        return int(s, 16) & 0xFFFFFFFF
-
-    u32 = np.fromiter(( _to_u32(s) for s in words ), dtype=np.uint32, count=expected_words)
-
-    # 2) 32b -> 4바이트 분해 (little-endian: c0=LSB)
-    #    shape: (Nwords, 4) → (H, W, M)
-    b0 = (u32      & 0xFF).astype(np.uint8)   # c0
-    b1 = ((u32>>8) & 0xFF).astype(np.uint8)   # c1
-    b2 = ((u32>>16)& 0xFF).astype(np.uint8)   # c2
-    b3 = ((u32>>24)& 0xFF).astype(np.uint8)   # c3
-    bytes4 = np.stack([b0, b1, b2, b3], axis=1)              # (Nwords, 4)
-    ofm = bytes4.reshape(H, W, words_per_pix, 4).reshape(H, W, M)  # (H, W, M)
-
-    # 3) 최근접 업샘플 (row/col 방향 반복)
-    ofm_up = np.repeat(np.repeat(ofm, sy, axis=0), sx, axis=1)     # (H*sy, W*sx, M)
-    H2, W2 = H * sy, W * sx
-
-    # 4) 4채널씩 다시 패킹하여 32b로 합치기
-    g = ofm_up.reshape(H2, W2, words_per_pix, 4).astype(np.uint32) # (H2, W2, M/4, 4)
-    u32_out = (g[...,0] | (g[...,1]<<8) | (g[...,2]<<16) | (g[...,3]<<24)).reshape(-1)
-
-    # 5) 8자리 소문자 hex 문자열로 출력
-    out_words = [f"{int(v):08x}" for v in u32_out.tolist()]
-    return out_words
-
-
-
-def concat_words(
-    words1: list[str],
-    words2: list[str],
-    H: int, W: int, M1: int, M2: int
-) -> list[str]:
-
-    words_per_pix1 = M1 // 4
-    words_per_pix2 = M2 // 4
-    expected1 = H * W * words_per_pix1
-    expected2 = H * W * words_per_pix2
-    assert len(words1) == expected1
-    assert len(words2) == expected2
-
-    def _to_u32(s: str) -> int:
-        return int(s, 16) & 0xFFFFFFFF
-
-    arr1 = np.fromiter((_to_u32(s) for s in words1), dtype=np.uint32, count=expected1)
-    arr2 = np.fromiter((_to_u32(s) for s in words2), dtype=np.uint32, count=expected2)
-
-    # 32b -> (H,W,M1) / (H,W,M2)
-    def unpack(u32arr, M):
-        b0 = (u32arr      & 0xFF).astype(np.uint8)
-        b1 = ((u32arr>>8) & 0xFF).astype(np.uint8)
-        b2 = ((u32arr>>16)& 0xFF).astype(np.uint8)
-        b3 = ((u32arr>>24)& 0xFF).astype(np.uint8)
-        bytes4 = np.stack([b0,b1,b2,b3], axis=1)
-        return bytes4.reshape(H, W, M//4, 4).reshape(H, W, M)
-
-    fmap1 = unpack(arr1, M1)
-    fmap2 = unpack(arr2, M2)
-
-    # 채널 축 concat
-    fmap_cat = np.concatenate([fmap1, fmap2], axis=2)  # (H,W,M1+M2)
-    M_out = M1+M2
-    words_per_pix_out = M_out//4
-
-    # 다시 패킹
-    g = fmap_cat.reshape(H, W, words_per_pix_out, 4).astype(np.uint32)
-    u32_out = (g[...,0] | (g[...,1]<<8) | (g[...,2]<<16) | (g[...,3]<<24)).reshape(-1)
-    out_words = [f"{int(v):08x}" for v in u32_out.tolist()]
-    return out_words
\ No newline at end of file
+    # 최근접 업샘플 (row/col 방향 반복)
+    ofm_up = np.repeat(np.repeat(fm.data, sy, axis=-3), sx, axis=-2)   # (..., H*sy, W*sx, Cp)
+    return FeatureMap(ofm_up, fm.channels)
+
+
+
+@profiled()
+def concat_words(fm1: FeatureMap, fm2: FeatureMap) -> FeatureMap:
+    """
+    채널 축 concat: {fm1, fm2}\n
+    fm1의 패딩 채널은 그대로 유지된다 (워드 단위 concat)
+    """
+    if fm1.data.shape[:-1] != fm2.data.shape[:-1]:
+        raise ValueError(f"concat size mismatch: {fm1} vs {fm2}")
+    if fm1.data.dtype != fm2.data.dtype:
+        raise ValueError(f"concat dtype mismatch: {fm1} vs {fm2}")
+
+    fmap_cat = np.concatenate([fm1.data, fm2.data], axis=-1)  # (..., H, W, Cp1+Cp2)
+    return FeatureMap(fmap_cat, fm1.padded_channels + fm2.channels)
@@ -1,46 +1,79 @@
-from .utils import TCParams, read_lsb_1byte
+import numpy as np
 
+from .io_hex import hex_lines_to_words, words_to_hex_lines
+from .profiling import profiled
 
-def pack_filter_72b(filter_src: list[str]) -> list[str]:
-    src_lines = read_lsb_1byte(filter_src)
-    out: list[str] = []
-    
-    for i in range(0, len(src_lines), 9):
-        group = src_lines[i:i+9]
-        packed = "".join(reversed(group))
-        out.append(packed)
-        
-    return out
 
+KERNEL_TAPS = 9     # 3x3
+TOUT = 4            # 32b 워드 하나 = 출력 채널 4개의 같은 (cin, k) weight
 
 
-def pack_filter_32b(cin: int, cout: int, filter_src: list[str]) -> list[str]:
-    src_lines = read_lsb_1byte(filter_src)
-    out: list[str] = []
-    
-    for cg in range(0, cout, 4):
-        # 각 cin, k에 대해 하나의 32비트 워드 생성
-        for ci in range(cin):
-            for k in range(9):
-                # 각 cout의 동일 (cin, k) 위치 바이트를 수집
-                idxs = [(((co * cin) + ci) * 9) + k for co in (cg, cg+1, cg+2, cg+3)]
-                b = [src_lines[i] for i in idxs]
-
-                # little endian
-                packed32 = f"{b[3]}{b[2]}{b[1]}{b[0]}"
-                out.append(packed32)
-                
-    return out
+def filter_bytes(filter_src: list[str] | np.ndarray) -> np.ndarray:
+    """
+    weight source -> uint8 1차원 배열 (cout → cin → k 순)\n
+    hex 문자열 리스트나 워드 배열이면 각 워드의 하위 1바이트 (read_lsb_1byte와 동일),
+    int8/uint8 배열 ((Cout, Cin, 3, 3) 등)이면 그대로 펼친다.
+    """
+    if not isinstance(filter_src, np.ndarray):
+        filter_src = hex_lines_to_words(filter_src)
+    if filter_src.dtype.itemsize == 1:
+        return np.ascontiguousarray(filter_src).reshape(-1).view(np.uint8)
+    return (filter_src.reshape(-1) & 0xFF).astype(np.uint8)
+
+
+@profiled()
+def pack_filter_72b(filter_src: list[str] | np.ndarray, as_words: bool = False) -> list[str] | np.ndarray:
+    """
+    (cout, cin) 마다 3x3 tap 9바이트를 72b 한 줄로 (마지막 tap이 상위 바이트)\n
+    as_words=True: (Cout*Cin, 9) uint8 배열 (hex 표기 순서, 상위 바이트 먼저)
+    """
+    taps = filter_bytes(filter_src).reshape(-1, KERNEL_TAPS)[:, ::-1]
+    if as_words:
+        return np.ascontiguousarray(taps)
+    h = taps.tobytes().hex()
+    n = 2 * KERNEL_TAPS
+    return [h[i:i + n] for i in range(0, len(h), n)]
+
+
+
+@profiled()
+def pack_filter_32b(cin: int, cout: int, filter_src: list[str] | np.ndarray,
+                    as_words: bool = False) -> list[str] | np.ndarray:
+    """
+    출력 채널 4개(Tout)씩 묶어 같은 (cin, k) weight를 32b 워드 하나로 (LSB = 그룹 첫 채널)\n
+    순서: cout 그룹 → cin → k\n
+    as_words=True: uint32 워드 배열
+    """
+    if cout % TOUT:
+        raise ValueError(f"cout must be multiple of {TOUT}: cout={cout}")
+    w = filter_bytes(filter_src)
+    if w.size < cout * cin * KERNEL_TAPS:
+        raise ValueError(f"not enough weights: have={w.size} need={cout * cin * KERNEL_TAPS}")
+    w = w[:cout * cin * KERNEL_TAPS].reshape(cout // TOUT, TOUT, cin, KERNEL_TAPS)
+    # (그룹, cin, k, 채널 4개) -> little-endian 워드
+    words = np.ascontiguousarray(w.transpose(0, 2, 3, 1)).view("<u4").reshape(-1)
+    if as_words:
+        return words
+    return words_to_hex_lines(words)
 
 
 # ------------------------------
 # AFFINE 패킹 (bias + scale)
 # ------------------------------
-def pack_affine(cout: int, bias_src: list[str], scale_src: list[str]) -> list[str]:
+@profiled()
+def pack_affine(cout: int, bias_src: list[str] | np.ndarray,
+                scale_src: list[str] | np.ndarray) -> list[str] | np.ndarray:
+    """bias cout개 + scale cout개. 둘 다 배열이면 uint32 워드 배열로"""
+    if isinstance(bias_src, np.ndarray) and isinstance(scale_src, np.ndarray):
+        words = np.empty(2 * cout, dtype="<u4")
+        words[:cout] = bias_src[:cout].astype("<i4", copy=False).view("<u4")
+        words[cout:] = scale_src[:cout]
+        return words
+
     out: list[str] = []
     for c in range(cout):
         out.append(bias_src[c])
     for c in range(cout):
         out.append(scale_src[c])
-        
-    return out
\ No newline at end of file
+
+    return out
@@ -0,0 +1,111 @@
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+TOUT = 4                        # controller_params.vh: 출력 채널 tile 크기
+PARALLEL_MIN_MACS = 1 << 24     # 이보다 작은 conv는 프로세스 전달 비용이 더 커서 직렬로 계산
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def resolve_workers(workers: int | None) -> int:
+    """None/0 이하 -> CPU 개수"""
+    if workers is None or workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """worker 수별로 프로세스 풀을 하나만 만들어 재사용 (레이어마다 fork 하지 않도록)"""
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+def tile_ranges(M: int, n_chunks: int, tile: int = TOUT) -> list[tuple[int, int]]:
+    """출력 채널 [0, M)을 tile 배수 경계로 최대 n_chunks개 구간으로 나눈다"""
+    n_tiles = -(-M // tile)
+    per = -(-n_tiles // max(1, min(n_chunks, n_tiles)))
+    return [(m0, min(m0 + per * tile, M)) for m0 in range(0, M, per * tile)]
+
+
+# ------------------------------
+# shared memory
+# ------------------------------
+def _share(arr: np.ndarray | None, shape: tuple, dtype) -> tuple[shared_memory.SharedMemory, tuple]:
+    """shared memory 블록을 만들고 (arr가 있으면) 복사. 반환: (shm, worker 전달용 spec)"""
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    if arr is not None:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, shape, dtype.str)
+
+
+def _attach(spec: tuple) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _conv_tile_worker(x_spec: tuple, w_spec: tuple, out_spec: tuple, m0: int, m1: int) -> None:
+    """출력 채널 [m0, m1) 계산 후 공유 출력 버퍼에 직접 기록"""
+    from .ops_conv import conv2d_int8
+
+    (x_shm, x), (w_shm, w), (out_shm, out) = (_attach(s) for s in (x_spec, w_spec, out_spec))
+    try:
+        out[..., m0:m1, :, :] = conv2d_int8(x, w[m0:m1], pad=0)
+    finally:
+        del x, w, out       # view가 남아 있으면 close 불가
+        for shm in (x_shm, w_shm, out_shm):
+            shm.close()
+
+
+def conv2d_int8_parallel(ifm: np.ndarray, weights: np.ndarray, pad: int = 1,
+                         workers: int | None = None) -> np.ndarray:
+    """
+    conv2d_int8과 같은 결과(bit-identical)를 출력 채널 tile(Tout=4) 단위로 나눠 프로세스 풀에서 계산\n
+    패딩된 IFM, weight, 출력 버퍼는 shared memory로 공유 (pickle 전달 없음)\n
+    ifm: (..., H, W, C) (앞쪽 batch 축 허용). 반환: (..., M, H_out, W_out) int32
+    """
+    from .ops_conv import conv2d_int8
+
+    workers = resolve_workers(workers)
+    M, C, K, _ = weights.shape
+    lead, (H, W) = ifm.shape[:-3], ifm.shape[-3:-1]
+    H_out, W_out = H + 2 * pad - K + 1, W + 2 * pad - K + 1
+    if workers == 1 or M <= TOUT or M * C * K * K * H_out * W_out * int(np.prod(lead)) < PARALLEL_MIN_MACS:
+        return conv2d_int8(ifm, weights, pad)
+
+    x = np.pad(ifm, ((0, 0),) * len(lead) + ((pad, pad), (pad, pad), (0, 0)), mode="constant", constant_values=0)
+    out_shape = (*lead, M, H_out, W_out)
+    blocks = []
+    try:
+        blocks.append(_share(x, x.shape, np.int8))
+        blocks.append(_share(weights, weights.shape, np.int8))
+        blocks.append(_share(None, out_shape, np.int32))
+        x_spec, w_spec, out_spec = (spec for _, spec in blocks)
+
+        pool = get_pool(workers)
+        futures = [pool.submit(_conv_tile_worker, x_spec, w_spec, out_spec, m0, m1)
+                   for m0, m1 in tile_ranges(M, workers)]
+        for f in futures:
+            f.result()
+        return np.ndarray(out_shape, dtype=np.int32, buffer=blocks[2][0].buf).copy()
+    finally:
+        for shm, _ in blocks:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,213 @@
+import json
+import re
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from .hexlite import align_up
+from .io_hex import read_hex_words
+from .packers import pack_filter_72b, pack_filter_32b, pack_affine
+from .profiling import profiled
+from .utils import normalize_filter
+from .yolo import ConvLayer
+
+
+# 파일 이름: {prefix}_param_{kind}.hex (예: CONV00_param_weight.hex)
+_PARAM_FILE = re.compile(r"^(?P<prefix>.+)_param_(?P<kind>weight|biases|scales)\.hex$")
+
+# kind -> decode 결과 dtype
+#   weight : 워드 하위 1바이트 (int8, cout → cin → k 순)
+#   biases : two's complement 32b (int32)
+#   scales : 32b (uint32)
+PARAM_KINDS = {"weight": np.dtype(np.int8), "biases": np.dtype("<i4"), "scales": np.dtype("<u4")}
+
+
+# ------------------------------
+# archive (단일 파일, mmap)
+#   struct(magic, version, json_len) + JSON index, 64B 정렬 후 payload
+#   index: {"CONV00/weight": {"offset", "count", "dtype", "size", "mtime_ns"}, ...}
+#   size / mtime_ns 는 원본 hex 파일 기준 (다르면 해당 항목은 hex에서 다시 decode)
+# ------------------------------
+ARCHIVE_MAGIC = b"AIXPARAM"
+ARCHIVE_VERSION = 1
+_ARCHIVE_HEAD = struct.Struct("<8sII")
+_ALIGN = 64
+
+
+
+def _src_stamp(path: Path) -> dict:
+    st = path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _read_archive(path: Path) -> tuple[dict, np.memmap]:
+    with path.open("rb") as f:
+        raw = f.read(_ARCHIVE_HEAD.size)
+        if len(raw) < _ARCHIVE_HEAD.size:
+            raise ValueError(f"{path}: not a param archive (too short)")
+        magic, version, js_len = _ARCHIVE_HEAD.unpack(raw)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"{path}: not a param archive (magic={magic!r}, version={version})")
+        index = json.loads(f.read(js_len))
+    base = align_up(_ARCHIVE_HEAD.size + js_len, _ALIGN)
+    size = path.stat().st_size - base
+    payload = np.memmap(path, dtype=np.uint8, mode="r", offset=base, shape=(size,)) if size else np.empty(0, np.uint8)
+    return index, payload
+
+
+class ParamStore:
+    """
+    파라미터 디렉토리의 CONVxx weight / bias / scale 파일 lazy 로더\n
+    생성 시 디렉토리 목록만 index하고, 각 텐서는 처음 접근할 때 typed array로 decode.
+    archive가 있으면 (원본과 크기/mtime이 같은 항목은) decode 없이 mmap view를 돌려준다.
+    drop(prefix)로 decode한 배열을 놓는다 (레이어 패킹 후).
+    """
+
+    def __init__(self, root: Path, archive: Path | None = None):
+        if not root.is_dir():
+            raise FileNotFoundError(f"param directory not found: {root}")
+        self.root = root
+        self.files: dict[tuple[str, str], Path] = {}
+        for p in sorted(root.iterdir()):
+            m = _PARAM_FILE.match(p.name)
+            if m:
+                self.files[(m["prefix"], m["kind"])] = p
+        self._arrays: dict[tuple[str, str], np.ndarray] = {}
+        self._archive_index: dict = {}
+        self._archive_payload: np.ndarray | None = None
+        self.archive = archive
+        if archive is not None and archive.is_file():
+            self._archive_index, self._archive_payload = _read_archive(archive)
+        self.decoded = 0            # hex에서 decode한 횟수
+        self.mapped = 0             # archive에서 가져온 횟수
+
+    @property
+    def prefixes(self) -> list[str]:
+        return sorted({prefix for prefix, _ in self.files})
+
+    def __contains__(self, prefix: str) -> bool:
+        return any((prefix, kind) in self.files for kind in PARAM_KINDS)
+
+    # ------------------------------
+    # 접근
+    # ------------------------------
+    def get(self, prefix: str, kind: str) -> np.ndarray:
+        key = (prefix, kind)
+        arr = self._arrays.get(key)
+        if arr is None:
+            arr = self._arrays[key] = self._load(key)
+        return arr
+
+    def weight(self, prefix: str) -> np.ndarray:
+        return self.get(prefix, "weight")
+
+    def bias(self, prefix: str) -> np.ndarray:
+        return self.get(prefix, "biases")
+
+    def scale(self, prefix: str) -> np.ndarray:
+        return self.get(prefix, "scales")
+
+    def drop(self, prefix: str | None = None) -> None:
+        """decode한 배열 해제 (prefix=None이면 전체)"""
+        for key in [k for k in self._arrays if prefix is None or k[0] == prefix]:
+            del self._arrays[key]
+
+    def _path(self, key: tuple[str, str]) -> Path:
+        path = self.files.get(key)
+        if path is None:
+            raise FileNotFoundError(f"no {key[0]}_param_{key[1]}.hex in {self.root}")
+        return path
+
+    @profiled("params.load")
+    def _load(self, key: tuple[str, str]) -> np.ndarray:
+        path = self._path(key)
+        entry = self._archive_index.get("/".join(key))
+        if entry is not None and {k: entry[k] for k in ("size", "mtime_ns")} == _src_stamp(path):
+            self.mapped += 1
+            dtype = np.dtype(entry["dtype"])
+            start = entry["offset"]
+            return self._archive_payload[start:start + entry["count"] * dtype.itemsize].view(dtype)
+        self.decoded += 1
+        return _decode(path, PARAM_KINDS[key[1]])
+
+    # ------------------------------
+    # archive 저장
+    # ------------------------------
+    def archive_is_fresh(self) -> bool:
+        """archive가 디렉토리의 모든 파라미터 파일을 최신 상태로 담고 있는지"""
+        if set(self._archive_index) != {"/".join(k) for k in self.files}:
+            return False
+        return all({k: self._archive_index["/".join(key)][k] for k in ("size", "mtime_ns")}
+                   == _src_stamp(p) for key, p in self.files.items())
+
+    @profiled("params.save_archive")
+    def save_archive(self, path: Path | None = None) -> Path:
+        """모든 텐서를 decode해 archive 하나로 저장 (이미 decode된 것은 재사용)"""
+        path = path or self.archive
+        if path is None:
+            raise ValueError("no archive path given")
+        arrays = {key: self.get(*key) for key in self.files}
+        index, pos = {}, 0
+        for key, array in arrays.items():
+            index["/".join(key)] = {"offset": pos, "count": array.size, "dtype": array.dtype.str,
+                                    **_src_stamp(self.files[key])}
+            pos = align_up(pos + array.nbytes, _ALIGN)
+        js = json.dumps(index, separators=(",", ":")).encode()
+        head = _ARCHIVE_HEAD.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(js)) + js
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(head + b"\0" * (align_up(len(head), _ALIGN) - len(head)))
+            for array in arrays.values():
+                b = np.ascontiguousarray(array).tobytes()
+                f.write(b + b"\0" * (align_up(len(b), _ALIGN) - len(b)))
+        # 기존 archive를 mmap 중일 수 있으므로 놓고 교체
+        del arrays
+        self._archive_payload = None
+        self._arrays.clear()
+        tmp.replace(path)
+        self.archive = path
+        self._archive_index, self._archive_payload = _read_archive(path)
+        return path
+
+
+def _decode(path: Path, dtype: np.dtype) -> np.ndarray:
+    words = read_hex_words(path)
+    if dtype.itemsize == 1:
+        return (words & 0xFF).astype(np.uint8).view(dtype)
+    return words.view(dtype)
+
+
+# ------------------------------
+# 레이어 파라미터 패킹
+# ------------------------------
+def _per_channel(layer: ConvLayer, store: ParamStore, kind: str) -> np.ndarray:
+    arr = store.get(layer.param, kind)
+    if arr.size != layer.cout_src:
+        raise ValueError(f"{layer.name}: {layer.param}_param_{kind}.hex has {arr.size} lines, "
+                         f"expected cout={layer.cout_src}")
+    return arr
+
+
+def load_layer_params(layer: ConvLayer, store: ParamStore) -> dict:
+    """
+    레이어 파라미터 decode -> 하드웨어 shape로 패딩 -> 패킹\n
+    cin 3->4, cout 195->196 zero-padding, 1x1 -> 3x3 변환.
+    bias / scale 파일의 줄 수가 cout_src와 다르면 ValueError.
+    패킹 후 store의 원본 배열은 놓는다.
+    """
+    filt = normalize_filter(store.weight(layer.param), layer.cin_src, layer.cout_src, layer.kernel_src,
+                            layer.cin, layer.cout)
+    pad = (0, layer.cout - layer.cout_src)
+    bias, scale = (np.pad(_per_channel(layer, store, kind), pad) for kind in ("biases", "scales"))
+    store.drop(layer.param)
+
+    return {
+        "filt_72b": pack_filter_72b(filt, as_words=True),
+        "filt_32b": pack_filter_32b(layer.cin, layer.cout, filt, as_words=True),
+        "bias":     bias,
+        "scale":    scale,
+        "affine":   pack_affine(layer.cout, bias, scale),
+    }
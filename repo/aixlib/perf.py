@@ -0,0 +1,258 @@
+import ast
+import math
+import operator
+import re
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from .yolo import YOLO_LAYERS
+
+
+# ------------------------------
+# Verilog header (`define) 읽기
+# ------------------------------
+_DEFINE = re.compile(r"^\s*`define\s+(\w+)[ \t]*(.*?)\s*(?://.*)?$", re.M)
+_MACRO = re.compile(r"`(\w+)")
+_BINOPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+           ast.FloorDiv: operator.floordiv, ast.Div: operator.floordiv}
+
+
+def parse_defines(text: str) -> dict[str, str]:
+    """`define NAME value -> {NAME: value 문자열} (주석 제거, 값 없는 define은 "")"""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    return {m[1]: m[2].strip() for m in _DEFINE.finditer(text)}
+
+
+def _eval_node(node: ast.AST) -> int:
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        return _BINOPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_eval_node(node.operand)
+    if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "clog2" and len(node.args) == 1:
+        v = _eval_node(node.args[0])
+        return max(0, (v - 1).bit_length())
+    raise ValueError(f"unsupported expression: {ast.dump(node)}")
+
+
+def eval_define(defs: dict[str, str], name: str, _depth: int = 0) -> int:
+    """정수 define 값 (다른 `매크로, + - * /, $clog2 포함 식)"""
+    if _depth > 32:
+        raise ValueError(f"define recursion too deep: {name}")
+    if name not in defs:
+        raise KeyError(f"`{name} is not defined")
+    expr = _MACRO.sub(lambda m: f"({eval_define(defs, m[1], _depth + 1)})", defs[name])
+    expr = expr.replace("$clog2", "clog2")
+    try:
+        return _eval_node(ast.parse(expr, mode="eval").body)
+    except (SyntaxError, ValueError):
+        raise ValueError(f"`{name}: not an integer expression: {defs[name]!r}") from None
+
+
+# ------------------------------
+# 설정
+# ------------------------------
+@dataclass(frozen=True)
+class HwConfig:
+    """
+    가속기 파라미터 (controller_params.vh 기본값) + 시스템 가정\n
+    dram_gbps : DMA 유효 대역폭 (GB/s)\n
+    dma_latency : DMA 요청(burst_words 워드) 하나당 고정 지연 (cycle)\n
+    overlap_filter : True면 다음 tile filter를 연산 중에 미리 읽는다고 가정 (현재 RTL은 False, CSYNC 직렬)
+    """
+    tin: int = 4
+    tout: int = 4
+    k: int = 3
+    mac_delay: int = 9
+    adder_tree_delay: int = 2
+    bm_ib_delay: int = 3
+    fm_buffer_depth: int = 65536
+    filter_buffer_depth: int = 512
+    ifm_row_buffer_depth: int = 1536
+    psum_buffer_depth: int = 256
+    clock_mhz: float = 100.0
+    dram_gbps: float = 0.8
+    burst_words: int = 16
+    dma_latency: int = 30
+    overlap_filter: bool = False
+
+    @property
+    def bytes_per_cycle(self) -> float:
+        return self.dram_gbps * 1e9 / (self.clock_mhz * 1e6)
+
+    @property
+    def pipe_delay(self) -> int:
+        """tile(출력 채널 그룹) 하나를 비우는 데 드는 pipeline 지연"""
+        return self.mac_delay + self.adder_tree_delay + self.bm_ib_delay
+
+
+def load_hw_config(path: Path, **overrides) -> HwConfig:
+    """controller_params.vh -> HwConfig (없는 항목은 기본값)"""
+    if not path.is_file():
+        raise FileNotFoundError(f"controller params not found: {path}")
+    defs = parse_defines(path.read_text())
+    fields = {"tin": "Tin", "tout": "Tout", "k": "K", "mac_delay": "MAC_DELAY",
+              "adder_tree_delay": "ADDER_TREE_DELAY", "bm_ib_delay": "BM_IB_DELAY",
+              "fm_buffer_depth": "FM_BUFFER_DEPTH", "filter_buffer_depth": "FILTER_BUFFER_DEPTH",
+              "ifm_row_buffer_depth": "IFM_ROW_BUFFER_DEPTH", "psum_buffer_depth": "PSUM_BUFFER_DEPTH"}
+    values = {f: eval_define(defs, d) for f, d in fields.items() if d in defs}
+    return HwConfig(**{**values, **overrides})
+
+
+@dataclass(frozen=True)
+class LayerCfg:
+    """yolo_layer_cfg.vh 레이어 하나 (채널은 실제 채널 수, ROW/COL은 입력 크기)"""
+    name: str
+    conv: bool
+    row: int
+    col: int
+    cin: int
+    cout: int
+    maxpool: int = 0            # stride (0: 없음)
+    upsample: bool = False
+    route_load: bool = False
+    route_save: bool = False
+    route_loc: str = "ifm"      # route 데이터 위치: "ifm" / "buf" / "dram"
+    route_offset: int = 0       # route 위치 안 워드 오프셋
+    ofm_save: bool = False
+    first: bool = False         # DRAM에서 IFM을 읽는 레이어
+
+
+def load_layer_table(path: Path) -> list[LayerCfg]:
+    """
+    yolo_layer_cfg.vh -> 레이어 목록\n
+    CHANNEL / CHANNEL_OUT은 32b 워드(4채널) 단위이므로 4배해서 채널 수로 바꾼다.
+    conv 여부는 YOLO_LAYERS 이름으로 판단 (save / route / upsample 레이어는 conv 없음)
+    """
+    if not path.is_file():
+        raise FileNotFoundError(f"layer cfg not found: {path}")
+    defs = parse_defines(path.read_text())
+    conv_names = {l.name for l in YOLO_LAYERS}
+    names = sorted({m[1] for m in (re.match(r"(L\d+)_ROW$", k) for k in defs) if m})
+
+    route_locs = {"RTE_IFM": "ifm", "RTE_BUF": "buf", "RTE_DRAM": "dram", "0": "ifm", "1": "buf", "2": "dram"}
+
+    def val(layer: str, field: str) -> int:
+        v = defs.get(f"{layer}_{field}", "0")
+        return int(v) if v.lstrip("-").isdigit() else 0     # RTE_IFM 같은 심볼은 0
+
+    table = []
+    for i, name in enumerate(names):
+        table.append(LayerCfg(
+            name=name, conv=name in conv_names,
+            row=val(name, "ROW"), col=val(name, "COL"),
+            cin=4 * val(name, "CHANNEL"), cout=4 * val(name, "CHANNEL_OUT"),
+            maxpool=val(name, "MAXPOOL_STRIDE") if val(name, "MAXPOOL") else 0,
+            upsample=bool(val(name, "UPSAMPLE")), route_load=bool(val(name, "ROUTE_LOAD")),
+            route_save=bool(val(name, "ROUTE_SAVE")),
+            route_loc=route_locs.get(defs.get(f"{name}_ROUTE_LOC", "0"), "ifm"),
+            route_offset=val(name, "ROUTE_OFFSET"), ofm_save=bool(val(name, "OFM_SAVE")),
+            first=i == 0,
+        ))
+    return table
+
+
+# ------------------------------
+# 모델
+# ------------------------------
+def _dma_cycles(nbytes: int, hw: HwConfig) -> float:
+    if nbytes <= 0:
+        return 0.0
+    requests = math.ceil(nbytes / (hw.burst_words * 4))
+    return requests * hw.dma_latency + nbytes / hw.bytes_per_cycle
+
+
+def _out_size(l: LayerCfg) -> tuple[int, int]:
+    # stride 1 maxpool은 (yolov3-tiny처럼) 패딩해서 크기 유지
+    if l.maxpool >= 2:
+        return l.row // l.maxpool, l.col // l.maxpool
+    return l.row, l.col
+
+
+def estimate_layer(l: LayerCfg, hw: HwConfig) -> dict:
+    """
+    레이어 하나의 cycle / DRAM 추정 (cnn_ctrl 순서: chn_out → row → chn → col)\n
+    conv: tile마다 CSYNC(filter load) → DATA(H*W*ceil(Cin/Tin) cycle) 이고,
+    레이어 앞뒤에 PSYNC(bias/scale load, OFM flush)가 있다.
+    save / route / upsample: 워드당 1 cycle 복사로 근사
+    """
+    H, W = l.row, l.col
+    oh, ow = _out_size(l)
+    row = {"layer": l.name, "type": "conv" if l.conv else
+           ("upsample" if l.upsample else "route" if l.route_load else "save" if l.ofm_save else "pass"),
+           "shape": f"{H}x{W}x{l.cin}->{l.cout}", "macs": 0, "compute_cycles": 0.0,
+           "dram_read_bytes": 0, "dram_write_bytes": 0, "dma_cycles": 0.0, "stall_cycles": 0.0,
+           "warnings": []}
+    if l.first:
+        row["dram_read_bytes"] += H * W * l.cin
+
+    if l.conv:
+        tiles = math.ceil(l.cout / hw.tout)
+        chn = math.ceil(l.cin / hw.tin)
+        data = H * W * chn
+        row["macs"] = H * W * l.cin * l.cout * hw.k * hw.k
+        row["compute_cycles"] = float(tiles * (data + hw.pipe_delay))
+
+        filt_tile = l.cin * hw.tout * hw.k * hw.k
+        affine = 2 * l.cout * 4
+        row["dram_read_bytes"] += tiles * filt_tile + affine
+        filt_cycles = tiles * _dma_cycles(filt_tile, hw)
+        if hw.overlap_filter:
+            # 첫 tile만 드러나고 나머지는 연산 뒤에 숨는다
+            per_tile = _dma_cycles(filt_tile, hw)
+            filt_stall = per_tile + (tiles - 1) * max(0.0, per_tile - (data + hw.pipe_delay))
+        else:
+            filt_stall = filt_cycles
+        ifm_cycles = _dma_cycles(H * W * l.cin, hw) if l.first else 0.0
+        aff_cycles = _dma_cycles(affine, hw)
+        row["dma_cycles"] = filt_cycles + aff_cycles + ifm_cycles
+        row["stall_cycles"] = filt_stall + aff_cycles + ifm_cycles
+
+        if l.cin > hw.filter_buffer_depth:
+            row["warnings"].append(f"filter buffer: {l.cin} > {hw.filter_buffer_depth}")
+        if W * chn > hw.ifm_row_buffer_depth:
+            row["warnings"].append(f"ifm row buffer: {W * chn} > {hw.ifm_row_buffer_depth}")
+        if H * W * chn > hw.fm_buffer_depth:
+            row["warnings"].append(f"fm buffer: {H * W * chn} > {hw.fm_buffer_depth}")
+        if W > hw.psum_buffer_depth:
+            row["warnings"].append(f"psum buffer: {W} > {hw.psum_buffer_depth}")
+    else:
+        words = H * W * math.ceil(l.cin / 4)
+        row["compute_cycles"] = float(words * (4 if l.upsample else 1))
+        if l.ofm_save:
+            nbytes = oh * ow * l.cout
+            row["dram_write_bytes"] = nbytes
+            row["dma_cycles"] = _dma_cycles(nbytes, hw)
+            row["stall_cycles"] = row["dma_cycles"]
+
+    row["cycles"] = row["compute_cycles"] + row["stall_cycles"]
+    row["bound"] = "memory" if row["dma_cycles"] > row["compute_cycles"] else "compute"
+    peak = hw.tin * hw.tout * hw.k * hw.k
+    row["mac_util"] = row["macs"] / (row["cycles"] * peak) if row["macs"] and row["cycles"] else 0.0
+    row["time_us"] = row["cycles"] / hw.clock_mhz
+    return row
+
+
+def estimate(table: list[LayerCfg], hw: HwConfig) -> dict:
+    """반환: {"layers": [...], "cycles", "fps", "dram_bytes", ...}"""
+    rows = [estimate_layer(l, hw) for l in table]
+    cycles = sum(r["cycles"] for r in rows)
+    return {
+        "hw": hw,
+        "layers": rows,
+        "cycles": cycles,
+        "time_ms": cycles / hw.clock_mhz / 1e3,
+        "fps": hw.clock_mhz * 1e6 / cycles if cycles else 0.0,
+        "dram_bytes": sum(r["dram_read_bytes"] + r["dram_write_bytes"] for r in rows),
+        "stall_cycles": sum(r["stall_cycles"] for r in rows),
+        "memory_bound": [r["layer"] for r in rows if r["bound"] == "memory"],
+    }
+
+
+def sweep(table: list[LayerCfg], base: HwConfig, **axes: list) -> list[dict]:
+    """HwConfig 필드별 값 목록의 전체 조합에 대해 estimate (예: tin=[4, 8], clock_mhz=[100, 200])"""
+    results = [{}]
+    for field_name, values in axes.items():
+        results = [{**r, field_name: v} for r in results for v in values]
+    return [estimate(table, replace(base, **combo)) for combo in results]
@@ -0,0 +1,187 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+@dataclass
+class StageRecord:
+    name: str
+    path: str               # 상위 stage 이름을 '/'로 이은 경로 (예: graph/L00.conv/run_layer_fused)
+    start: float            # 프로파일 시작 기준 초
+    wall: float
+    cpu: float
+    peak_bytes: int | None  # stage 시작 시점 대비 tracemalloc peak 증가량
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Frame:
+    name: str
+    path: str
+    t0: float
+    c0: float
+    mem0: int = 0
+    peak: int = 0
+
+
+class Profiler:
+    """
+    stage별 wall / CPU 시간과 tracemalloc peak 기록 (opt-in)\n
+    비활성 상태에서 stage()는 nullcontext라 호출 비용만 든다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.records: list[StageRecord] = []
+        self._stack: list[_Frame] = []
+        self._t_origin = 0.0
+        self._started_tracemalloc = False
+
+    def enable(self, trace_memory: bool = True) -> None:
+        self.enabled = True
+        self.trace_memory = trace_memory
+        self.records.clear()
+        self._t_origin = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # ------------------------------
+    # 기록
+    # ------------------------------
+    def stage(self, name: str, **meta: Any):
+        if not self.enabled:
+            return nullcontext()
+        return self._stage(name, meta)
+
+    @contextmanager
+    def _stage(self, name: str, meta: dict[str, Any]) -> Iterator[None]:
+        path = f"{self._stack[-1].path}/{name}" if self._stack else name
+        frame = _Frame(name, path, time.perf_counter(), time.process_time())
+        if self.trace_memory:
+            cur, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            frame.mem0, frame.peak = cur, cur
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame.t0
+            cpu = time.process_time() - frame.c0
+            peak = None
+            if self.trace_memory:
+                frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                peak = frame.peak - frame.mem0
+                if self._stack:
+                    self._stack[-1].peak = max(self._stack[-1].peak, frame.peak)
+                tracemalloc.reset_peak()
+            self.records.append(StageRecord(name, path, frame.t0 - self._t_origin,
+                                            wall, cpu, peak, meta))
+
+    # ------------------------------
+    # 출력
+    # ------------------------------
+    def summary(self) -> list[dict]:
+        """stage 경로별 합계 (처음 등장한 순서)"""
+        rows: dict[str, dict] = {}
+        for r in sorted(self.records, key=lambda r: r.start):
+            row = rows.setdefault(r.path, {"path": r.path, "calls": 0, "wall_s": 0.0,
+                                           "cpu_s": 0.0, "peak_bytes": None})
+            row["calls"] += 1
+            row["wall_s"] += r.wall
+            row["cpu_s"] += r.cpu
+            if r.peak_bytes is not None:
+                row["peak_bytes"] = max(row["peak_bytes"] or 0, r.peak_bytes)
+        return list(rows.values())
+
+    def print_summary(self, log: Callable[[str], None] = print) -> None:
+        log(f"{'stage':<48} {'calls':>5} {'wall(ms)':>10} {'cpu(ms)':>10} {'peak(KiB)':>10}")
+        for row in self.summary():
+            depth = row["path"].count("/")
+            name = "  " * depth + row["path"].rsplit("/", 1)[-1]
+            peak = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1024:.1f}"
+            log(f"{name:<48} {row['calls']:>5} {row['wall_s'] * 1e3:>10.2f} "
+                f"{row['cpu_s'] * 1e3:>10.2f} {peak:>10}")
+
+    def dump_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "records": [vars(r) for r in sorted(self.records, key=lambda r: r.start)],
+            "summary": self.summary(),
+        }
+        path.write_text(json.dumps(data, indent=2, default=str))
+
+    def dump_chrome_trace(self, path: Path) -> None:
+        """chrome://tracing / Perfetto 에서 열 수 있는 trace event 형식"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pid = os.getpid()
+        events = [{
+            "name": r.name,
+            "cat": r.path.split("/", 1)[0],
+            "ph": "X",
+            "ts": r.start * 1e6,
+            "dur": r.wall * 1e6,
+            "pid": pid,
+            "tid": 0,
+            "args": {"cpu_ms": r.cpu * 1e3, "peak_bytes": r.peak_bytes, **r.meta},
+        } for r in self.records]
+        path.write_text(json.dumps({"traceEvents": events}, default=str))
+
+
+PROFILER = Profiler()
+
+
+def stage(name: str, **meta: Any):
+    """전역 프로파일러 stage (비활성이면 아무것도 하지 않음)"""
+    return PROFILER.stage(name, **meta)
+
+
+def profiled(name: str | None = None) -> Callable:
+    """함수 호출 전체를 stage로 기록하는 decorator"""
+    def deco(fn: Callable) -> Callable:
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return fn(*args, **kwargs)
+            with PROFILER.stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def enable(trace_memory: bool = True) -> Profiler:
+    PROFILER.enable(trace_memory)
+    return PROFILER
+
+
+def finish(json_path: Path | None = None, trace_path: Path | None = None,
+           log: Callable[[str], None] = print) -> None:
+    """요약 표 출력 + (선택) JSON / Chrome trace 저장 후 비활성화"""
+    if not PROFILER.enabled:
+        return
+    PROFILER.print_summary(log)
+    if json_path is not None:
+        PROFILER.dump_json(json_path)
+        log(f"profile json: {json_path}")
+    if trace_path is not None:
+        PROFILER.dump_chrome_trace(trace_path)
+        log(f"chrome trace: {trace_path}")
+    PROFILER.disable()
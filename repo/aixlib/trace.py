@@ -0,0 +1,281 @@
+import json
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .layout import DramLayout
+from .perf import HwConfig, LayerCfg
+from .profiling import profiled
+
+
+# ------------------------------
+# DRAM access trace
+#   [0, 4096)   header: struct(magic, version, header_bytes, json_len) + JSON (kinds, layers, 설정, count)
+#   [4096, ...) TRACE_DTYPE 레코드 (DMA 요청 하나 = 16워드 = 64B 단위)
+# ------------------------------
+TRACE_MAGIC = b"AIXTRACE"
+TRACE_VERSION = 1
+TRACE_HEADER_BYTES = 4096
+_HEAD = struct.Struct("<8sIII")     # magic, version, header_bytes, json_len
+
+TRACE_DTYPE = np.dtype([
+    ("cycle", "<u8"),       # 요청 발행 시점 (추정)
+    ("addr", "<u4"),        # byte 주소 (space 기준)
+    ("nbytes", "<u2"),      # 요청 안의 유효 byte (요청 자체는 항상 burst 길이)
+    ("op", "u1"),           # 0: read, 1: write
+    ("kind", "u1"),         # TRACE_KINDS index
+    ("layer", "u1"),        # header "layers" index
+    ("space", "u1"),        # 0: DRAM, 1: on-chip (route buffer / IFM buffer)
+])
+TRACE_KINDS = ("ifm", "filter", "bias", "scale", "ofm", "route_save", "route_load")
+READ, WRITE = 0, 1
+DRAM, ONCHIP = 0, 1
+
+
+def _requests(cycle: float, addr: int, nbytes: int, op: int, kind: str, layer: int, space: int,
+              hw: HwConfig) -> tuple[np.ndarray, float]:
+    """
+    nbytes 전송 -> 요청(burst_words 워드) 레코드 배열, 끝난 시점\n
+    요청은 하나씩 직렬 발행 (rd_inflight), 요청마다 dma_latency + 대역폭 시간
+    """
+    req = hw.burst_words * 4
+    n = -(-nbytes // req)
+    rec = np.zeros(n, dtype=TRACE_DTYPE)
+    if n == 0:
+        return rec, cycle
+    step = hw.dma_latency + req / hw.bytes_per_cycle if space == DRAM else hw.burst_words
+    rec["cycle"] = (cycle + step * np.arange(n)).astype(np.uint64)
+    rec["addr"] = addr + req * np.arange(n, dtype=np.int64)
+    rec["nbytes"] = req
+    rec["nbytes"][-1] = nbytes - req * (n - 1)
+    rec["op"] = op
+    rec["kind"] = TRACE_KINDS.index(kind)
+    rec["layer"] = layer
+    rec["space"] = space
+    return rec, cycle + step * n
+
+
+def iter_trace(table: list[LayerCfg], plan: DramLayout, hw: HwConfig, frames: int = 1,
+               route_dram_offset: int | None = None) -> Iterator[np.ndarray]:
+    """
+    레이어 schedule(cnn_ctrl 순서) -> 레이어마다 TRACE_DTYPE 배열\n
+    conv: (첫 레이어면 IFM) → bias → scale → [filter tile → DATA] x ceil(Cout/Tout) → (route save)\n
+    save 레이어: OFM 영역(plan.ofm)에 쓰기, route load 레이어: route 위치에서 읽기.\n
+    route 데이터는 RTL에서 on-chip (RTE_IFM / RTE_BUF)이고, route_dram_offset을 주면
+    DRAM의 그 주소로 내보내고 다시 읽는다고 가정한다 (RTE_DRAM 검토용).
+    """
+    cycle = 0.0
+    for _ in range(frames):
+        ofm_addr = plan.ofm.offset
+        route_addr = route_dram_offset
+        routes: dict[str, int] = {}         # route save 레이어 -> DRAM 주소
+        for li, l in enumerate(table):
+            recs = []
+            tiles = -(-l.cout // hw.tout)
+            chn = -(-l.cin // hw.tin)
+            if l.first:
+                r, cycle = _requests(cycle, plan.sections["ifm"].offset, l.row * l.col * l.cin,
+                                     READ, "ifm", li, DRAM, hw)
+                recs.append(r)
+            if l.conv:
+                for kind in ("bias", "scale"):
+                    b = plan.block(kind, l.name)
+                    r, cycle = _requests(cycle, b.offset, b.nbytes, READ, kind, li, DRAM, hw)
+                    recs.append(r)
+                filt = plan.block("filter", l.name)
+                tile_bytes = l.cin * hw.tout * hw.k * hw.k
+                compute = l.row * l.col * chn + hw.pipe_delay
+                # overlap_filter: 다음 tile filter를 현재 tile 연산 시작과 함께 발행 (filter buffer 2개 가정)
+                load_at, done = cycle, cycle
+                for t in range(tiles):
+                    nbytes = min(tile_bytes, filt.nbytes - t * tile_bytes)
+                    r, loaded = _requests(load_at, filt.offset + t * tile_bytes, nbytes, READ, "filter", li, DRAM, hw)
+                    recs.append(r)
+                    start = max(loaded, done)
+                    done = start + compute
+                    load_at = start if hw.overlap_filter else done
+                cycle = done
+            else:
+                cycle += l.row * l.col * chn * (4 if l.upsample else 1)
+
+            if l.route_save:
+                nbytes = l.row * l.col * l.cout
+                if route_addr is not None:
+                    routes[l.name] = route_addr
+                    r, cycle = _requests(cycle, route_addr, nbytes, WRITE, "route_save", li, DRAM, hw)
+                    route_addr += nbytes + (-nbytes) % (hw.burst_words * 4)
+                else:
+                    r, _ = _requests(cycle, l.route_offset * 4, nbytes, WRITE, "route_save", li, ONCHIP, hw)
+                recs.append(r)
+            if l.route_load:
+                nbytes = l.row * l.col * l.cin
+                src = _route_source(table, li)
+                if src in routes:
+                    r, cycle = _requests(cycle, routes[src], nbytes, READ, "route_load", li, DRAM, hw)
+                else:
+                    r, _ = _requests(cycle, l.route_offset * 4, nbytes, READ, "route_load", li, ONCHIP, hw)
+                recs.append(r)
+            if l.ofm_save:
+                oh, ow = (l.row // l.maxpool, l.col // l.maxpool) if l.maxpool >= 2 else (l.row, l.col)
+                nbytes = oh * ow * l.cout
+                r, cycle = _requests(cycle, ofm_addr, nbytes, WRITE, "ofm", li, DRAM, hw)
+                ofm_addr += nbytes
+                recs.append(r)
+            yield np.concatenate(recs) if recs else np.zeros(0, dtype=TRACE_DTYPE)
+
+
+def _route_source(table: list[LayerCfg], li: int) -> str | None:
+    """route load 레이어 li가 읽는 route save 레이어 (같은 위치에 마지막으로 저장한 것)"""
+    load = table[li]
+    for l in reversed(table[:li]):
+        if l.route_save and l.route_loc == load.route_loc and l.route_offset == load.route_offset:
+            return l.name
+    return None
+
+
+# ------------------------------
+# 파일
+# ------------------------------
+def _pack_header(meta: dict) -> bytes:
+    js = json.dumps(meta, separators=(",", ":")).encode()
+    if _HEAD.size + len(js) > TRACE_HEADER_BYTES:
+        raise ValueError(f"trace header too large: {len(js)} bytes")
+    head = _HEAD.pack(TRACE_MAGIC, TRACE_VERSION, TRACE_HEADER_BYTES, len(js)) + js
+    return head + b"\0" * (TRACE_HEADER_BYTES - len(head))
+
+
+@profiled()
+def write_trace(path: Path, chunks: Iterable[np.ndarray], meta: dict | None = None) -> int:
+    """레코드 chunk stream -> trace 파일 (header는 마지막에 count와 함께 기록). 반환: 레코드 수"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("wb") as f:
+        f.write(b"\0" * TRACE_HEADER_BYTES)
+        for c in chunks:
+            f.write(np.ascontiguousarray(c, dtype=TRACE_DTYPE).tobytes())
+            count += c.size
+        f.seek(0)
+        f.write(_pack_header({"kinds": list(TRACE_KINDS), "record_bytes": TRACE_DTYPE.itemsize,
+                              "count": count, **(meta or {})}))
+    return count
+
+
+def read_trace(path: Path) -> tuple[dict, np.ndarray]:
+    """반환: (header JSON, TRACE_DTYPE memmap)"""
+    if not path.is_file():
+        raise FileNotFoundError(f"trace not found: {path}")
+    with path.open("rb") as f:
+        raw = f.read(TRACE_HEADER_BYTES)
+    if len(raw) < _HEAD.size:
+        raise ValueError(f"{path}: not a trace file (too short)")
+    magic, version, header_bytes, js_len = _HEAD.unpack_from(raw)
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError(f"{path}: not a trace file (magic={magic!r}, version={version})")
+    meta = json.loads(raw[_HEAD.size:_HEAD.size + js_len])
+    if meta["count"] == 0:
+        return meta, np.zeros(0, dtype=TRACE_DTYPE)
+    return meta, np.memmap(path, dtype=TRACE_DTYPE, mode="r", offset=header_bytes, shape=(meta["count"],))
+
+
+# ------------------------------
+# 요약
+# ------------------------------
+def reuse_distances(lines: np.ndarray) -> np.ndarray:
+    """
+    line 번호 sequence -> 접근별 reuse(stack) distance\n
+    직전 접근 이후 접근된 서로 다른 line 수, 처음 접근이면 -1 (Fenwick tree, O(n log n))
+    """
+    n = lines.size
+    out = np.full(n, -1, dtype=np.int64)
+    _, inv = np.unique(lines, return_inverse=True)
+    last = np.full(inv.max() + 1 if n else 0, -1, dtype=np.int64)
+    prev = np.empty(n, dtype=np.int64)
+    for i, u in enumerate(inv):
+        prev[i] = last[u]
+        last[u] = i
+    # 위치 i에 "i가 해당 line의 가장 최근 접근"이면 1
+    tree = [0] * (n + 1)
+
+    def add(i: int, v: int) -> None:
+        i += 1
+        while i <= n:
+            tree[i] += v
+            i += i & -i
+
+    def prefix(i: int) -> int:
+        s = 0
+        while i > 0:
+            s += tree[i]
+            i -= i & -i
+        return s
+
+    for i in range(n):
+        p = int(prev[i])
+        if p >= 0:
+            out[i] = prefix(i) - prefix(p + 1)
+            add(p, -1)
+        add(i, 1)
+    return out
+
+
+def summarize_trace(records: np.ndarray, layers: list[str], line_bytes: int = 64,
+                    page_bytes: int = 4096, burst_bytes: int = 64) -> dict:
+    """
+    bytes (kind / 레이어 / read·write별), DRAM read의 reuse distance 분포 (line_bytes 단위,
+    2의 거듭제곱 구간), burst 이용률 (유효 byte / 요청 byte, page 경계로 쪼개진 burst 수)
+    """
+    dram = records[records["space"] == DRAM]
+    onchip = records[records["space"] == ONCHIP]
+    nbytes = dram["nbytes"].astype(np.int64)
+    out = {
+        "records": int(records.size),
+        "cycles": int(records["cycle"].max()) if records.size else 0,
+        "dram_read_bytes": int(nbytes[dram["op"] == READ].sum()),
+        "dram_write_bytes": int(nbytes[dram["op"] == WRITE].sum()),
+        "onchip_bytes": int(onchip["nbytes"].astype(np.int64).sum()),
+        "by_kind": {k: int(nbytes[dram["kind"] == i].sum()) for i, k in enumerate(TRACE_KINDS)
+                    if (dram["kind"] == i).any()},
+        "by_layer": {layers[i]: int(nbytes[dram["layer"] == i].sum()) for i in np.unique(dram["layer"])},
+    }
+
+    # burst: 요청은 항상 burst_bytes를 읽고 쓴다
+    addr = dram["addr"].astype(np.int64)
+    split = (addr // page_bytes) != ((addr + burst_bytes - 1) // page_bytes)
+    out["burst"] = {
+        "requests": int(dram.size),
+        "bursts": int(dram.size + split.sum()),
+        "useful_bytes": int(nbytes.sum()),
+        "moved_bytes": int(dram.size * burst_bytes),
+        "utilization": float(nbytes.sum() / (dram.size * burst_bytes)) if dram.size else 0.0,
+        "misaligned": int((addr % burst_bytes != 0).sum()),
+    }
+
+    reads = dram[dram["op"] == READ]
+    d = reuse_distances(reads["addr"].astype(np.int64) // line_bytes)
+    reused = d[d >= 0]
+    buckets = {}
+    if reused.size:
+        edges = 1 << np.arange(0, int(reused.max()).bit_length() + 1)
+        idx = np.searchsorted(edges, reused, side="right")
+        for b, c in zip(*np.unique(idx, return_counts=True)):
+            buckets[f"<{int(edges[b])}"] = int(c)
+    out["reuse"] = {
+        "line_bytes": line_bytes,
+        "accesses": int(d.size),
+        "cold": int((d < 0).sum()),
+        "histogram": buckets,           # 구간 상한(line 수) -> 접근 수
+        "median_lines": int(np.median(reused)) if reused.size else None,
+    }
+    return out
+
+
+def cache_hit_rate(summary: dict, cache_bytes: int) -> float:
+    """LRU cache(cache_bytes) 가정 시 DRAM read hit 비율 (reuse distance < cache line 수)"""
+    r = summary["reuse"]
+    if not r["accesses"]:
+        return 0.0
+    lines = cache_bytes // r["line_bytes"]
+    hits = sum(c for k, c in r["histogram"].items() if int(k[1:]) <= lines)
+    return hits / r["accesses"]
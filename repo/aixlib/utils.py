@@ -1,140 +1,11 @@
-import json
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
+import numpy as np
 
-
-KERNEL_SIZE = 3  # 3x3
-
-
-@dataclass(frozen=False)
-class TCParams:
-    testcase_no: int
-    width: int
-    height: int
-    cin: int
-    cout: int
-    ifm_hex: Path
-    filter_hex: Path
-    bias_hex: Path
-    scale_hex: Path
-
-    out_feamap_dir: Path
-    out_param_packed_dir: Path
-    out_expect_dir: Path
-    out_dram_dir: Path
-    out_ifm_hex: Path
-    out_weight_hex: Path
-    out_affine_hex: Path
-    out_conv_result_hex: Path
-    out_affine_result_hex: Path
-    out_maxpool_stride1_result_hex: Path
-    out_maxpool_stride2_result_hex: Path
-    out_upsample_result_hex: Path
-    out_golden_hex: Path
-    out_memory_hex: Path
-    
-    
-    
-def _require_pos_int(cfg: dict[str, Any], key: str) -> int:
-    v = cfg.get(key, None)
-    if not isinstance(v, int) or v <= 0:
-        raise ValueError(f"'{key}' must be a positive integer")
-    return v
-
-
-def _require_str_path(cfg: dict[str, Any], key: str) -> Path:
-    s = cfg.get(key, None)
-    if not isinstance(s, str) or not s:
-        raise ValueError(f"'{key}' must be a non-empty string (path)")
-    p = Path(s).expanduser()
-    if not p.is_absolute():
-        p = (Path.cwd() / p).resolve()
-    return p
- 
-
-def _abs_path(p: Path) -> Path:
-    p = p.expanduser()
-    if not p.is_absolute():
-        p = (Path.cwd() / p).resolve()
-    return p
-
-
-
-def load_params(args_path: Path) -> TCParams:
-    args_path = _abs_path(args_path)
-    if not args_path.is_file():
-        raise FileNotFoundError(f"args file not found: {args_path}")
-
-    with args_path.open("r", encoding="utf-8") as f:
-        cfg = json.load(f)
-
-    tc_no = _require_pos_int(cfg, "testcase_no")
-    w     = _require_pos_int(cfg, "width")
-    h     = _require_pos_int(cfg, "height")
-    cin   = _require_pos_int(cfg, "cin")
-    cout  = _require_pos_int(cfg, "cout")
-
-    ifm      = _require_str_path(cfg, "ifm_hex")
-    filter_p = _require_str_path(cfg, "filter_hex")
-    bias_p    = _require_str_path(cfg, "bias_hex")
-    scale_p   = _require_str_path(cfg, "scale_hex")
-
-    if not ifm.is_file():
-        raise FileNotFoundError(f"IFM hex not found: {ifm}")
-    if not filter_p.is_file():
-        raise FileNotFoundError(f"FILTER hex not found: {filter_p}")
-    if not bias_p.is_file():
-        raise FileNotFoundError(f"BIAS hex not found: {bias_p}")
-    if not scale_p.is_file():
-        raise FileNotFoundError(f"SCALE hex not found: {scale_p}")
-
-    out_feamap_dir       = _abs_path(Path("hw") / "inout_data" / "feamap")
-    out_param_packed_dir = _abs_path(Path("hw") / "inout_data" / "param_packed")
-    out_expect_dir       = _abs_path(Path("hw") / "inout_data" / "expect")
-    out_dram_dir         = _abs_path(Path("hw") / "inout_data" / "dram")
-
-    out_feamap_dir.mkdir(parents=True, exist_ok=True)
-    out_param_packed_dir.mkdir(parents=True, exist_ok=True)
-    out_expect_dir.mkdir(parents=True, exist_ok=True)
-    out_dram_dir.mkdir(parents=True, exist_ok=True)
-
-    out_ifm_hex    = out_feamap_dir       / f"test{tc_no}_input_32b.hex"
-    out_weight_hex = out_param_packed_dir / f"test{tc_no}_param_packed_weight.hex"
-    out_affine_hex = out_param_packed_dir / f"test{tc_no}_affine_param.hex"
-    out_memory_hex = out_dram_dir         / f"test{tc_no}_memory_16b.hex"
-    
-    out_conv_result_hex = out_expect_dir     / f"test{tc_no}_conv_result_32b.hex"
-    out_affine_result_hex = out_expect_dir   / f"test{tc_no}_affine_result_32b.hex"
-    out_maxpool_stride1_result_hex = out_expect_dir  / f"test{tc_no}_maxpool_stride1_result_32b.hex"
-    out_maxpool_stride2_result_hex = out_expect_dir  / f"test{tc_no}_maxpool_stride2_result_32b.hex"
-    out_upsample_result_hex = out_expect_dir / f"test{tc_no}_upsample_result_32b.hex"
-    
-    out_golden_hex = out_expect_dir        / f"test{tc_no}_output_32b.hex"
-
-    return TCParams(
-        testcase_no=tc_no,
-        width=w, height=h, cin=cin, cout=cout,
-        ifm_hex=ifm, filter_hex=filter_p,
-        bias_hex=bias_p, scale_hex=scale_p,
-        out_feamap_dir=out_feamap_dir,
-        out_param_packed_dir=out_param_packed_dir,
-        out_expect_dir=out_expect_dir,
-        out_dram_dir=out_dram_dir,
-        out_ifm_hex=out_ifm_hex,
-        out_weight_hex=out_weight_hex,
-        out_affine_hex=out_affine_hex,
-        out_conv_result_hex=out_conv_result_hex,
-        out_affine_result_hex=out_affine_result_hex,
-        out_maxpool_stride1_result_hex=out_maxpool_stride1_result_hex,
-        out_maxpool_stride2_result_hex=out_maxpool_stride2_result_hex,
-        out_upsample_result_hex=out_upsample_result_hex,
-        out_golden_hex=out_golden_hex,
-        out_memory_hex=out_memory_hex,
-    )
-    
+from .packers import filter_bytes
+from .profiling import profiled
+from .tcparams import TCParams, load_params     # 기존 import 경로 (aixlib.utils.TCParams) 유지
 
 
+KERNEL_SIZE = 3  # 3x3
 
 
 def read_lsb_1byte(in_list: list[str]) -> list[str]:
@@ -151,21 +22,45 @@ def read_lsb_1byte(in_list: list[str]) -> list[str]:
 
 
 
-def pad_1x1_to_3x3(filter_src: list[str], C: int, M: int) -> list[str]:
+def filter_tensor(filter_src: list[str] | np.ndarray, Cin: int, Cout: int, K: int = 3) -> np.ndarray:
+    """weight source (hex 문자열 리스트 / 배열, cout → cin → k 순) -> (Cout, Cin, K, K) int8"""
+    w = filter_bytes(filter_src)
+    n = Cout * Cin * K * K
+    if w.size < n:
+        raise ValueError(f"not enough weights: have={w.size} need={n} (Cout={Cout} Cin={Cin} K={K})")
+    return w[:n].view(np.int8).reshape(Cout, Cin, K, K)
+
+
+def pad_1x1_to_3x3(filter_src: list[str] | np.ndarray, C: int, M: int) -> np.ndarray:
+    """
+    1x1 filter를 3x3 가운데(tap 4)에 두고 나머지는 0인 (M, C, 3, 3) int8로 변환
+    """
+    w = filter_tensor(filter_src, C, M, 1)
+    return np.pad(w, ((0, 0), (0, 0), (1, 1), (1, 1)), mode="constant", constant_values=0)
+
+
+def pad_filter_cin_to_mult4(filter_src: list[str] | np.ndarray, Cin: int, Cout: int, K: int = 3) -> np.ndarray:
+    """Cin 채널 수가 4의 배수가 되도록 zero-padding. 반환: (Cout, ceil4(Cin), K, K) int8"""
+    w = filter_tensor(filter_src, Cin, Cout, K)
+    return np.pad(w, ((0, 0), (0, (-Cin) % 4), (0, 0), (0, 0)), mode="constant", constant_values=0)
+
+
+def pad_filter_cout_to_mult4(filter_src: list[str] | np.ndarray, Cin: int, Cout: int, K: int = 3) -> np.ndarray:
+    """Cout 채널 수가 4의 배수가 되도록 zero 출력 채널 추가. 반환: (ceil4(Cout), Cin, K, K) int8"""
+    w = filter_tensor(filter_src, Cin, Cout, K)
+    return np.pad(w, ((0, (-Cout) % 4), (0, 0), (0, 0), (0, 0)), mode="constant", constant_values=0)
+
+
+@profiled()
+def normalize_filter(filter_src: list[str] | np.ndarray, cin_src: int, cout_src: int, K: int,
+                     cin: int, cout: int) -> np.ndarray:
     """
-    1x1 filter source를 받아 "00000000" 를 채워 3x3 filter source 생성
+    파라미터 파일 weight -> 하드웨어 shape (cout, cin, 3, 3) int8\n
+    cin/cout zero-padding (예: 3 -> 4, 195 -> 196) 과 1x1 -> 3x3 변환을 한 번에
     """
-    
-    out_filters: list[str] = []
-    idx = 0
-    for m in range(M):
-        for c in range(C):
-            val = filter_src[idx]
-            idx += 1
-            # 3x3 = 9개 중 가운데(인덱스 4)에 val, 나머지는 0
-            for i in range(9):
-                if i == 4:
-                    out_filters.append(val.lower().zfill(8))
-                else:
-                    out_filters.append("00000000")
-    return out_filters
+    if cin < cin_src or cout < cout_src or K not in (1, KERNEL_SIZE):
+        raise ValueError(f"cannot normalize filter: src=({cout_src}, {cin_src}, {K}x{K}) -> ({cout}, {cin}, 3x3)")
+    w = filter_tensor(filter_src, cin_src, cout_src, K)
+    k_pad = (KERNEL_SIZE - K) // 2
+    return np.pad(w, ((0, cout - cout_src), (0, cin - cin_src), (k_pad, k_pad), (k_pad, k_pad)),
+                  mode="constant", constant_values=0)
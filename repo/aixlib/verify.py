@@ -1,5 +1,6 @@
 from .utils import KERNEL_SIZE, TCParams
-from .io_hex import read_32b_hex_lines
+from .feamap import FeatureMap
+from .profiling import profiled
 
 
 def _count_required_ifm_lines(width: int, height: int, cin: int) -> int:
@@ -12,7 +13,8 @@ def _count_required_affine_lines(cout: int) -> int:
     return cout
 
 
-def verify_inputs(params: TCParams, ifm_lines: list[str], filt_lines: list[str], bias_lines: list[str], scale_lines: list[str]) -> tuple:
+@profiled()
+def verify_inputs(params: TCParams, ifm_lines: list[str] | FeatureMap, filt_lines: list[str], bias_lines: list[str], scale_lines: list[str]) -> tuple:
     if (params.cin % 4 != 0) or (params.cout %4 != 0):
         raise ValueError(f"Cin/Cout must be multiple of 4")
     
@@ -20,7 +22,13 @@ def verify_inputs(params: TCParams, ifm_lines: list[str], filt_lines: list[str],
     need_flt = _count_required_filter_lines(params.cin, params.cout)
     need_aff = _count_required_affine_lines(params.cout)
 
-    if len(ifm_lines) < need_ifm:
+    if isinstance(ifm_lines, FeatureMap):
+        # 이전 레이어 출력을 그대로 받는 경우: 크기만 확인
+        have = (ifm_lines.height, ifm_lines.width, ifm_lines.padded_channels)
+        need = (params.height, params.width, params.cin)
+        if have != need:
+            raise ValueError(f"IFM shape mismatch: have(H,W,C)={have} need={need}")
+    elif len(ifm_lines) < need_ifm:
         raise ValueError(f"IFM data not enough: have={len(ifm_lines)} need={need_ifm}")
     if len(filt_lines) < need_flt:
         raise ValueError(f"FILTER data not enough: have={len(filt_lines)} need={need_flt}")
@@ -32,7 +40,10 @@ def verify_inputs(params: TCParams, ifm_lines: list[str], filt_lines: list[str],
     
     
     
-    out_ifm  = ifm_lines[:need_ifm]
+    if isinstance(ifm_lines, FeatureMap):
+        out_ifm = ifm_lines
+    else:
+        out_ifm = FeatureMap.from_hex(ifm_lines[:need_ifm], params.height, params.width, params.cin)
     out_filt = filt_lines[:need_flt]
     out_bias = bias_lines[:need_aff]
     out_scale = scale_lines[:need_aff]
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from .graph import Graph
+
+
+@dataclass(frozen=True)
+class ConvLayer:
+    """
+    conv 레이어 shape (하드웨어 기준, 채널은 4의 배수로 패딩된 값)\n
+    param   : 파라미터 파일 prefix (예: CONV00 -> CONV00_param_weight.hex)\n
+    cin_src / cout_src / kernel_src : 파라미터 파일 원본 shape (패딩 전)\n
+    maxpool : maxpool stride (0: 없음)
+    """
+    name: str
+    param: str
+    width: int
+    height: int
+    cin: int
+    cout: int
+    cin_src: int
+    cout_src: int
+    kernel_src: int = 3
+    maxpool: int = 0
+
+
+# layer   mode    size     input          output         note
+# L00     conv    3x3/1    256x256x3      256x256x16     cin 3 -> 4 padding
+#         max     2x2/2    256x256x16     128x128x16
+# L01     conv    3x3/1    128x128x16     128x128x32
+#         max     2x2/2    128x128x32     64x64x32
+# L02     conv    3x3/1    64x64x32       64x64x64
+#         max     2x2/2    64x64x64       32x32x64
+# L03     conv    3x3/1    32x32x64       32x32x128
+#         max     2x2/2    32x32x128      16x16x128
+# L04     conv    3x3/1    16x16x128      16x16x256      route save (-> L13)
+#         max     2x2/2    16x16x256      8x8x256
+# L05     conv    3x3/1    8x8x256        8x8x512
+#         max     2x2/1    8x8x512        8x8x512
+# L06     conv    1x1/1    8x8x512        8x8x256        route save (-> L10)
+# L07     conv    3x3/1    8x8x256        8x8x512
+# L08     conv    1x1/1    8x8x512        8x8x195        cout 195 -> 196 padding
+# L09     save (DRAM)
+# L10     route   L06
+# L11     conv    1x1/1    8x8x256        8x8x128
+# L12     upsample         8x8x128        16x16x128
+# L13     route   L12 L04                 16x16x384
+# L14     conv    1x1/1    16x16x384      16x16x195      cout 195 -> 196 padding
+# L15     save (DRAM)
+YOLO_LAYERS: tuple[ConvLayer, ...] = (
+    ConvLayer("L00", "CONV00", 256, 256,   4,  16,   3,  16, 3, maxpool=2),
+    ConvLayer("L01", "CONV02", 128, 128,  16,  32,  16,  32, 3, maxpool=2),
+    ConvLayer("L02", "CONV04",  64,  64,  32,  64,  32,  64, 3, maxpool=2),
+    ConvLayer("L03", "CONV06",  32,  32,  64, 128,  64, 128, 3, maxpool=2),
+    ConvLayer("L04", "CONV08",  16,  16, 128, 256, 128, 256, 3, maxpool=2),
+    ConvLayer("L05", "CONV10",   8,   8, 256, 512, 256, 512, 3, maxpool=1),
+    ConvLayer("L06", "CONV12",   8,   8, 512, 256, 512, 256, 1),
+    ConvLayer("L07", "CONV13",   8,   8, 256, 512, 256, 512, 3),
+    ConvLayer("L08", "CONV14",   8,   8, 512, 196, 512, 195, 1),
+    ConvLayer("L11", "CONV17",   8,   8, 256, 128, 256, 128, 1),
+    ConvLayer("L14", "CONV20",  16,  16, 384, 196, 384, 195, 1),
+)
+
+YOLO_INPUT = "ifm"
+
+# 출력(L09, L15 결과)이 기록되는 DRAM byte 주소 (yolo_layer_cfg.vh YOLO_DRAM_OFM_OFFSET)
+YOLO_DRAM_OFM_OFFSET = 8388608
+
+
+def yolo_layer(name: str) -> ConvLayer:
+    for layer in YOLO_LAYERS:
+        if layer.name == name:
+            return layer
+    raise KeyError(name)
+
+
+def add_conv_layer(g: Graph, layer: ConvLayer, src: str) -> str:
+    """conv -> affine (-> maxpool). 반환: affine 출력 이름 (maxpool 있으면 maxpool 출력)"""
+    x = g.conv(f"{layer.name}.conv", src, layer.name, layer.cout)
+    x = g.affine(f"{layer.name}.affine", x, layer.name)
+    if layer.maxpool:
+        x = g.maxpool(f"{layer.name}.maxpool", x, layer.maxpool)
+    return x
+
+
+def build_yolo_graph() -> Graph:
+    """tiny-YOLO (L00 ~ L15). 출력: L09(L08 결과), L15(L14 결과)"""
+    L = {layer.name: layer for layer in YOLO_LAYERS}
+    g = Graph()
+    x = g.input(YOLO_INPUT)
+
+    for name in ("L00", "L01", "L02", "L03", "L04", "L05", "L06", "L07", "L08"):
+        x = add_conv_layer(g, L[name], x)
+
+    g.save("L09", x)                                    # L08 -> DRAM
+    x = g.route("L10", "L06.affine")
+    x = add_conv_layer(g, L["L11"], x)
+    x = g.upsample("L12", x)
+    x = g.route("L13", x, "L04.affine")                 # {L12, L04} concat
+    x = add_conv_layer(g, L["L14"], x)
+    g.save("L15", x)                                    # L14 -> DRAM
+    return g
@@ -0,0 +1,309 @@
+"""
+aixlib 연산 벤치마크 (tiny-YOLO 레이어 shape 기준, 오프라인)
+
+    python repo/bench_ops.py                                  # 전체
+    python repo/bench_ops.py --layers L05,L14 --ops conv,affine
+    python repo/bench_ops.py --out bench.json                 # 결과 저장
+    python repo/bench_ops.py --baseline bench.json            # 회귀 검사 (느려지면 exit 1)
+    python repo/bench_ops.py --ops conv --import-repeat 0     # import 시간 측정 생략
+
+입력은 레이어 이름으로 seed를 고정한 난수라서 매번 같다.
+import 시간은 모듈마다 새 인터프리터에서 잰다 (도구를 반복 호출할 때의 시작 비용).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import (run_conv, run_affine_from_conv, maxpool_from_affine_words,
+                             upsample_words, concat_words, run_layer_fused)
+from aixlib.packers import pack_filter_72b, pack_filter_32b, pack_affine
+from aixlib.memory import memory_builder_monolayer
+from aixlib.yolo import YOLO_LAYERS, ConvLayer
+
+
+BENCH_VERSION = 1
+DEFAULT_THRESHOLD = 0.20        # baseline 대비 20% 이상 느려지면 회귀
+DEFAULT_MIN_DELTA_MS = 0.5      # 차이가 이보다 작으면 측정 잡음으로 보고 무시
+OPS = ("conv", "affine", "maxpool", "fused", "upsample", "concat",
+       "pack_filter_72b", "pack_filter_32b", "pack_affine", "memory")
+IMPORT_MODULES = ("aixlib", "aixlib.hexlite", "aixlib.io_hex", "aixlib.ops_conv",
+                  "aix", "make_testcase", "make_yolo_image")
+
+
+@dataclass
+class BenchCase:
+    op: str
+    layer: str
+    shape: str
+    fn: Callable[[], Any]
+    macs: int = 0           # conv 계열
+    words: int = 0          # 처리한 32b 워드 수 (입력 + 출력)
+
+
+# ------------------------------
+# synthetic 입력
+# ------------------------------
+def _rng(name: str) -> np.random.Generator:
+    return np.random.default_rng(int.from_bytes(name.encode(), "little") % (1 << 32))
+
+
+def _hex_list(values: np.ndarray) -> list[str]:
+    return [f"{int(v) & 0xFFFFFFFF:08x}" for v in values.reshape(-1)]
+
+
+def _layer_inputs(layer: ConvLayer) -> dict:
+    """레이어 shape에 맞는 IFM / weight src / bias / scale (모두 하드웨어 패딩 후 shape)"""
+    rng = _rng(layer.name)
+    C, M = layer.cin, layer.cout
+    ifm = FeatureMap(rng.integers(0, 256, (layer.height, layer.width, C), dtype=np.uint8))
+    weight_src = _hex_list(rng.integers(-128, 128, M * C * 9))
+    bias_src = _hex_list(rng.integers(-(1 << 12), 1 << 12, M))
+    scale_src = _hex_list(1 << rng.integers(4, 12, M))
+    return {"ifm": ifm, "weight_src": weight_src, "bias_src": bias_src, "scale_src": scale_src}
+
+
+def _quiet(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """run_conv 등의 print 출력 숨김"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+
+def build_cases(layers: list[ConvLayer], ops: tuple[str, ...]) -> list[BenchCase]:
+    cases: list[BenchCase] = []
+    for layer in layers:
+        d = _layer_inputs(layer)
+        H, W, C, M = layer.height, layer.width, layer.cin, layer.cout
+        shape = f"{H}x{W}x{C}->{M}"
+        ifm = d["ifm"]
+        filt_72b = pack_filter_72b(d["weight_src"])
+        filt_32b = pack_filter_32b(C, M, d["weight_src"])
+        affine = pack_affine(M, d["bias_src"], d["scale_src"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            conv = run_conv(ifm, filt_72b, M)
+        act = run_affine_from_conv(conv, affine)
+        in_words, out_words = H * W * C // 4, H * W * -(-M // 4)
+        macs = H * W * C * M * 9
+
+        if "conv" in ops:
+            cases.append(BenchCase("conv", layer.name, shape,
+                                   _quiet(lambda i=ifm, f=filt_72b, m=M: run_conv(i, f, m)),
+                                   macs=macs, words=in_words + H * W * M))
+        if "affine" in ops:
+            cases.append(BenchCase("affine", layer.name, shape,
+                                   lambda c=conv, a=affine: run_affine_from_conv(c, a),
+                                   words=H * W * M + out_words))
+        if "maxpool" in ops and layer.maxpool:
+            cases.append(BenchCase("maxpool", layer.name, f"{shape} s{layer.maxpool}",
+                                   lambda a=act, s=layer.maxpool: maxpool_from_affine_words(a, s),
+                                   words=out_words))
+        if "fused" in ops:
+            cases.append(BenchCase("fused", layer.name, f"{shape} s{layer.maxpool}",
+                                   lambda i=ifm, f=filt_72b, a=affine, m=M, s=layer.maxpool:
+                                       run_layer_fused(i, f, a, m, s),
+                                   macs=macs, words=in_words + out_words))
+        if "pack_filter_72b" in ops:
+            cases.append(BenchCase("pack_filter_72b", layer.name, shape,
+                                   lambda w=d["weight_src"]: pack_filter_72b(w),
+                                   words=M * C * 9))
+        if "pack_filter_32b" in ops:
+            cases.append(BenchCase("pack_filter_32b", layer.name, shape,
+                                   lambda w=d["weight_src"], c=C, m=M: pack_filter_32b(c, m, w),
+                                   words=M * C * 9))
+        if "pack_affine" in ops:
+            cases.append(BenchCase("pack_affine", layer.name, shape,
+                                   lambda b=d["bias_src"], s=d["scale_src"], m=M: pack_affine(m, b, s),
+                                   words=2 * M))
+        if "memory" in ops:
+            ifm_words = ifm.to_words()
+            cases.append(BenchCase("memory", layer.name, shape,
+                                   lambda i=ifm_words, f=filt_32b, b=d["bias_src"], s=d["scale_src"]:
+                                       memory_builder_monolayer(i, f, b, s),
+                                   words=ifm_words.size + len(filt_32b) + 2 * M))
+
+    # L12 upsample (8x8x128 -> 16x16x128), L13 route concat ({L12, L04} -> 16x16x384)
+    if "upsample" in ops:
+        fm = FeatureMap(_rng("L12").integers(0, 256, (8, 8, 128), dtype=np.uint8))
+        cases.append(BenchCase("upsample", "L12", "8x8x128 x2", lambda f=fm: upsample_words(f),
+                               words=8 * 8 * 32 * 5))
+    if "concat" in ops:
+        rng = _rng("L13")
+        a = FeatureMap(rng.integers(0, 256, (16, 16, 128), dtype=np.uint8))
+        b = FeatureMap(rng.integers(0, 256, (16, 16, 256), dtype=np.uint8))
+        cases.append(BenchCase("concat", "L13", "16x16x(128+256)", lambda a=a, b=b: concat_words(a, b),
+                               words=16 * 16 * 96 * 2))
+    return cases
+
+
+# ------------------------------
+# 측정
+# ------------------------------
+def measure(case: BenchCase, repeat: int) -> dict:
+    """wall time은 repeat회 중 최소값, peak 메모리는 tracemalloc으로 1회 따로 측정"""
+    case.fn()   # warm-up
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        case.fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    case.fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    wall = min(times)
+    return {
+        "op": case.op,
+        "layer": case.layer,
+        "shape": case.shape,
+        "wall_s": wall,
+        "macs_per_s": case.macs / wall if case.macs and wall else None,
+        "words_per_s": case.words / wall if case.words and wall else None,
+        "peak_bytes": peak,
+    }
+
+
+_IMPORT_PROBE = ("import sys, time; t0 = time.perf_counter(); import {}; "
+                 "print(time.perf_counter() - t0, 'numpy' in sys.modules)")
+
+
+def measure_imports(modules: tuple[str, ...], repeat: int) -> list[dict]:
+    """모듈별 import 시간 (새 인터프리터, repeat회 중 최소값)과 numpy까지 읽었는지"""
+    results = []
+    for mod in modules:
+        times = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(mod)], cwd=Path(__file__).parent,
+                                 capture_output=True, text=True, check=True).stdout.split()
+            times.append(float(out[0]))
+        results.append({"module": mod, "import_s": min(times), "numpy": out[1] == "True"})
+    return results
+
+
+def _meta() -> dict:
+    return {
+        "bench_version": BENCH_VERSION,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results: list[dict], baseline: dict, threshold: float,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list[dict]:
+    """baseline 대비 wall time 비율. 반환: 회귀 항목 목록"""
+    base = {(r["op"], r["layer"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = base.get((r["op"], r["layer"]))
+        if b is None or not b["wall_s"]:
+            r["vs_baseline"] = None
+            continue
+        r["vs_baseline"] = r["wall_s"] / b["wall_s"]
+        if r["vs_baseline"] > 1 + threshold and (r["wall_s"] - b["wall_s"]) * 1e3 > min_delta_ms:
+            regressions.append(r)
+    return regressions
+
+
+def _fmt_rate(v: float | None, unit: str) -> str:
+    if v is None:
+        return "-"
+    for scale, prefix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if v >= scale:
+            return f"{v / scale:.2f}{prefix}{unit}"
+    return f"{v:.1f}{unit}"
+
+
+def print_table(results: list[dict]) -> None:
+    print(f"{'op':<16} {'layer':<5} {'shape':<22} {'wall(ms)':>10} {'MAC/s':>10} "
+          f"{'word/s':>10} {'peak(KiB)':>10} {'vs base':>8}")
+    for r in results:
+        vs = r.get("vs_baseline")
+        print(f"{r['op']:<16} {r['layer']:<5} {r['shape']:<22} {r['wall_s'] * 1e3:>10.3f} "
+              f"{_fmt_rate(r['macs_per_s'], ''):>10} {_fmt_rate(r['words_per_s'], ''):>10} "
+              f"{r['peak_bytes'] / 1024:>10.1f} {'-' if vs is None else f'{vs:.2f}x':>8}")
+
+
+def print_imports(imports: list[dict], baseline: dict | None = None) -> None:
+    base = {r["module"]: r["import_s"] for r in (baseline or {}).get("imports", [])}
+    print(f"{'import':<18} {'ms':>8} {'numpy':>6} {'vs base':>8}")
+    for r in imports:
+        b = base.get(r["module"])
+        vs = f"{r['import_s'] / b:.2f}x" if b else "-"
+        print(f"{r['module']:<18} {r['import_s'] * 1e3:>8.1f} {'yes' if r['numpy'] else 'no':>6} {vs:>8}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="aixlib op benchmark over tiny-YOLO layer shapes")
+    ap.add_argument("--layers", default=None, help="쉼표 구분 레이어 (기본: 전체, 예: L00,L05)")
+    ap.add_argument("--ops", default=None, help=f"쉼표 구분 연산 (기본: 전체) {','.join(OPS)}")
+    ap.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    ap.add_argument("--out", type=Path, default=None, help="결과 JSON 저장 경로")
+    ap.add_argument("--baseline", type=Path, default=None, help="비교할 baseline JSON")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 판정 비율 (0.2 = 20%%)")
+    ap.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="회귀로 볼 최소 시간 차이 (ms)")
+    ap.add_argument("--import-repeat", type=int, default=3, help="import 시간 반복 횟수 (0: 측정 안 함)")
+    args = ap.parse_args(argv)
+
+    layers = list(YOLO_LAYERS)
+    if args.layers:
+        names = args.layers.split(",")
+        layers = [l for l in YOLO_LAYERS if l.name in names]
+        unknown = set(names) - {l.name for l in layers}
+        if unknown:
+            raise ValueError(f"unknown layer(s): {sorted(unknown)}")
+    ops = OPS
+    if args.ops:
+        ops = tuple(args.ops.split(","))
+        unknown = set(ops) - set(OPS)
+        if unknown:
+            raise ValueError(f"unknown op(s): {sorted(unknown)}")
+
+    results = [measure(c, args.repeat) for c in build_cases(layers, ops)]
+    imports = measure_imports(IMPORT_MODULES, args.import_repeat) if args.import_repeat > 0 else []
+
+    regressions = []
+    baseline = None
+    if args.baseline is not None:
+        if not args.baseline.is_file():
+            raise FileNotFoundError(f"baseline not found: {args.baseline}")
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+
+    print_table(results)
+    if imports:
+        print()
+        print_imports(imports, baseline)
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps({"meta": _meta(), "results": results, "imports": imports}, indent=2))
+        print(f"saved: {args.out}")
+
+    if regressions:
+        print(f"REGRESSION: {len(regressions)} case(s) more than {args.threshold:.0%} slower than baseline")
+        for r in regressions:
+            print(f"  {r['op']} {r['layer']}: {r['vs_baseline']:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
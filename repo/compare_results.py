@@ -0,0 +1,46 @@
+"""
+expect / 시뮬레이션 결과 비교 (chunk 단위 streaming, 불일치 위치를 layer / y / x / 채널 그룹으로)
+
+    python repo/compare_results.py hw/inout_data/yolo/expect/yolo_engine_expect.hex sim_ofm.hex
+    python repo/compare_results.py expect.hex dram_dump.bin --actual-offset 8388608 --max-errors 100
+    python repo/compare_results.py test1_output_32b.hex out.hex --layout 16x16x8
+
+layout: 'yolo' (L08 8x8x196 + L14 16x16x196, 기본) 또는 '[NAME=]HxWxC,...'
+--actual-offset을 주면 (DRAM 덤프 등) actual은 expect 길이만큼만 읽는다 (--trim-actual과 같음).
+일치하면 exit 0, 불일치 / 길이 차이(잘랐으면 actual이 짧을 때만)면 exit 1
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from aixlib.compare import compare_files, format_report, parse_layout, DEFAULT_CHUNK_WORDS
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="streaming expect/actual comparator")
+    ap.add_argument("expect", type=Path, help="expect (32b hex / .bin)")
+    ap.add_argument("actual", type=Path, help="결과 덤프 (32b hex / DRAM 이미지 .bin / raw .bin)")
+    ap.add_argument("--layout", default="yolo", help="출력 shape 표 (기본: yolo)")
+    ap.add_argument("--actual-offset", type=int, default=0, help="actual에서 비교 시작 byte 오프셋")
+    ap.add_argument("--trim-actual", action="store_true",
+                    help="actual을 expect 길이에서 자름 (--actual-offset을 주면 항상)")
+    ap.add_argument("--max-errors", type=int, default=None, help="불일치 N개 이후 중단")
+    ap.add_argument("--show", type=int, default=20, help="출력할 불일치 줄 수")
+    ap.add_argument("--chunk-words", type=int, default=DEFAULT_CHUNK_WORDS, help="chunk 크기 (32b 워드)")
+    ap.add_argument("--json", type=Path, default=None, help="요약 JSON 저장 경로")
+    args = ap.parse_args(argv)
+
+    res = compare_files(args.expect, args.actual, parse_layout(args.layout), args.max_errors,
+                        keep=max(args.show, 100), actual_offset=args.actual_offset,
+                        chunk_words=args.chunk_words, trim_actual=args.trim_actual or None)
+    for line in format_report(res, args.show):
+        print(line)
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(res.summary(), indent=2))
+    return 0 if res.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,79 @@
-# tools/aix.py
+import argparse
+import contextlib
+import sys
 from pathlib import Path
 
-from aixlib.io_hex import *
-from aixlib.utils import *
-from aixlib.verify import *
-from aixlib.packers import *
-from aixlib.ops_conv import *
-from aixlib.memory import *
+import numpy as np
 
+from aixlib.io_hex import read_32b_hex_lines, write_hex_lines, write_hex_words, iter_hex_words
+from aixlib.utils import KERNEL_SIZE, TCParams, load_params
+from aixlib.verify import verify_inputs
+from aixlib.packers import pack_filter_72b, pack_filter_32b, pack_affine
+from aixlib.ops_conv import (run_conv, run_affine_from_conv, run_layer_fused, maxpool_from_affine_words,
+                             upsample_words, concat_words)
+from aixlib.memory import memory_builder_monolayer
+from aixlib.feamap import FeatureMap
+from aixlib.conv_tiled import PsumStreamWriter
+from aixlib import profiling
+from aixlib.profiling import stage
 
-def main():
-    default_args = Path("repo") / "testcase_args.json"
-    params = load_params(default_args)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_ARGS = ROOT_DIR / "repo" / "testcase_args.json"
+
+# 입력 hex 경로 -> decode된 32b hex 줄 (builder들이 같은 입력 파일을 공유)
+_SHARED_INPUTS: dict[Path, list[str]] = {}
+
+
+def _shared_lines(path: Path) -> list[str]:
+    lines = _SHARED_INPUTS.get(path)
+    if lines is None:
+        lines = _SHARED_INPUTS[path] = read_32b_hex_lines(path)
+    return lines
+
+
+def read_inputs(params: TCParams) -> tuple[list[str], list[str], list[str], list[str]]:
+    """IFM / FILTER / BIAS / SCALE 입력을 한 번만 읽어 builder 사이에 공유 (반환값은 수정하지 말 것)"""
+    return tuple(_shared_lines(p) for p in (params.ifm_hex, params.filter_hex, params.bias_hex, params.scale_hex))
+
+
+def read_ifm_memmap(params: TCParams, path: Path) -> FeatureMap:
+    """IFM hex를 chunk 단위로 decode해서 raw 32b memmap 파일에 기록 (IFM 전체를 메모리에 올리지 않음)"""
+    need = params.height * params.width * params.cin // 4
+    path.parent.mkdir(parents=True, exist_ok=True)
+    words = np.memmap(path, dtype="<u4", mode="w+", shape=(need,))
+    n = 0
+    for chunk in iter_hex_words(params.ifm_hex):
+        take = min(chunk.size, need - n)
+        words[n:n + take] = chunk[:take]
+        n += take
+        if n == need:
+            break
+    if n < need:
+        raise ValueError(f"IFM data not enough: have={n} need={need}")
+    return FeatureMap.from_words(words, params.height, params.width, params.cin)
+
+
+def preload_inputs(args_path: Path | None = None, root: Path | None = None) -> dict[Path, list[str]]:
+    """worker를 만들기 전에 부모 프로세스에서 입력을 decode (fork 시 그대로 상속)"""
+    read_inputs(load_params(args_path or DEFAULT_ARGS, root or ROOT_DIR))
+    return _SHARED_INPUTS
+
+
+def share_inputs(inputs: dict[Path, list[str]]) -> None:
+    """spawn worker용: 부모에서 decode한 입력 등록"""
+    _SHARED_INPUTS.update(inputs)
+
+
+def main(psum_stream: bool = False, args_path: Path | None = None, root: Path | None = None,
+         mmap_dir: Path | None = None):
+    """
+    psum_stream=True: 하드웨어 tile 순서 partial sum도 expect/test{n}_conv_psum_stream_32b.hex로 기록
+    (시뮬레이션 psum과 비교할 때 locate_psum_line으로 위치 확인. bm_tb.v는 읽지 않음)\n
+    mmap_dir: 큰 입력용. IFM / conv 결과 / memory 이미지를 이 디렉토리의 memmap 파일에 두고
+    tiled conv로 계산한다 (메모리에는 partial sum band 하나와 uint8 affine 결과만 남음)
+    """
+    params = load_params(args_path or DEFAULT_ARGS, root or ROOT_DIR)
     
     print("[OK] params loaded")
     print(f" tc_no={params.testcase_no} width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
@@ -26,38 +88,56 @@ def main():
     print(f" out_affine_hex={params.out_affine_hex}")
     
     
-    ifm_src   = read_32b_hex_lines(params.ifm_hex)
-    filt_src  = read_32b_hex_lines(params.filter_hex)
-    bias_src  = read_32b_hex_lines(params.bias_hex)
-    scale_src = read_32b_hex_lines(params.scale_hex)
+    if mmap_dir is None:
+        ifm_src, filt_src, bias_src, scale_src = read_inputs(params)
+    else:
+        ifm_src = read_ifm_memmap(params, mmap_dir / f"test{params.testcase_no}_ifm.u32")
+        filt_src, bias_src, scale_src = (_shared_lines(p) for p in (params.filter_hex, params.bias_hex, params.scale_hex))
     
     
     ifm_data, filt_data, bias_data, scale_data = verify_inputs(params, ifm_src, filt_src, bias_src, scale_src)
     print("[OK] input sizes verified")
     
-    filt_72b_data = pack_filter_72b(params, filt_data)
-    filt_32b_data = pack_filter_32b(params, filt_data)
-    affine_data   = pack_affine(params, bias_data, scale_data)
-    
-    conv_result   = run_conv(ifm_data, filt_72b_data, params.height, params.width, params.cin, params.cout)
-    affine_result = run_affine_from_conv(conv_result, affine_data, params.height, params.width, params.cout)
-    maxpool_stride2_result = maxpool_from_affine_words(affine_result, params.height, params.width, params.cout, stride=2)
-    maxpool_stride1_result = maxpool_from_affine_words(affine_result, params.height, params.width, params.cout, stride=1)
-    
-    write_hex_lines(params.out_ifm_hex, ifm_data)
+    filt_72b_data = pack_filter_72b(filt_data)
+    filt_32b_data = pack_filter_32b(params.cin, params.cout, filt_data)
+    affine_data   = pack_affine(params.cout, bias_data, scale_data)
+    
+    if psum_stream or mmap_dir is not None:
+        # tiled conv 한 번의 결과를 affine / maxpool에 그대로 사용
+        conv_out = None
+        if mmap_dir is not None:
+            conv_out = np.memmap(mmap_dir / f"test{params.testcase_no}_conv.i32", dtype=np.int32, mode="w+",
+                                 shape=(params.height, params.width, params.cout))
+        with PsumStreamWriter(params.out_psum_stream_hex) if psum_stream else contextlib.nullcontext() as psum_writer:
+            conv_result = run_conv(ifm_data, filt_72b_data, params.cout, tiled=True,
+                                   psum_sink=psum_writer, out=conv_out)
+        if psum_stream:
+            print(f"[OK] psum stream: {psum_writer.lines} lines -> {params.out_psum_stream_hex}")
+        affine_result = run_affine_from_conv(conv_result, affine_data)
+        maxpool_stride2_result = maxpool_from_affine_words(affine_result, stride=2)
+    else:
+        # conv → affine → maxpool(stride 2) 한 번에, 중간 결과는 expect 출력용으로 받아둠
+        stages = {}
+        maxpool_stride2_result = run_layer_fused(ifm_data, filt_72b_data, affine_data, params.cout,
+                                                 pool_stride=2, intermediates=stages)
+        conv_result, affine_result = stages["conv"], stages["affine"]
+    maxpool_stride1_result = maxpool_from_affine_words(affine_result, stride=1)
+    
+    write_hex_words(params.out_ifm_hex, ifm_data.to_words())
     write_hex_lines(params.out_weight_hex, filt_32b_data)
     write_hex_lines(params.out_affine_hex, affine_data)
     
-    write_hex_lines(params.out_conv_result_hex, conv_result)
-    write_hex_lines(params.out_affine_result_hex, affine_result)
-    write_hex_lines(params.out_maxpool_stride1_result_hex, maxpool_stride1_result)
-    write_hex_lines(params.out_maxpool_stride2_result_hex, maxpool_stride2_result)
+    write_hex_words(params.out_conv_result_hex, conv_result.to_words())
+    write_hex_words(params.out_affine_result_hex, affine_result.to_words())
+    write_hex_words(params.out_maxpool_stride1_result_hex, maxpool_stride1_result.to_words())
+    write_hex_words(params.out_maxpool_stride2_result_hex, maxpool_stride2_result.to_words())
     
     
     
     # memory builder
-    info_mono = memory_builder_monolayer(ifm_data, filt_32b_data, bias_data, scale_data)
-    write_hex_lines(params.out_memory_hex, info_mono["memory"])
+    mem_path = None if mmap_dir is None else mmap_dir / f"test{params.testcase_no}_memory.u32"
+    info_mono = memory_builder_monolayer(ifm_data.to_words(), filt_32b_data, bias_data, scale_data, mem_path)
+    write_hex_words(params.out_memory_hex, info_mono["memory"], digits=4)
     
     print("[OK] DRAM memory image built")
     print("offset")
@@ -69,7 +149,7 @@ def main():
     print(f" total  : {info_mono['total_lines']} lines")
     
 
-def multilayer():
+def multilayer(args_path: Path | None = None, root: Path | None = None):
     print("[multilayer testcase builder]")
     print(
 """[layer info]
@@ -79,8 +159,7 @@ layer   mode   size    input       output       cin  cout
 21      conv	3x3/1	8x8x32      8x8x64      32	64
         max     2x2/1	8x8x64      8x8x64      64	64""")
     
-    default_args = Path("repo") / "testcase_args.json"
-    params = load_params(default_args)
+    params = load_params(args_path or DEFAULT_ARGS, root or ROOT_DIR)
     
     print("[OK] params loaded")
     
@@ -91,22 +170,19 @@ layer   mode   size    input       output       cin  cout
     params.cout = 32
     print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
     
-    ifm_src   = read_32b_hex_lines(params.ifm_hex)
-    filt_src  = read_32b_hex_lines(params.filter_hex)
-    bias_src  = read_32b_hex_lines(params.bias_hex)
-    scale_src = read_32b_hex_lines(params.scale_hex)
+    ifm_src, filt_src, bias_src, scale_src = read_inputs(params)
     
     
     ifm_data_0, filt_data_0, bias_data_0, scale_data_0 = verify_inputs(params, ifm_src, filt_src, bias_src, scale_src)
     print("[OK] input sizes verified")
     
-    filt_72b_data_0 = pack_filter_72b(params, filt_data_0)
-    filt_32b_data_0 = pack_filter_32b(params, filt_data_0)
-    affine_data_0   = pack_affine(params, bias_data_0, scale_data_0)
+    filt_72b_data_0 = pack_filter_72b(filt_data_0)
+    filt_32b_data_0 = pack_filter_32b(params.cin, params.cout, filt_data_0)
+    affine_data_0   = pack_affine(params.cout, bias_data_0, scale_data_0)
     
-    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.height, params.width, params.cin, params.cout)
-    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0, params.height, params.width, params.cout)
-    maxpool_stride2_result_0 = maxpool_from_affine_words(affine_result_0, params.height, params.width, params.cout, stride=2)
+    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.cout)
+    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0)
+    maxpool_stride2_result_0 = maxpool_from_affine_words(affine_result_0, stride=2)
     
     print("layer 21 building...")    
     # cutoff portion of used data 
@@ -125,17 +201,17 @@ layer   mode   size    input       output       cin  cout
     ifm_data_1, filt_data_1, bias_data_1, scale_data_1 = verify_inputs(params, maxpool_stride2_result_0, filt_src_1, bias_src_1, scale_src_1)
     print("[OK] input sizes verified")
     
-    filt_72b_data_1 = pack_filter_72b(params, filt_data_1)
-    filt_32b_data_1 = pack_filter_32b(params, filt_data_1)
-    affine_data_1   = pack_affine(params, bias_data_1, scale_data_1)
+    filt_72b_data_1 = pack_filter_72b(filt_data_1)
+    filt_32b_data_1 = pack_filter_32b(params.cin, params.cout, filt_data_1)
+    affine_data_1   = pack_affine(params.cout, bias_data_1, scale_data_1)
     
-    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.height, params.width, params.cin, params.cout)
-    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1, params.height, params.width, params.cout)
-    maxpool_stride1_result_1 = maxpool_from_affine_words(affine_result_1, params.height, params.width, params.cout, stride=1)
+    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.cout)
+    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1)
+    maxpool_stride1_result_1 = maxpool_from_affine_words(affine_result_1, stride=1)
     
 
     out_multi_result = params.out_expect_dir / f"multilayer_test_output_32b.hex"
-    write_hex_lines(out_multi_result, maxpool_stride1_result_1)
+    write_hex_words(out_multi_result, maxpool_stride1_result_1.to_words())
     
     
     # write_hex_lines(params.out_ifm_hex, ifm_data)
@@ -150,7 +226,7 @@ layer   mode   size    input       output       cin  cout
     
     
     # memory builder
-    mem_ifm = ifm_data_0
+    mem_ifm = ifm_data_0.to_words()
     mem_filt = filt_32b_data_0 + filt_32b_data_1
     mem_bias = bias_data_0 + bias_data_1
     mem_scale = scale_data_0 + scale_data_1
@@ -158,7 +234,7 @@ layer   mode   size    input       output       cin  cout
     
     info_multi = memory_builder_monolayer(mem_ifm, mem_filt, mem_bias, mem_scale)
     out_multi_mem = params.out_dram_dir / f"multilayer_test_memory_16b.hex"
-    write_hex_lines(out_multi_mem, info_multi["memory"])
+    write_hex_words(out_multi_mem, info_multi["memory"], digits=4)
     
     print("[OK] DRAM memory image built")
     print("offset")
@@ -171,11 +247,10 @@ layer   mode   size    input       output       cin  cout
     
 
 # testcase1: route from rte buf
-def multilayer1():
+def multilayer1(args_path: Path | None = None, root: Path | None = None):
     print("[multilayer testcase 1 builder]")
 
-    default_args = Path("repo") / "testcase_args.json"
-    params = load_params(default_args)
+    params = load_params(args_path or DEFAULT_ARGS, root or ROOT_DIR)
     
     print("[OK] params loaded")
     
@@ -188,22 +263,19 @@ def multilayer1():
     params.cout = 16
     print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
     
-    ifm_src   = read_32b_hex_lines(params.ifm_hex)
-    filt_src  = read_32b_hex_lines(params.filter_hex)
-    bias_src  = read_32b_hex_lines(params.bias_hex)
-    scale_src = read_32b_hex_lines(params.scale_hex)
+    ifm_src, filt_src, bias_src, scale_src = read_inputs(params)
     
     
     ifm_data_0, filt_data_0, bias_data_0, scale_data_0 = verify_inputs(params, ifm_src, filt_src, bias_src, scale_src)
     print("[OK] input sizes verified")
     
-    filt_72b_data_0 = pack_filter_72b(params, filt_data_0)
-    filt_32b_data_0 = pack_filter_32b(params, filt_data_0)
-    affine_data_0   = pack_affine(params, bias_data_0, scale_data_0)
+    filt_72b_data_0 = pack_filter_72b(filt_data_0)
+    filt_32b_data_0 = pack_filter_32b(params.cin, params.cout, filt_data_0)
+    affine_data_0   = pack_affine(params.cout, bias_data_0, scale_data_0)
     
-    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.height, params.width, params.cin, params.cout)
-    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0, params.height, params.width, params.cout)
-    maxpool_stride1_result_0 = maxpool_from_affine_words(affine_result_0, params.height, params.width, params.cout, stride=1)
+    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.cout)
+    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0)
+    maxpool_stride1_result_0 = maxpool_from_affine_words(affine_result_0, stride=1)
     
     
     print("layer 1")    
@@ -223,12 +295,12 @@ def multilayer1():
     ifm_data_1, filt_data_1, bias_data_1, scale_data_1 = verify_inputs(params, maxpool_stride1_result_0, filt_src_1, bias_src_1, scale_src_1)
     print("[OK] input sizes verified")
     
-    filt_72b_data_1 = pack_filter_72b(params, filt_data_1)
-    filt_32b_data_1 = pack_filter_32b(params, filt_data_1)
-    affine_data_1   = pack_affine(params, bias_data_1, scale_data_1)
+    filt_72b_data_1 = pack_filter_72b(filt_data_1)
+    filt_32b_data_1 = pack_filter_32b(params.cin, params.cout, filt_data_1)
+    affine_data_1   = pack_affine(params.cout, bias_data_1, scale_data_1)
     
-    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.height, params.width, params.cin, params.cout)
-    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1, params.height, params.width, params.cout)
+    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.cout)
+    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1)
     # output 1: affine_result_1
         
     print("layer 2")    
@@ -248,12 +320,12 @@ def multilayer1():
     ifm_data_2, filt_data_2, bias_data_2, scale_data_2 = verify_inputs(params, affine_result_0, filt_src_2, bias_src_2, scale_src_2)
     print("[OK] input sizes verified")
     
-    filt_72b_data_2 = pack_filter_72b(params, filt_data_2)
-    filt_32b_data_2 = pack_filter_32b(params, filt_data_2)
-    affine_data_2   = pack_affine(params, bias_data_2, scale_data_2)
+    filt_72b_data_2 = pack_filter_72b(filt_data_2)
+    filt_32b_data_2 = pack_filter_32b(params.cin, params.cout, filt_data_2)
+    affine_data_2   = pack_affine(params.cout, bias_data_2, scale_data_2)
     
-    conv_result_2   = run_conv(ifm_data_2, filt_72b_data_2, params.height, params.width, params.cin, params.cout)
-    affine_result_2 = run_affine_from_conv(conv_result_2, affine_data_2, params.height, params.width, params.cout)
+    conv_result_2   = run_conv(ifm_data_2, filt_72b_data_2, params.cout)
+    affine_result_2 = run_affine_from_conv(conv_result_2, affine_data_2)
     # output 2: affine_result_2
 
     # print(maxpool_stride1_result_0)
@@ -261,14 +333,14 @@ def multilayer1():
     
 
     print("expect packing")
-    final_ans = affine_result_1 + affine_result_2
+    final_ans = np.concatenate([affine_result_1.to_words(), affine_result_2.to_words()])
     out_multi_result = params.out_expect_dir / f"multilayer_test1_output_32b.hex"
-    write_hex_lines(out_multi_result, final_ans)
+    write_hex_words(out_multi_result, final_ans)
     
     
     print("memory packing")
     # memory builder
-    mem_ifm = ifm_data_0
+    mem_ifm = ifm_data_0.to_words()
     mem_filt = filt_32b_data_0 + filt_32b_data_1 + filt_32b_data_2
     mem_bias = bias_data_0 + bias_data_1 + bias_data_2
     mem_scale = scale_data_0 + scale_data_1 + scale_data_2
@@ -276,7 +348,7 @@ def multilayer1():
     
     info_multi = memory_builder_monolayer(mem_ifm, mem_filt, mem_bias, mem_scale)
     out_multi_mem = params.out_dram_dir / f"multilayer_test1_memory_16b.hex"
-    write_hex_lines(out_multi_mem, info_multi["memory"])
+    write_hex_words(out_multi_mem, info_multi["memory"], digits=4)
     
     print("[OK] DRAM memory image built")
     print("offset")
@@ -290,11 +362,10 @@ def multilayer1():
     
     
 # testcase2: route from ifm
-def multilayer2():
+def multilayer2(args_path: Path | None = None, root: Path | None = None):
     print("[multilayer testcase 2 builder]")
 
-    default_args = Path("repo") / "testcase_args.json"
-    params = load_params(default_args)
+    params = load_params(args_path or DEFAULT_ARGS, root or ROOT_DIR)
     
     print("[OK] params loaded")
     
@@ -307,10 +378,7 @@ def multilayer2():
     params.cout = 16
     print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
     
-    ifm_src   = read_32b_hex_lines(params.ifm_hex)
-    filt_src  = read_32b_hex_lines(params.filter_hex)
-    bias_src  = read_32b_hex_lines(params.bias_hex)
-    scale_src = read_32b_hex_lines(params.scale_hex)
+    ifm_src, filt_src, bias_src, scale_src = read_inputs(params)
     
     
     ifm_data_0, filt_data_0, bias_data_0, scale_data_0 = verify_inputs(params, ifm_src, filt_src, bias_src, scale_src)
@@ -320,12 +388,12 @@ def multilayer2():
     filt_32b_data_0 = pack_filter_32b(params.cin, params.cout, filt_data_0)
     affine_data_0   = pack_affine(params.cout, bias_data_0, scale_data_0)
     
-    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.height, params.width, params.cin, params.cout)
+    conv_result_0   = run_conv(ifm_data_0, filt_72b_data_0, params.cout)
 
-    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0, params.height, params.width, params.cout)
+    affine_result_0 = run_affine_from_conv(conv_result_0, affine_data_0)
     # output 0: affine_result_0 W:16, H:16, C:16
         
-    maxpool_stride1_result_0 = maxpool_from_affine_words(affine_result_0, params.height, params.width, params.cout, stride=1)
+    maxpool_stride1_result_0 = maxpool_from_affine_words(affine_result_0, stride=1)
     # print(affine_result_0)
     
     
@@ -351,9 +419,9 @@ def multilayer2():
     filt_32b_data_1 = pack_filter_32b(params.cin, params.cout, filt_data_1)
     affine_data_1   = pack_affine(params.cout, bias_data_1, scale_data_1)
     
-    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.height, params.width, params.cin, params.cout)
-    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1, params.height, params.width, params.cout)
-    maxpool_stride2_result_1 = maxpool_from_affine_words(affine_result_1, params.height, params.width, params.cout, stride=2)
+    conv_result_1   = run_conv(ifm_data_1, filt_72b_data_1, params.cout)
+    affine_result_1 = run_affine_from_conv(conv_result_1, affine_data_1)
+    maxpool_stride2_result_1 = maxpool_from_affine_words(affine_result_1, stride=2)
     # output 1: maxpool_stride2_result_1
     
     
@@ -365,7 +433,7 @@ def multilayer2():
     params.cin = 8
     params.cout = 8
     print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-    upsample_result_2 = upsample_words(maxpool_stride2_result_1, params.height, params.width, params.cin)
+    upsample_result_2 = upsample_words(maxpool_stride2_result_1)
     # output 2: upsample_result_2 (W:16, H:16, C:8)
     
     
@@ -381,7 +449,7 @@ def multilayer2():
     # {upsample_result_2, affine_result_0}
     # upsample_result_2     W:16, H:16, C:8
     # affine_result_0       W:16, H:16, C:16
-    concat_result_3 = concat_words(upsample_result_2, affine_result_0, params.width, params.height, 8, 16)
+    concat_result_3 = concat_words(upsample_result_2, affine_result_0)
     # output 3: concat_result_3 W:16, H:16, C:24
     # print("upsample result:")
     # print(upsample_result_2)
@@ -411,8 +479,8 @@ def multilayer2():
     filt_32b_data_4 = pack_filter_32b(params.cin, params.cout, filt_data_4)
     affine_data_4   = pack_affine(params.cout, bias_data_4, scale_data_4)
     
-    conv_result_4   = run_conv(ifm_data_4, filt_72b_data_4, params.height, params.width, params.cin, params.cout)
-    affine_result_4 = run_affine_from_conv(conv_result_4, affine_data_4, params.height, params.width, params.cout)
+    conv_result_4   = run_conv(ifm_data_4, filt_72b_data_4, params.cout)
+    affine_result_4 = run_affine_from_conv(conv_result_4, affine_data_4)
     # output 4: affine_result_4
     
     
@@ -421,14 +489,14 @@ def multilayer2():
     #####
     
     print("expect packing")
-    final_ans = affine_result_4
+    final_ans = affine_result_4.to_words()
     out_multi_result = params.out_expect_dir / f"multilayer_test2_output_32b.hex"
-    write_hex_lines(out_multi_result, final_ans)
+    write_hex_words(out_multi_result, final_ans)
     
     
     print("memory packing")
     # memory builder
-    mem_ifm = ifm_data_0
+    mem_ifm = ifm_data_0.to_words()
     mem_filt = filt_32b_data_0 + filt_32b_data_1 + filt_32b_data_4
     mem_bias = bias_data_0 + bias_data_1 + bias_data_4
     mem_scale = scale_data_0 + scale_data_1 + scale_data_4
@@ -437,7 +505,7 @@ def multilayer2():
     
     info_multi = memory_builder_monolayer(mem_ifm, mem_filt, mem_bias, mem_scale)
     out_multi_mem = params.out_dram_dir / f"multilayer_test2_memory_16b.hex"
-    write_hex_lines(out_multi_mem, info_multi["memory"])
+    write_hex_words(out_multi_mem, info_multi["memory"], digits=4)
     
     print("[OK] DRAM memory image built")
     print("offset")
@@ -450,7 +518,39 @@ def multilayer2():
         
     
     
+BUILDERS = {
+    "testcase":    main,
+    "multilayer":  multilayer,
+    "multilayer1": multilayer1,
+    "multilayer2": multilayer2,
+}
+
+
+def cli(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="testcase builder")
+    ap.add_argument("builder", nargs="?", choices=tuple(BUILDERS), default="multilayer2",
+                    help="testcase: 단일 레이어, multilayer*: 다층 testcase (기본: multilayer2)")
+    ap.add_argument("--args", type=Path, default=DEFAULT_ARGS, help="testcase 인자 JSON")
+    ap.add_argument("--root", type=Path, default=ROOT_DIR, help="입력 / hw/inout_data 기준 디렉토리")
+    ap.add_argument("--psum-stream", action="store_true", help="testcase: tile 순서 partial sum도 기록")
+    ap.add_argument("--mmap-dir", type=Path, default=None,
+                    help="testcase: IFM / conv 결과 / memory를 이 디렉토리의 memmap 파일로 (큰 입력용)")
+    ap.add_argument("--profile", action="store_true", help="stage별 시간/메모리 요약 출력")
+    ap.add_argument("--profile-json", type=Path, default=None, help="프로파일 결과 JSON 저장 (--profile 포함)")
+    ap.add_argument("--profile-trace", type=Path, default=None, help="Chrome trace 저장 (--profile 포함)")
+    args = ap.parse_args(argv)
+    
+    if args.profile or args.profile_json or args.profile_trace:
+        profiling.enable()
+    kwargs = {"args_path": args.args, "root": args.root}
+    if args.builder == "testcase":
+        kwargs["psum_stream"] = args.psum_stream
+        kwargs["mmap_dir"] = args.mmap_dir
+    with stage(args.builder):
+        BUILDERS[args.builder](**kwargs)
+    profiling.finish(args.profile_json, args.profile_trace)
+    return 0
+
+
 if __name__ == "__main__":
-    # main()
-    # multilayer1()
-    multilayer2()
\ No newline at end of file
+    sys.exit(cli())
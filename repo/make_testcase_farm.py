@@ -0,0 +1,236 @@
+"""
+랜덤 testcase farm: shape sweep x seed 조합마다 testcase 디렉토리 하나를 만든다.
+
+    python repo/make_testcase_farm.py --out farm --width 8,16 --height 8,16 \\
+        --cin 4:16:4 --cout 4:32:4 --pool 0,1,2 --upsample 0,1 --route 0,1 --seeds 0:4 -j 8
+    python repo/make_testcase_farm.py --spec sweep.json --out farm
+
+범위 표기: "8,16" (목록) 또는 "start:stop[:step]" (stop 포함 안 함)
+레이어 구성: conv3x3 → affine → (maxpool) → (upsample x2) → (route: {출력, IFM} 채널 concat)
+데이터는 (seed, W, H, Cin, Cout) 로 정해지는 난수라 같은 인자면 항상 같은 testcase가 나온다.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import numpy as np
+
+from aixlib.feamap import FeatureMap
+from aixlib.io_hex import write_hex_words
+from aixlib.memory import memory_builder_monolayer
+from aixlib.ops_conv import run_layer_fused, maxpool_from_affine_words, upsample_words, concat_words
+from aixlib.packers import pack_filter_32b, pack_filter_72b
+
+
+SWEEP_KEYS = ("width", "height", "cin", "cout", "pool", "upsample", "route", "seeds")
+
+
+@dataclass(frozen=True)
+class FarmCase:
+    width: int
+    height: int
+    cin: int
+    cout: int
+    pool: int = 0           # maxpool stride (0: 없음)
+    upsample: bool = False
+    route: bool = False
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        opts = f"_p{self.pool}" if self.pool else ""
+        opts += "_up" if self.upsample else ""
+        opts += "_rt" if self.route else ""
+        return f"W{self.width}xH{self.height}_C{self.cin}-{self.cout}{opts}_s{self.seed}"
+
+    def out_size(self) -> tuple[int, int]:
+        H, W = self.height, self.width
+        if self.pool >= 2:
+            H, W = 1 + (H - 2) // self.pool, 1 + (W - 2) // self.pool
+        if self.upsample:
+            H, W = 2 * H, 2 * W
+        return H, W
+
+    def is_valid(self) -> bool:
+        if self.cin % 4 or self.cout % 4 or self.cin <= 0 or self.cout <= 0:
+            return False
+        if self.pool >= 2 and min(self.width, self.height) < 2:
+            return False
+        # route는 IFM과 출력 크기가 같을 때만 (채널 concat)
+        return not self.route or self.out_size() == (self.height, self.width)
+
+
+# ------------------------------
+# sweep
+# ------------------------------
+def parse_range(text: str) -> list[int]:
+    """'8,16' 또는 'start:stop[:step]' -> 정수 목록"""
+    text = str(text).strip()
+    if ":" in text:
+        parts = [int(p) for p in text.split(":")]
+        if len(parts) not in (2, 3):
+            raise ValueError(f"bad range: {text!r}")
+        return list(range(*parts))
+    return [int(p) for p in text.split(",") if p.strip()]
+
+
+def _sweep_values(v) -> list[int]:
+    if isinstance(v, list):
+        return [int(x) for x in v]
+    if isinstance(v, dict):
+        return list(range(v["min"], v["max"] + 1, v.get("step", 1)))
+    return parse_range(v)
+
+
+def expand_sweep(sweep: dict) -> list[FarmCase]:
+    """sweep(키별 값 목록)의 전체 조합 중 유효한 것만"""
+    unknown = set(sweep) - set(SWEEP_KEYS)
+    if unknown:
+        raise ValueError(f"unknown sweep key(s): {sorted(unknown)}")
+    vals = {k: _sweep_values(sweep.get(k, d)) for k, d in
+            (("width", [8]), ("height", [8]), ("cin", [4]), ("cout", [4]), ("pool", [0]),
+             ("upsample", [0]), ("route", [0]), ("seeds", [0]))}
+    cases = []
+    for W, H, ci, co, p, up, rt, s in itertools.product(*(vals[k] for k in SWEEP_KEYS)):
+        case = FarmCase(W, H, ci, co, p, bool(up), bool(rt), s)
+        if case.is_valid():
+            cases.append(case)
+    return cases
+
+
+# ------------------------------
+# testcase 생성
+# ------------------------------
+def synth_data(case: FarmCase) -> dict:
+    """(seed, shape) 고정 난수로 IFM / weight / bias / scale 생성"""
+    rng = np.random.default_rng([case.seed, case.width, case.height, case.cin, case.cout])
+    ifm = FeatureMap(rng.integers(0, 256, (case.height, case.width, case.cin), dtype=np.uint8))
+    weights = rng.integers(-128, 128, (case.cout, case.cin, 3, 3), dtype=np.int8)
+    bias = rng.integers(-(1 << 14), 1 << 14, case.cout).astype(np.int32)
+    # 누산값 표준편차 ~ sqrt(Cin*9) * 2^13 -> shift 후 대략 2^6 근처가 되도록
+    # (출력이 전부 0이나 255로 몰리지 않게). scale 값의 bit 길이 = right shift 양
+    lo = int(np.log2(case.cin * 9) / 2) + 7
+    shift = rng.integers(lo - 1, lo + 2, case.cout)
+    scale = (np.uint64(1) << (shift - 1).astype(np.uint64)).astype(np.uint32)
+    return {"ifm": ifm, "weights": weights, "bias": bias, "scale": scale}
+
+
+def build_testcase(case: FarmCase, out_dir: Path) -> dict:
+    """testcase 디렉토리 하나 생성. 반환: manifest 항목"""
+    t0 = time.perf_counter()
+    d = synth_data(case)
+    tc_dir = out_dir / case.name
+    tc_dir.mkdir(parents=True, exist_ok=True)
+
+    ifm, weights, M = d["ifm"], d["weights"], case.cout
+    filt_72b = pack_filter_72b(weights, as_words=True)
+    filt_32b = pack_filter_32b(case.cin, M, weights, as_words=True)
+    affine = np.concatenate([d["bias"].view("<u4"), d["scale"]])
+
+    stages: dict[str, FeatureMap] = {}
+    out = run_layer_fused(ifm, filt_72b, affine, M, intermediates=stages)
+    files = {
+        "input": ifm,
+        "conv_result": stages["conv"],
+        "affine_result": stages["affine"],
+    }
+    if case.pool:
+        out = maxpool_from_affine_words(out, case.pool)
+        files[f"maxpool_stride{case.pool}_result"] = out
+    if case.upsample:
+        out = upsample_words(out)
+        files["upsample_result"] = out
+    if case.route:
+        out = concat_words(out, ifm)
+        files["route_result"] = out
+    files["output"] = out
+
+    for name, fm in files.items():
+        write_hex_words(tc_dir / f"{name}_32b.hex", fm.to_words())
+    write_hex_words(tc_dir / "param_packed_weight.hex", filt_32b)
+    write_hex_words(tc_dir / "affine_param.hex", affine)
+
+    info = memory_builder_monolayer(ifm.to_words(), filt_32b, d["bias"].view("<u4"), d["scale"])
+    write_hex_words(tc_dir / "memory_16b.hex", info["memory"], digits=4)
+
+    entry = {
+        "name": case.name,
+        **asdict(case),
+        "out_height": out.height,
+        "out_width": out.width,
+        "out_channels": out.channels,
+        "ifm_offset": info["ifm_offset"] * 4,
+        "filter_offset": info["filter_offset"] * 4,
+        "bias_offset": info["bias_offset"] * 4,
+        "scale_offset": info["scale_offset"] * 4,
+        "total_bytes": info["total_lines"] * 4,
+    }
+    (tc_dir / "testcase.json").write_text(json.dumps(entry, indent=2))
+    entry["seconds"] = time.perf_counter() - t0
+    return entry
+
+
+def _build_one(args: tuple[FarmCase, Path]) -> dict:
+    return build_testcase(*args)
+
+
+def build_farm(cases: list[FarmCase], out_dir: Path, workers: int = 1,
+               log=print) -> list[dict]:
+    """cases를 프로세스 풀에서 병렬 생성하고 out_dir/manifest.json 작성"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(c, out_dir) for c in cases]
+    t0 = time.perf_counter()
+    if workers == 1:
+        entries = [build_testcase(c, out_dir) for c in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(_build_one, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+    wall = time.perf_counter() - t0
+    manifest = {"count": len(entries), "wall_s": wall, "workers": workers, "testcases": entries}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    if log:
+        log(f"[OK] {len(entries)} testcases -> {out_dir} ({wall:.2f}s, {workers} workers)")
+    return entries
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="randomized testcase farm")
+    ap.add_argument("--out", type=Path, required=True, help="출력 디렉토리")
+    ap.add_argument("--spec", type=Path, default=None, help="sweep JSON (키: " + ", ".join(SWEEP_KEYS) + ")")
+    for key, default in (("width", "8"), ("height", "8"), ("cin", "4"), ("cout", "4"),
+                         ("pool", "0"), ("upsample", "0"), ("route", "0"), ("seeds", "0")):
+        ap.add_argument(f"--{key}", default=None, help=f"범위 (기본: {default})")
+    ap.add_argument("--sample", type=int, default=None, help="조합 중 N개만 무작위 선택")
+    ap.add_argument("--sample-seed", type=int, default=0)
+    ap.add_argument("-j", "--workers", type=int, default=0, help="프로세스 수 (0: CPU 개수)")
+    args = ap.parse_args(argv)
+
+    sweep = {}
+    if args.spec is not None:
+        if not args.spec.is_file():
+            raise FileNotFoundError(f"sweep spec not found: {args.spec}")
+        sweep = json.loads(args.spec.read_text())
+    for key in SWEEP_KEYS:
+        if getattr(args, key) is not None:
+            sweep[key] = getattr(args, key)
+
+    cases = expand_sweep(sweep)
+    if args.sample is not None and args.sample < len(cases):
+        pick = np.random.default_rng(args.sample_seed).choice(len(cases), args.sample, replace=False)
+        cases = [cases[i] for i in sorted(pick)]
+    if not cases:
+        raise ValueError("sweep produced no valid testcase")
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    build_farm(cases, args.out, workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
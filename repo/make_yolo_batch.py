@@ -0,0 +1,80 @@
+"""
+tiny-YOLO expect를 여러 입력 프레임에 대해 한 번에 계산 (batch golden model)
+
+    python repo/make_yolo_batch.py frames/                    # *.hex / *.bin 프레임 디렉토리
+    python repo/make_yolo_batch.py clip.bin --batch-size 16   # raw 32b 프레임 N개가 이어진 파일
+    python repo/make_yolo_batch.py clip.npy --out expect_clip # (N, 256, 256, 4) uint8
+
+파라미터는 한 번만 decode / 패킹하고, 각 레이어를 (N, H, W, C) 텐서로 계산한다.
+프레임마다 {이름}_expect.hex (yolo_engine_expect.hex와 같은 형식) 를 쓴다.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from aixlib import profiling
+from aixlib.batch import BatchExecutor, load_frames
+from aixlib.io_hex import write_hex_words
+from aixlib.params import ParamStore, load_layer_params
+from aixlib.profiling import stage
+from aixlib.yolo import YOLO_LAYERS, YOLO_INPUT, build_yolo_graph
+
+
+def make_batch(src: Path, out_dir: Path, batch_size: int = 8, param_dir: Path | None = None,
+               param_archive: Path | None = None) -> dict:
+    """반환: {"frames", "load_s", "run_s", "fps"}"""
+    root_dir = Path(__file__).resolve().parent.parent
+    param_dir = param_dir or (root_dir / "repo" / "data" / "param")
+
+    t0 = time.perf_counter()
+    L00 = YOLO_LAYERS[0]
+    with stage("load_frames"):
+        frames, names = load_frames(src, L00.height, L00.width, L00.cin)
+    store = ParamStore(param_dir, param_archive)
+    with stage("load_params"):
+        params = {layer.name: load_layer_params(layer, store) for layer in YOLO_LAYERS}
+    t_load = time.perf_counter() - t0
+    print(f"[OK] {frames.frames} frames, params packed ({t_load:.2f}s)")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    def write_expect(i: int, words: list[np.ndarray]) -> None:
+        write_hex_words(out_dir / f"{names[i]}_expect.hex", np.concatenate(words))
+
+    executor = BatchExecutor(build_yolo_graph(), params, batch_size)
+    t1 = time.perf_counter()
+    with stage("graph"):
+        executor.run(frames, YOLO_INPUT, sink=write_expect)
+    t_run = time.perf_counter() - t1
+
+    fps = frames.frames / t_run if t_run else float("inf")
+    print(f"[OK] {frames.frames} expect files -> {out_dir}")
+    print(f" run   : {t_run:.2f}s ({fps:.2f} frames/s, batch={batch_size})")
+    print(f" total : {time.perf_counter() - t0:.2f}s")
+    return {"frames": frames.frames, "load_s": t_load, "run_s": t_run, "fps": fps}
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="batched tiny-YOLO expect builder")
+    ap.add_argument("input", type=Path, help="프레임 디렉토리 / .bin / .hex / .npy")
+    ap.add_argument("--out", type=Path, default=None, help="출력 디렉토리 (기본: hw/inout_data/yolo/expect/batch)")
+    ap.add_argument("--batch-size", type=int, default=8, help="한 번에 계산할 프레임 수")
+    ap.add_argument("--param-dir", type=Path, default=None, help="파라미터 디렉토리 (기본: repo/data/param)")
+    ap.add_argument("--param-archive", type=Path, default=None, help="decode된 파라미터 archive")
+    ap.add_argument("--profile", action="store_true", help="stage별 시간/메모리 요약 출력")
+    args = ap.parse_args(argv)
+
+    out_dir = args.out or (Path(__file__).resolve().parent.parent / "hw" / "inout_data" / "yolo" / "expect" / "batch")
+    if args.profile:
+        profiling.enable()
+    with stage("make_batch"):
+        make_batch(args.input, out_dir, args.batch_size, args.param_dir, args.param_archive)
+    profiling.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
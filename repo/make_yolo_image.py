@@ -1,125 +1,35 @@
+import argparse
+import sys
 from pathlib import Path
 
-from aixlib.io_hex import *
-from aixlib.utils import *
-from aixlib.verify import *
-from aixlib.packers import *
-from aixlib.ops_conv import *
-from aixlib.memory import *
+import numpy as np
 
+from aixlib.io_hex import read_hex_words, write_hex_words
+from aixlib.feamap import FeatureMap
+from aixlib.graph import GraphExecutor
+from aixlib.cache import LayerCache, DEFAULT_CACHE_BYTES
+from aixlib.yolo import YOLO_LAYERS, YOLO_INPUT, build_yolo_graph
+from aixlib.params import ParamStore, load_layer_params
+from aixlib.layout import LayoutConfig, plan_layout, build_image
+from aixlib.dram_image import sections_from_info, write_dram_bin, update_dram_sections
+from aixlib.perf import load_hw_config, load_layer_table
+from aixlib.trace import iter_trace, write_trace
+from aixlib import profiling
+from aixlib.profiling import stage
 
 
-L00_width   = 256
-L00_height  = 256
-L00_cin     = 4     # 3->4 padding
-L00_cout    = 16
 
-
-L01_width   = 128
-L01_height  = 128
-L01_cin     = 16
-L01_cout    = 32
-
-
-L02_width   = 64
-L02_height  = 64
-L02_cin     = 32
-L02_cout    = 64
-
-
-L03_width   = 32
-L03_height  = 32
-L03_cin     = 64 
-L03_cout    = 128
-
-
-L04_width   = 16
-L04_height  = 16
-L04_cin     = 128
-L04_cout    = 256
-
-
-L05_width   = 8
-L05_height  = 8
-L05_cin     = 256
-L05_cout    = 512
-
-
-L06_width   = 8
-L06_height  = 8
-L06_cin     = 512
-L06_cout    = 256
-
-
-L07_width   = 8
-L07_height  = 8
-L07_cin     = 256 
-L07_cout    = 512
-
-
-L08_width   = 8
-L08_height  = 8
-L08_cin     = 512 
-L08_cout    = 196   # 195 -> 196 padding    
-
-
-L11_width   = 8
-L11_height  = 8
-L11_cin     = 256 
-L11_cout    = 128
-
-
-L14_width   = 16
-L14_height  = 16
-L14_cin     = 384 
-L14_cout    = 196   # 195 -> 196 padding
-
-
-def pad_filter_cin_to_mult4(filter_src: list[str], Cin: int, Cout: int, K: int = 3) -> list[str]:
-    """
-    Cin 채널 수가 4의 배수가 되도록 zero-padding
-    """
-    
-    padded_Cin = ((Cin + 3) // 4) * 4
-    out: list[str] = []
-    idx = 0
-    for m in range(Cout):
-        for c in range(Cin):
-            # 원래 weight 채널 (K*K개)
-            for _ in range(K * K):
-                out.append(filter_src[idx])
-                idx += 1
-        # 패딩 채널 (Cin → padded_Cin)
-        for _ in range((padded_Cin - Cin) * K * K):
-            out.append("00000000")
-    return out
-
-
-def pad_filter_cout_to_mult4(filter_src: list[str], Cin: int, Cout: int, K: int = 3) -> list[str]:
+def make_image(use_cache: bool = True, cache_dir: Path | None = None,
+               cache_max_bytes: int = DEFAULT_CACHE_BYTES, workers: int = 1,
+               image_format: str = "both", param_archive: Path | None = None,
+               layout: LayoutConfig | None = None, trace_path: Path | None = None):
     """
-    Cout 채널 수를 4의 배수로 맞추도록 zero-padding 출력 채널 추가.
-    - filter_src: flatten된 hex string 리스트 (길이 = Cin * Cout * K * K)
-    - Cin: 입력 채널 수
-    - Cout: 원래 출력 채널 수
-    - K: 커널 크기 (기본 3)
-    반환: 패딩된 filter 리스트
+    image_format: "hex" (16b $readmemh용), "bin" (header + raw 32b, mmap 가능), "both"\n
+    param_archive: decode된 파라미터 archive (없거나 오래됐으면 새로 만든다)\n
+    layout: 섹션 / 레이어 block 정렬 (None: 기본 LayoutConfig = yolo_layer_cfg.vh의 현재 오프셋)\n
+    trace_path: 같은 배치로 DRAM 접근 trace 저장 (trace_dram.py로 요약)
     """
-    padded_Cout = ((Cout + 3) // 4) * 4  # 4의 배수로 올림
-    out: list[str] = []
-    idx = 0
-    for m in range(Cout):
-        for c in range(Cin):
-            for _ in range(K * K):
-                out.append(filter_src[idx])
-                idx += 1
-    # 패딩된 dummy Cout 채널 추가
-    for _ in range((padded_Cout - Cout) * Cin * K * K):
-        out.append("00000000")
-    return out
-
-
-
-def make_image():
+    layout = layout or LayoutConfig()
     root_dir = Path(__file__).resolve().parent.parent
     feamap_dir = root_dir / "repo" / "data" / "feamap"
     param_dir  = root_dir / "repo" / "data" / "param"
@@ -134,143 +44,43 @@ def make_image():
     
     
     memory_file  = memory_path / "yolo_engine_image.hex"
+    memory_bin   = memory_path / "yolo_engine_image.bin"
     expect_file  = expect_path / "yolo_engine_expect.hex"
     
     
+    L00 = YOLO_LAYERS[0]
     L00_ifm_file  = feamap_path / "CONV00_input_32b.hex"
-    
-    L00_filt_file = param_path / "CONV00_param_weight.hex"
-    L01_filt_file = param_path / "CONV02_param_weight.hex"
-    L02_filt_file = param_path / "CONV04_param_weight.hex"
-    L03_filt_file = param_path / "CONV06_param_weight.hex"
-    L04_filt_file = param_path / "CONV08_param_weight.hex"
-    L05_filt_file = param_path / "CONV10_param_weight.hex"
-    L06_filt_file = param_path / "CONV12_param_weight.hex"
-    L07_filt_file = param_path / "CONV13_param_weight.hex"
-    L08_filt_file = param_path / "CONV14_param_weight.hex"
-    L11_filt_file = param_path / "CONV17_param_weight.hex"
-    L14_filt_file = param_path / "CONV20_param_weight.hex"
-    
-    
-    L00_bias_file = param_path / "CONV00_param_biases.hex"
-    L01_bias_file = param_path / "CONV02_param_biases.hex"
-    L02_bias_file = param_path / "CONV04_param_biases.hex"
-    L03_bias_file = param_path / "CONV06_param_biases.hex"
-    L04_bias_file = param_path / "CONV08_param_biases.hex"
-    L05_bias_file = param_path / "CONV10_param_biases.hex"
-    L06_bias_file = param_path / "CONV12_param_biases.hex"
-    L07_bias_file = param_path / "CONV13_param_biases.hex"
-    L08_bias_file = param_path / "CONV14_param_biases.hex"
-    L11_bias_file = param_path / "CONV17_param_biases.hex"
-    L14_bias_file = param_path / "CONV20_param_biases.hex"
-    
-    
-    L00_scal_file = param_path / "CONV00_param_scales.hex"
-    L01_scal_file = param_path / "CONV02_param_scales.hex"
-    L02_scal_file = param_path / "CONV04_param_scales.hex"
-    L03_scal_file = param_path / "CONV06_param_scales.hex"
-    L04_scal_file = param_path / "CONV08_param_scales.hex"
-    L05_scal_file = param_path / "CONV10_param_scales.hex"
-    L06_scal_file = param_path / "CONV12_param_scales.hex"
-    L07_scal_file = param_path / "CONV13_param_scales.hex"
-    L08_scal_file = param_path / "CONV14_param_scales.hex"
-    L11_scal_file = param_path / "CONV17_param_scales.hex"
-    L14_scal_file = param_path / "CONV20_param_scales.hex"
-    
-    
-    L00_ifm_src  = read_32b_hex_lines(L00_ifm_file)
-    
-    L00_filt_src = read_32b_hex_lines(L00_filt_file)    # cin=3->4 padding
-    L01_filt_src = read_32b_hex_lines(L01_filt_file)
-    L02_filt_src = read_32b_hex_lines(L02_filt_file)
-    L03_filt_src = read_32b_hex_lines(L03_filt_file)
-    L04_filt_src = read_32b_hex_lines(L04_filt_file)
-    L05_filt_src = read_32b_hex_lines(L05_filt_file)
-    L06_filt_src = read_32b_hex_lines(L06_filt_file)    # 1x1 -> 3x3
-    L07_filt_src = read_32b_hex_lines(L07_filt_file)
-    L08_filt_src = read_32b_hex_lines(L08_filt_file)    # 1x1 -> 3x3    # cout=195 -> 196 padding
-    L11_filt_src = read_32b_hex_lines(L11_filt_file)    # 1x1 -> 3x3
-    L14_filt_src = read_32b_hex_lines(L14_filt_file)    # 1x1 -> 3x3    # cout=195 -> 196 padding
-    
-    
-    L00_bias_src = read_32b_hex_lines(L00_bias_file) 
-    L01_bias_src = read_32b_hex_lines(L01_bias_file)
-    L02_bias_src = read_32b_hex_lines(L02_bias_file)
-    L03_bias_src = read_32b_hex_lines(L03_bias_file)
-    L04_bias_src = read_32b_hex_lines(L04_bias_file)
-    L05_bias_src = read_32b_hex_lines(L05_bias_file)
-    L06_bias_src = read_32b_hex_lines(L06_bias_file)
-    L07_bias_src = read_32b_hex_lines(L07_bias_file)
-    L08_bias_src = read_32b_hex_lines(L08_bias_file)    # cout=195 -> 196 padding
-    L11_bias_src = read_32b_hex_lines(L11_bias_file)
-    L14_bias_src = read_32b_hex_lines(L14_bias_file)    # cout=195 -> 196 padding
-    
-    
-    L00_scal_src = read_32b_hex_lines(L00_scal_file) 
-    L01_scal_src = read_32b_hex_lines(L01_scal_file)
-    L02_scal_src = read_32b_hex_lines(L02_scal_file)
-    L03_scal_src = read_32b_hex_lines(L03_scal_file)
-    L04_scal_src = read_32b_hex_lines(L04_scal_file)
-    L05_scal_src = read_32b_hex_lines(L05_scal_file)
-    L06_scal_src = read_32b_hex_lines(L06_scal_file)
-    L07_scal_src = read_32b_hex_lines(L07_scal_file)
-    L08_scal_src = read_32b_hex_lines(L08_scal_file)    # cout=195 -> 196 padding
-    L11_scal_src = read_32b_hex_lines(L11_scal_file)
-    L14_scal_src = read_32b_hex_lines(L14_scal_file)    # cout=195 -> 196 padding
-    # ===================================================================
-    # preprocess
-    # ===================================================================
-    L00_filt_src = pad_filter_cin_to_mult4(L00_filt_src, 3, L00_cout)
-    
-    L06_filt_src = pad_1x1_to_3x3(L06_filt_src, L06_cin, L06_cout)
-    L11_filt_src = pad_1x1_to_3x3(L11_filt_src, L11_cin, L11_cout)
-    
-    L08_filt_tmp = pad_filter_cout_to_mult4(L08_filt_src, L08_cin, 195, 1)
-    L14_filt_tmp = pad_filter_cout_to_mult4(L14_filt_src, L14_cin, 195, 1)
-    
-    L08_filt_src = pad_1x1_to_3x3(L08_filt_tmp, L08_cin, L08_cout)
-    L14_filt_src = pad_1x1_to_3x3(L14_filt_tmp, L14_cin, L14_cout)
-    
-    L08_bias_src.append("00000000")
-    L14_bias_src.append("00000000")
-    
-    L08_scal_src.append("00000000")
-    L14_scal_src.append("00000000")
-    # ===================================================================
-    L00_filt_72b = pack_filter_72b(L00_filt_src)
-    L01_filt_72b = pack_filter_72b(L01_filt_src)
-    L02_filt_72b = pack_filter_72b(L02_filt_src)
-    L03_filt_72b = pack_filter_72b(L03_filt_src)
-    L04_filt_72b = pack_filter_72b(L04_filt_src)
-    L05_filt_72b = pack_filter_72b(L05_filt_src)
-    L06_filt_72b = pack_filter_72b(L06_filt_src)
-    L07_filt_72b = pack_filter_72b(L07_filt_src)
-    L08_filt_72b = pack_filter_72b(L08_filt_src)
-    L11_filt_72b = pack_filter_72b(L11_filt_src)
-    L14_filt_72b = pack_filter_72b(L14_filt_src)
-    
-    
-    L00_filt_32b = pack_filter_32b(L00_cin, L00_cout, L00_filt_src)
-    L01_filt_32b = pack_filter_32b(L01_cin, L01_cout, L01_filt_src)
-    L02_filt_32b = pack_filter_32b(L02_cin, L02_cout, L02_filt_src)
-    L03_filt_32b = pack_filter_32b(L03_cin, L03_cout, L03_filt_src)
-    L04_filt_32b = pack_filter_32b(L04_cin, L04_cout, L04_filt_src)
-    L05_filt_32b = pack_filter_32b(L05_cin, L05_cout, L05_filt_src)
-    L06_filt_32b = pack_filter_32b(L06_cin, L06_cout, L06_filt_src)
-    L07_filt_32b = pack_filter_32b(L07_cin, L07_cout, L07_filt_src)
-    L08_filt_32b = pack_filter_32b(L08_cin, L08_cout, L08_filt_src)
-    L11_filt_32b = pack_filter_32b(L11_cin, L11_cout, L11_filt_src)
-    L14_filt_32b = pack_filter_32b(L14_cin, L14_cout, L14_filt_src)
-    
-    # ===================================================================
-    mem_ifm = L00_ifm_src
-    mem_filt = L00_filt_32b + L01_filt_32b + L02_filt_32b + L03_filt_32b + L04_filt_32b + L05_filt_32b + L06_filt_32b + L07_filt_32b + L08_filt_32b + L11_filt_32b + L14_filt_32b 
-    mem_bias = L00_bias_src + L01_bias_src + L02_bias_src + L03_bias_src + L04_bias_src + L05_bias_src + L06_bias_src + L07_bias_src + L08_bias_src + L11_bias_src + L14_bias_src
-    mem_scal = L00_scal_src + L01_scal_src + L02_scal_src + L03_scal_src + L04_scal_src + L05_scal_src + L06_scal_src + L07_scal_src + L08_scal_src + L11_scal_src + L14_scal_src
-    
-    info_memory = memory_builder_monolayer(mem_ifm, mem_filt, mem_bias, mem_scal)
-    
-    write_hex_lines(memory_file, info_memory["memory"])
+    L00_ifm_words = read_hex_words(L00_ifm_file)
+    
+    # ===================================================================
+    # preprocess + packing
+    # ===================================================================
+    store = ParamStore(param_path, param_archive)
+    if param_archive is not None and not store.archive_is_fresh():
+        with stage("param_archive"):
+            store.save_archive()
+        print(f"param archive saved: {param_archive}")
+
+    params = {}
+    with stage("load_params"):
+        for layer in YOLO_LAYERS:
+            with stage(layer.name, layer=layer.name):
+                params[layer.name] = load_layer_params(layer, store)
+    
+    # ===================================================================
+    plan = plan_layout(YOLO_LAYERS, L00_ifm_words.size * 4, layout)
+    with stage("dram_image"):
+        info_memory = build_image(plan, L00_ifm_words,
+                                  [p["filt_32b"] for p in params.values()],
+                                  [p["bias"] for p in params.values()],
+                                  [p["scale"] for p in params.values()])
+        if image_format in ("bin", "both"):
+            # OFM 영역 크기는 expect 계산 후 header에 기록
+            write_dram_bin(memory_bin, info_memory["memory_32b"],
+                           sections_from_info(info_memory, plan.ofm.offset, 0),
+                           meta={"model": "tiny-yolo"})
+        if image_format in ("hex", "both"):
+            write_hex_words(memory_file, info_memory["memory"], digits=4)
     
     print("DRAM memory image built")
     print("offset")
@@ -280,209 +90,79 @@ def make_image():
     print(f" scale  : {info_memory['scale_offset'] * 4}")
     print(f" total  : {info_memory['total_lines'] * 4} bytes")
     print(f" total  : {info_memory['total_lines']} lines")
-    # ===================================================================
-    # ===================================================================
-    # EXPECT
-    # ===================================================================
-    params = load_params(Path("repo") / "testcase_args.json") 
-    # Layer 0
-    print("[Layer 0]")
-    params.width = L00_width
-    params.height = L00_height
-    params.cin = L00_cin
-    params.cout = L00_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-    
-    L00_affine_data = pack_affine(params.cout, L00_bias_src, L00_scal_src)
-    
-    L00_conv_result             = run_conv(L00_ifm_src, L00_filt_72b, params.height, params.width, params.cin, params.cout)
-    L00_affine_result           = run_affine_from_conv(L00_conv_result, L00_affine_data, params.height, params.width, params.cout)
-    L00_maxpool_stride2_result  = maxpool_from_affine_words(L00_affine_result, params.height, params.width, params.cout, stride=2)
-    # L00 output: L00_maxpool_stride2_result
-    # ===================================================================
-    # Layer 1
-    print("[Layer 1]")
-    params.width  = L01_width
-    params.height = L01_height
-    params.cin    = L01_cin
-    params.cout   = L01_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L01_affine_data            = pack_affine(params.cout, L01_bias_src, L01_scal_src)
-    L01_conv_result            = run_conv(L00_maxpool_stride2_result, L01_filt_72b, params.height, params.width, params.cin, params.cout)
-    L01_affine_result          = run_affine_from_conv(L01_conv_result, L01_affine_data, params.height, params.width, params.cout)
-    L01_maxpool_stride2_result = maxpool_from_affine_words(L01_affine_result, params.height, params.width, params.cout, stride=2)
-    # L01 output: L01_maxpool_stride2_result
-    # ===================================================================
-
-    # Layer 2
-    print("[Layer 2]")
-    params.width  = L02_width
-    params.height = L02_height
-    params.cin    = L02_cin
-    params.cout   = L02_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
 
-    L02_affine_data            = pack_affine(params.cout, L02_bias_src, L02_scal_src)
-    L02_conv_result            = run_conv(L01_maxpool_stride2_result, L02_filt_72b, params.height, params.width, params.cin, params.cout)
-    L02_affine_result          = run_affine_from_conv(L02_conv_result, L02_affine_data, params.height, params.width, params.cout)
-    L02_maxpool_stride2_result = maxpool_from_affine_words(L02_affine_result, params.height, params.width, params.cout, stride=2)
-    # L02 output: L02_maxpool_stride2_result
-    # ===================================================================
-
-    # Layer 3
-    print("[Layer 3]")
-    params.width  = L03_width
-    params.height = L03_height
-    params.cin    = L03_cin
-    params.cout   = L03_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L03_affine_data            = pack_affine(params.cout, L03_bias_src, L03_scal_src)
-    L03_conv_result            = run_conv(L02_maxpool_stride2_result, L03_filt_72b, params.height, params.width, params.cin, params.cout)
-    L03_affine_result          = run_affine_from_conv(L03_conv_result, L03_affine_data, params.height, params.width, params.cout)
-    L03_maxpool_stride2_result = maxpool_from_affine_words(L03_affine_result, params.height, params.width, params.cout, stride=2)
-    # L03 output: L03_maxpool_stride2_result
-    # ===================================================================
-
-    # Layer 4
-    print("[Layer 4]")
-    params.width  = L04_width
-    params.height = L04_height
-    params.cin    = L04_cin
-    params.cout   = L04_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L04_affine_data            = pack_affine(params.cout, L04_bias_src, L04_scal_src)
-    L04_conv_result            = run_conv(L03_maxpool_stride2_result, L04_filt_72b, params.height, params.width, params.cin, params.cout)
-    L04_affine_result          = run_affine_from_conv(L04_conv_result, L04_affine_data, params.height, params.width, params.cout)
-    L04_maxpool_stride2_result = maxpool_from_affine_words(L04_affine_result, params.height, params.width, params.cout, stride=2)
-    # L04 output: L04_maxpool_stride2_result
-    # ===================================================================
-
-    # Layer 5
-    print("[Layer 5]")
-    params.width  = L05_width
-    params.height = L05_height
-    params.cin    = L05_cin
-    params.cout   = L05_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L05_affine_data            = pack_affine(params.cout, L05_bias_src, L05_scal_src)
-    L05_conv_result            = run_conv(L04_maxpool_stride2_result, L05_filt_72b, params.height, params.width, params.cin, params.cout)
-    L05_affine_result          = run_affine_from_conv(L05_conv_result, L05_affine_data, params.height, params.width, params.cout)
-    L05_maxpool_stride1_result = maxpool_from_affine_words(L05_affine_result, params.height, params.width, params.cout, stride=1)
-    # L05 output: L05_maxpool_stride1_result
-    # ===================================================================
-
-    # Layer 6
-    print("[Layer 6]")
-    params.width  = L06_width
-    params.height = L06_height
-    params.cin    = L06_cin
-    params.cout   = L06_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L06_affine_data            = pack_affine(params.cout, L06_bias_src, L06_scal_src)
-    L06_conv_result            = run_conv(L05_maxpool_stride1_result, L06_filt_72b, params.height, params.width, params.cin, params.cout)
-    L06_affine_result          = run_affine_from_conv(L06_conv_result, L06_affine_data, params.height, params.width, params.cout)
-    # L06 output: L06_affine_result
-    # ===================================================================
-
-    # Layer 7
-    print("[Layer 7]")
-    params.width  = L07_width
-    params.height = L07_height
-    params.cin    = L07_cin
-    params.cout   = L07_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L07_affine_data            = pack_affine(params.cout, L07_bias_src, L07_scal_src)
-    L07_conv_result            = run_conv(L06_affine_result, L07_filt_72b, params.height, params.width, params.cin, params.cout)
-    L07_affine_result          = run_affine_from_conv(L07_conv_result, L07_affine_data, params.height, params.width, params.cout)
-    # L07 output: L07_affine_result
-    # ===================================================================
-
-    # Layer 8
-    print("[Layer 8]")
-    params.width  = L08_width
-    params.height = L08_height
-    params.cin    = L08_cin
-    params.cout   = L08_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L08_affine_data            = pack_affine(params.cout, L08_bias_src, L08_scal_src)
-    L08_conv_result            = run_conv(L07_affine_result, L08_filt_72b, params.height, params.width, params.cin, params.cout)
-    L08_affine_result          = run_affine_from_conv(L08_conv_result, L08_affine_data, params.height, params.width, params.cout)
-    # L08 output: L08_affine_result
-    # ===================================================================
-
-    # Layer 9
-    print("[Layer 9]")
-    print("DRAM save layer")
-    # ===================================================================
-
-    # Layer 10
-    print("[Layer 10]")
-    print("ROUTE layer")
-
-    # L10 output: L06_affine_result
+    if trace_path is not None:
+        with stage("dram_trace"):
+            hw = load_hw_config(root_dir / "hw" / "src" / "controller_params.vh")
+            table = load_layer_table(root_dir / "hw" / "src" / "yolo_layer_cfg.vh")
+            count = write_trace(trace_path, iter_trace(table, plan, hw),
+                                {"layers": [l.name for l in table], "frames": 1,
+                                 "burst_bytes": hw.burst_words * 4})
+        print(f"DRAM trace: {trace_path} ({count} records)")
+    
+    # DRAM 이미지용 데이터는 더 이상 필요 없음
+    del info_memory
+    for p in params.values():
+        del p["filt_32b"], p["bias"], p["scale"]
     # ===================================================================
-
-    # Layer 11
-    print("[Layer 11]")
-    params.width  = L11_width
-    params.height = L11_height
-    params.cin    = L11_cin
-    params.cout   = L11_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L11_affine_data            = pack_affine(params.cout, L11_bias_src, L11_scal_src)
-    L11_conv_result            = run_conv(L06_affine_result, L11_filt_72b, params.height, params.width, params.cin, params.cout)
-    L11_affine_result          = run_affine_from_conv(L11_conv_result, L11_affine_data, params.height, params.width, params.cout)
-    # L11 output: L11_affine_result
+    # EXPECT
     # ===================================================================
-
-    # Layer 12
-    print("[Layer 12]")
-    print("UPSAMPLE")
-    params.width  = L11_width
-    params.height = L11_height
-    params.cin    = L11_cout   # cout
-    params.cout   = L11_cout
+    cache = None
+    if use_cache:
+        cache = LayerCache(cache_dir or (root_dir / "repo" / ".layer_cache"), cache_max_bytes)
     
-    L12_upsample_result = upsample_words(L11_affine_result, params.height, params.width, params.cin)
-    # L12 output: L12_upsample_result
-    # ===================================================================
-
-    # Layer 13
-    print("[Layer 13]")
-    print("CONCAT")
+    graph = build_yolo_graph()
+    executor = GraphExecutor(graph, params, cache=cache, workers=workers)
     
-    L13_concat_result = concat_words(L12_upsample_result, L04_affine_result, 16, 16, 128, 256)
-    # L13 output: L13_concat_result
-    # ===================================================================
-
-    # Layer 14
-    print("[Layer 14]")
-    params.width  = L14_width
-    params.height = L14_height
-    params.cin    = L14_cin
-    params.cout   = L14_cout
-    print(f" width={params.width} height={params.height} cin={params.cin} cout={params.cout}")
-
-    L14_affine_data            = pack_affine(params.cout, L14_bias_src, L14_scal_src)
-    L14_conv_result            = run_conv(L13_concat_result, L14_filt_72b, params.height, params.width, params.cin, params.cout)
-    L14_affine_result          = run_affine_from_conv(L14_conv_result, L14_affine_data, params.height, params.width, params.cout)
-    # L14 output: L14_affine_result
-    # ===================================================================
+    L00_ifm = FeatureMap.from_words(L00_ifm_words, L00.height, L00.width, L00.cin)
+    with stage("graph"):
+        outputs = executor.run({YOLO_INPUT: L00_ifm})
+    print(f"peak memory (live tensors + conv work buffers): {executor.peak_bytes} bytes (at {executor.peak_node})")
+    if cache is not None:
+        print(f"layer cache: {cache.hits} hit / {cache.misses} miss ({cache.root})")
     
-    yolo_expect = L08_affine_result + L14_affine_result
+    # L09(L08 결과) + L15(L14 결과)
+    yolo_expect = np.concatenate([fm.to_words() for fm in outputs.values()])
     print("EXPECT info")
     print(f" total  : {len(yolo_expect) * 4} bytes")
     print(f" total  : {len(yolo_expect)} lines")
-    write_hex_lines(expect_file, yolo_expect)
-    
-    
+    write_hex_words(expect_file, yolo_expect)
+    if image_format in ("bin", "both"):
+        update_dram_sections(memory_bin, {"ofm": {"offset": plan.ofm.offset,
+                                                  "bytes": yolo_expect.size * 4}})
+    
+    
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="tiny-YOLO DRAM image / expect builder")
+    ap.add_argument("--no-cache", action="store_true", help="레이어 결과 캐시 사용 안 함")
+    ap.add_argument("--cache-dir", type=Path, default=None, help="캐시 디렉토리 (기본: repo/.layer_cache)")
+    ap.add_argument("--cache-size-mb", type=int, default=DEFAULT_CACHE_BYTES >> 20, help="캐시 최대 크기 (MB)")
+    ap.add_argument("-j", "--workers", type=int, default=1, help="conv 프로세스 수 (0: CPU 개수)")
+    ap.add_argument("--image-format", choices=("hex", "bin", "both"), default="both",
+                    help="DRAM 이미지 형식 (hex: $readmemh용 16b, bin: header + raw 32b)")
+    ap.add_argument("--param-archive", type=Path, default=None,
+                    help="decode된 파라미터 archive 경로 (mmap, 없거나 오래됐으면 생성)")
+    ap.add_argument("--section-align", type=int, default=LayoutConfig.section_align,
+                    help="DRAM 섹션 정렬 (byte, plan_dram_layout.py와 같은 값)")
+    ap.add_argument("--block-align", type=int, default=LayoutConfig.block_align,
+                    help="레이어별 filter / bias / scale block 정렬 (byte)")
+    ap.add_argument("--trace", type=Path, default=None, help="DRAM 접근 trace 저장 경로 (trace_dram.py 형식)")
+    ap.add_argument("--profile", action="store_true", help="stage별 시간/메모리 요약 출력")
+    ap.add_argument("--profile-json", type=Path, default=None, help="프로파일 결과 JSON 저장 (--profile 포함)")
+    ap.add_argument("--profile-trace", type=Path, default=None, help="Chrome trace 저장 (--profile 포함)")
+    args = ap.parse_args(argv)
+    
+    if args.profile or args.profile_json or args.profile_trace:
+        profiling.enable()
+    with stage("make_image"):
+        make_image(use_cache=not args.no_cache, cache_dir=args.cache_dir,
+                   cache_max_bytes=args.cache_size_mb << 20, workers=args.workers,
+                   image_format=args.image_format, param_archive=args.param_archive,
+                   layout=LayoutConfig(section_align=args.section_align, block_align=args.block_align),
+                   trace_path=args.trace)
+    profiling.finish(args.profile_json, args.profile_trace)
+    return 0
+
+
 if __name__ == "__main__":
-    make_image()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+가속기 cycle / throughput 추정 (yolo_layer_cfg.vh 레이어 표 + controller_params.vh)
+
+    python repo/perf_model.py                                   # 레이어별 표 + 합계
+    python repo/perf_model.py --clock 200 --bw 1.6 --csv perf.csv
+    python repo/perf_model.py --tin 4,8 --tout 4,8,16 --bw 0.4,0.8,1.6 --csv sweep.csv   # sweep
+
+가정: filter는 출력 채널 tile마다 CSYNC에서 직렬로 읽고 (--overlap-filter: 연산과 겹침),
+DMA 요청(16워드)마다 --latency cycle 고정 지연 + 대역폭 제한. save / route / upsample은 워드당 1 cycle.
+"""
+import argparse
+import csv
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from aixlib.perf import load_hw_config, load_layer_table, sweep
+
+TABLE_COLUMNS = ("layer", "type", "shape", "compute_cycles", "stall_cycles", "cycles",
+                 "dram_read_bytes", "dram_write_bytes", "bound", "mac_util", "time_us")
+
+
+def _list(cast):
+    return lambda text: [cast(v) for v in text.split(",") if v.strip()]
+
+
+def print_layers(result: dict) -> None:
+    hw = result["hw"]
+    print(f"Tin={hw.tin} Tout={hw.tout} clock={hw.clock_mhz:g}MHz dram={hw.dram_gbps:g}GB/s "
+          f"latency={hw.dma_latency} overlap_filter={hw.overlap_filter}")
+    print(f"{'layer':<6} {'type':<8} {'shape':<18} {'compute':>10} {'stall':>10} {'total':>10} "
+          f"{'read B':>9} {'write B':>8} {'bound':<8} {'util':>5} {'us':>8}")
+    for r in result["layers"]:
+        print(f"{r['layer']:<6} {r['type']:<8} {r['shape']:<18} {r['compute_cycles']:>10.0f} "
+              f"{r['stall_cycles']:>10.0f} {r['cycles']:>10.0f} {r['dram_read_bytes']:>9} "
+              f"{r['dram_write_bytes']:>8} {r['bound']:<8} {r['mac_util']:>5.2f} {r['time_us']:>8.1f}")
+        for w in r["warnings"]:
+            print(f"       ! {w}")
+    print(f"total: {result['cycles']:.0f} cycles, {result['time_ms']:.2f} ms/frame, "
+          f"{result['fps']:.2f} frames/s, DRAM {result['dram_bytes']} bytes, "
+          f"stall {result['stall_cycles'] / result['cycles']:.1%}")
+    print(f"memory-bound: {', '.join(result['memory_bound']) or '-'}")
+
+
+def print_sweep(results: list[dict]) -> None:
+    print(f"{'Tin':>4} {'Tout':>4} {'MHz':>6} {'GB/s':>6} {'cycles':>11} {'ms':>8} {'fps':>8} "
+          f"{'stall':>6} {'mem-bound':>9}")
+    for res in results:
+        hw = res["hw"]
+        print(f"{hw.tin:>4} {hw.tout:>4} {hw.clock_mhz:>6g} {hw.dram_gbps:>6g} {res['cycles']:>11.0f} "
+              f"{res['time_ms']:>8.2f} {res['fps']:>8.2f} {res['stall_cycles'] / res['cycles']:>6.1%} "
+              f"{len(res['memory_bound']):>9}")
+
+
+def write_csv(path: Path, results: list[dict]) -> None:
+    """레이어별 행 (설정 열 + TABLE_COLUMNS), sweep이면 조합마다 반복"""
+    hw_cols = ("tin", "tout", "clock_mhz", "dram_gbps", "dma_latency", "overlap_filter")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(hw_cols + TABLE_COLUMNS + ("warnings",))
+        for res in results:
+            hw = asdict(res["hw"])
+            cfg = [hw[c] for c in hw_cols]
+            for r in res["layers"]:
+                w.writerow(cfg + [r[c] for c in TABLE_COLUMNS] + ["; ".join(r["warnings"])])
+            rows = res["layers"]
+            w.writerow(cfg + ["total", "", "", sum(r["compute_cycles"] for r in rows), res["stall_cycles"],
+                              res["cycles"], sum(r["dram_read_bytes"] for r in rows),
+                              sum(r["dram_write_bytes"] for r in rows), "", "", res["time_ms"] * 1e3,
+                              f"fps={res['fps']:.3f}"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    root_dir = Path(__file__).resolve().parent.parent
+    ap = argparse.ArgumentParser(description="analytic cycle / throughput model of the YOLO engine")
+    ap.add_argument("--layer-cfg", type=Path, default=root_dir / "hw" / "src" / "yolo_layer_cfg.vh")
+    ap.add_argument("--hw-params", type=Path, default=root_dir / "hw" / "src" / "controller_params.vh")
+    ap.add_argument("--tin", type=_list(int), default=None, help="Tin (쉼표로 여러 값 = sweep)")
+    ap.add_argument("--tout", type=_list(int), default=None, help="Tout")
+    ap.add_argument("--clock", type=_list(float), default=[100.0], help="clock (MHz)")
+    ap.add_argument("--bw", type=_list(float), default=[0.8], help="DRAM 유효 대역폭 (GB/s)")
+    ap.add_argument("--latency", type=int, default=30, help="DMA 요청당 고정 지연 (cycle)")
+    ap.add_argument("--overlap-filter", action="store_true", help="다음 tile filter를 연산 중 미리 읽는다고 가정")
+    ap.add_argument("--csv", type=Path, default=None, help="레이어별 결과 CSV")
+    args = ap.parse_args(argv)
+
+    base = load_hw_config(args.hw_params, dma_latency=args.latency, overlap_filter=args.overlap_filter)
+    table = load_layer_table(args.layer_cfg)
+    axes = {"tin": args.tin or [base.tin], "tout": args.tout or [base.tout],
+            "clock_mhz": args.clock, "dram_gbps": args.bw}
+    if any(v <= 0 for values in axes.values() for v in values):
+        raise ValueError("Tin / Tout / clock / bandwidth must be positive")
+    results = sweep(table, base, **axes)
+
+    if len(results) == 1:
+        print_layers(results[0])
+    else:
+        print_sweep(results)
+        best = max(results, key=lambda r: r["fps"])
+        print()
+        print_layers(best)
+    if args.csv is not None:
+        write_csv(args.csv, results)
+        print(f"saved: {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+DRAM 배치 계획: 섹션 / 레이어별 sub-block 오프셋, DMA burst 수, Verilog define과 firmware 표 생성
+
+    python repo/plan_dram_layout.py                                   # 현재 배치 (기본값) 보고
+    python repo/plan_dram_layout.py --block-align 64                  # 레이어 block을 burst 경계에 정렬
+    python repo/plan_dram_layout.py --block-align 64 --patch-cfg hw/src/yolo_layer_cfg.vh \\
+        --vh hw/src/yolo_dram_layout.vh --c-table base_addr_config.h --cfg-bin store_cfg.bin
+
+기본값(section 64B, block 4B)은 memory_builder_monolayer 배치와 같다
+(filter 262144, bias 6068800, scale 6078016, OFM 8388608).
+make_yolo_image.py에도 같은 --section-align / --block-align 을 줘야 이미지가 일치한다.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from aixlib.compare import yolo_output_regions
+from aixlib.layout import (LayoutConfig, plan_layout, dma_report, render_layout_vh, patch_layer_cfg,
+                           render_base_addr_c, cfg_records)
+from aixlib.yolo import YOLO_LAYERS
+
+
+def yolo_ifm_bytes() -> int:
+    L00 = YOLO_LAYERS[0]
+    return L00.height * L00.width * L00.cin
+
+
+def print_report(rows: list[dict], plan) -> None:
+    print("sections")
+    for name, b in plan.sections.items():
+        print(f" {name:<7}: {b.offset:>10}  ({b.nbytes} bytes)")
+    print(f" {'ofm':<7}: {plan.ofm.offset:>10}  ({plan.ofm.nbytes} bytes)")
+    print()
+    print(f"{'layer':<6} {'param':<7} " + " ".join(f"{s + ' off':>11} {'bursts':>8}" for s in ("filter", "bias", "scale")))
+    total = extra = 0
+    for r in rows:
+        cells = []
+        for s in ("filter", "bias", "scale"):
+            c = r[s]
+            mark = "" if c["bursts"] == c["min_bursts"] else f"+{c['bursts'] - c['min_bursts']}"
+            mark += "" if c["aligned"] else "*"
+            cells.append(f"{c['offset']:>11} {str(c['bursts']) + mark:>8}")
+            total += c["bursts"]
+            extra += c["bursts"] - c["min_bursts"]
+        print(f"{r['layer']:<6} {r['param']:<7} " + " ".join(cells))
+    print(f"total bursts: {total} (extra from misalignment: {extra}, *: start not burst aligned)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    d = LayoutConfig()
+    ap = argparse.ArgumentParser(description="burst-aligned DRAM layout planner")
+    ap.add_argument("--section-align", type=int, default=d.section_align, help="섹션 정렬 (byte)")
+    ap.add_argument("--block-align", type=int, default=d.block_align, help="레이어 sub-block 정렬 (byte)")
+    ap.add_argument("--burst-beats", type=int, default=d.burst_beats, help="DMA 요청 길이 (32b 워드)")
+    ap.add_argument("--max-burst-beats", type=int, default=d.max_burst_beats, help="axi_dma_rd FIXED_BURST_SIZE")
+    ap.add_argument("--page-bytes", type=int, default=d.page_bytes, help="burst 경계 (byte)")
+    ap.add_argument("--ofm-offset", type=int, default=d.ofm_offset, help="OFM 영역 byte 주소")
+    ap.add_argument("--vh", type=Path, default=None, help="섹션 / 레이어 오프셋 Verilog 헤더 출력")
+    ap.add_argument("--patch-cfg", type=Path, default=None, help="yolo_layer_cfg.vh의 YOLO_DRAM_* 값 갱신")
+    ap.add_argument("--c-table", type=Path, default=None, help="firmware base_addr_config 표 (C) 출력")
+    ap.add_argument("--cfg-bin", type=Path, default=None, help="MODE_STORE_CFG UART payload 출력")
+    ap.add_argument("--json", type=Path, default=None, help="배치 / burst 보고서 JSON")
+    args = ap.parse_args(argv)
+
+    cfg = LayoutConfig(args.section_align, args.block_align, args.burst_beats, args.max_burst_beats,
+                       d.beat_bytes, args.page_bytes, args.ofm_offset)
+    expect_lines = sum(r.words for r in yolo_output_regions())
+    plan = plan_layout(YOLO_LAYERS, yolo_ifm_bytes(), cfg, ofm_bytes=expect_lines * 4)
+    rows = dma_report(plan)
+    print_report(rows, plan)
+
+    outputs = (
+        (args.vh, lambda: render_layout_vh(plan, expect_lines)),
+        (args.c_table, lambda: render_base_addr_c(plan)),
+    )
+    for path, render in outputs:
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(render())
+            print(f"saved: {path}")
+    if args.patch_cfg is not None:
+        if not args.patch_cfg.is_file():
+            raise FileNotFoundError(f"layer cfg not found: {args.patch_cfg}")
+        text = args.patch_cfg.read_text()
+        new = patch_layer_cfg(text, plan, expect_lines)
+        if new != text:
+            args.patch_cfg.write_text(new)
+        print(f"{'updated' if new != text else 'unchanged'}: {args.patch_cfg}")
+    if args.cfg_bin is not None:
+        args.cfg_bin.parent.mkdir(parents=True, exist_ok=True)
+        args.cfg_bin.write_bytes(cfg_records(plan))
+        print(f"saved: {args.cfg_bin}")
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        doc = {"config": vars(cfg), "sections": {k: vars(b) for k, b in plan.sections.items()},
+               "ofm": vars(plan.ofm), "layers": rows}
+        args.json.write_text(json.dumps(doc, indent=2))
+        print(f"saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
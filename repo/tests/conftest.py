@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = REPO_DIR.parent
+sys.path.insert(0, str(REPO_DIR))       # 스크립트와 같이 repo/ 기준으로 aixlib import
+
+from aixlib.feamap import FeatureMap  # noqa: E402
+from aixlib.io_hex import read_hex_words  # noqa: E402
+from aixlib.packers import pack_filter_72b, pack_affine  # noqa: E402
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def inout_dir() -> Path:
+    """체크인된 hw/inout_data"""
+    return ROOT_DIR / "hw" / "inout_data"
+
+
+@pytest.fixture
+def data_dir() -> Path:
+    return REPO_DIR / "data"
+
+
+def _unpack_32b(words: np.ndarray, cin: int, cout: int) -> np.ndarray:
+    """pack_filter_32b의 역: 32b 워드 -> (cout, cin, 9) uint8"""
+    w = words.view(np.uint8).reshape(cout // 4, cin, 9, 4)
+    return np.ascontiguousarray(w.transpose(0, 3, 1, 2)).reshape(cout, cin, 9)
+
+
+def _load_testcase(inout_dir: Path, n: int):
+    ifm = read_hex_words(inout_dir / "feamap" / f"test{n}_input_32b.hex")
+    weight = read_hex_words(inout_dir / "param_packed" / f"test{n}_param_packed_weight.hex")
+    affine = read_hex_words(inout_dir / "param_packed" / f"test{n}_affine_param.hex")
+    cout = affine.size // 2
+    cin = weight.size * 4 // (9 * cout)
+    H = W = int(round((ifm.size * 4 // cin) ** 0.5))
+    return FeatureMap.from_words(ifm, H, W, cin), _unpack_32b(weight, cin, cout), weight, affine, cout
+
+
+@pytest.fixture
+def load_testcase(inout_dir):
+    """n -> (ifm FeatureMap, filt (cout, cin, 9), weight 32b 워드, affine 워드, cout)"""
+    return lambda n: _load_testcase(inout_dir, n)
+
+
+@pytest.fixture
+def random_params(rng):
+    """{레이어 key: (cin, cout)} -> GraphExecutor params (random 72b 필터 + affine)"""
+    def make(layers: dict[str, tuple[int, int]]) -> dict:
+        params = {}
+        for name, (cin, cout) in layers.items():
+            w = rng.integers(-128, 128, size=(cout, cin, 3, 3), dtype=np.int8)
+            bias = rng.integers(-4000, 4000, size=cout, dtype=np.int64).astype("<i4")
+            scale = rng.integers(1, 1 << 10, size=cout, dtype=np.uint64).astype("<u4")
+            params[name] = {"filt_72b": pack_filter_72b(w, as_words=True), "affine": pack_affine(cout, bias, scale)}
+        return params
+    return make
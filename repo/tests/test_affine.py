@@ -0,0 +1,44 @@
+"""
+affine (bias + ReLU + shift + clamp) vs 기존 python int 구현
+"""
+import numpy as np
+
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import _affine_u8, scale_shift_table, run_affine_from_conv
+from aixlib.packers import pack_affine
+
+
+def _affine_baseline(acc: np.ndarray, bias: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """기존 run_affine_from_conv: python int 누산 (int64) -> (H, W, M) uint8"""
+    shift = np.array([int(v).bit_length() for v in scale], dtype=np.int64)
+    x = np.maximum(acc.astype(np.int64) + bias.astype(np.int64), 0) >> shift
+    return np.clip(x, 0, 255).astype(np.uint8)
+
+
+def test_scale_shift_table_is_bit_length():
+    scale = np.array([0, 1, 2, 3, 255, 256, 0x7FFFFFFF, 0x80000000, 0xFFFFFFFF], dtype="<u4")
+    assert scale_shift_table(scale).tolist() == [int(v).bit_length() for v in scale.tolist()]
+
+
+def test_affine_matches_baseline(rng):
+    M = 10
+    acc = rng.integers(-(1 << 31), 1 << 31, size=(5, 6, M), dtype=np.int64).astype(np.int32)
+    bias = rng.integers(-(1 << 31), 1 << 31, size=M, dtype=np.int64).astype(np.int32)
+    bias[0], acc[..., 0] = 0x7FFFFF00, 1000        # int32로 더하면 wrap-around 되는 경계
+    scale = rng.integers(0, 1 << 32, size=M, dtype=np.uint64).astype(np.uint32)
+    scale[:2] = 0
+    out = _affine_u8(acc, bias, scale_shift_table(scale))
+    assert out.shape == (5, 6, 12) and not out[..., M:].any()
+    np.testing.assert_array_equal(out[..., :M], _affine_baseline(acc, bias, scale))
+    assert (out[..., 0] == 255).all()
+
+
+def test_run_affine_from_conv(rng):
+    M = 6
+    acc = rng.integers(-(1 << 20), 1 << 20, size=(2, 4, 5, M), dtype=np.int64).astype(np.int32)
+    bias = rng.integers(-4000, 4000, size=M, dtype=np.int64).astype("<i4")
+    scale = rng.integers(1, 1 << 12, size=M, dtype=np.uint64).astype("<u4")
+    out = run_affine_from_conv(FeatureMap(acc, M), pack_affine(M, bias, scale))
+    assert out.frames == 2 and out.channels == M and out.data.dtype == np.uint8
+    for i in range(2):
+        np.testing.assert_array_equal(out.data[i, ..., :M], _affine_baseline(acc[i], bias, scale))
@@ -0,0 +1,85 @@
+"""
+aix 진입점: 하위 명령 인자 / dispatch (builder는 monkeypatch로 기록만), 나머지 인자 전달, all job 요약
+"""
+import json
+
+import pytest
+
+import aix
+import compare_results
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    """run_job 호출을 (job, kwargs)로 기록. job 이름이 "bad"로 시작하면 실패"""
+    calls = []
+
+    def fake(job, *args, **kwargs):
+        calls.append((job, args, kwargs))
+        if job.startswith("bad"):
+            raise RuntimeError("boom")
+    monkeypatch.setattr(aix, "run_job", fake)
+    return calls
+
+
+def test_parse_subcommands():
+    ap = aix.build_parser()
+    args = ap.parse_args(["testcase", "--psum-stream", "--mmap-dir", "mm"])
+    assert (args.func, args.psum_stream, str(args.mmap_dir), args.args) == (
+        aix._cmd_testcase, True, "mm", aix.DEFAULT_ARGS)
+    for name in aix.TESTCASE_JOBS[1:]:
+        args = ap.parse_args([name, "--root", "r"])
+        assert args.func is aix._cmd_testcase and not hasattr(args, "psum_stream")
+    args = ap.parse_args(["all", "--jobs", "testcase,multilayer,", "-j", "2"])
+    assert (args.jobs, args.workers, args.yolo_args) == (["testcase", "multilayer"], 2, "")
+    with pytest.raises(SystemExit):
+        ap.parse_args(["multilayer", "--psum-stream"])
+    with pytest.raises(SystemExit):
+        ap.parse_args([])
+
+
+def test_testcase_dispatch(jobs):
+    assert aix.main(["testcase", "--psum-stream"]) == 0
+    assert aix.main(["multilayer1", "--args", "a.json"]) == 0
+    (job0, args0, kw0), (job1, args1, kw1) = jobs
+    assert (job0, args0, kw0) == ("testcase", (aix.DEFAULT_ARGS, aix.ROOT_DIR),
+                                  {"psum_stream": True, "mmap_dir": None})
+    assert (job1, str(args1[0]), kw1["psum_stream"]) == ("multilayer1", "a.json", False)
+    with pytest.raises(SystemExit):
+        aix.main(["testcase", "--nope"])
+
+
+@pytest.mark.parametrize("argv", [
+    ["verify", "--", "e.hex", "d.bin", "--layout", "yolo", "--trim-actual"],
+    ["verify", "e.hex", "d.bin", "--layout", "yolo", "--trim-actual"],
+])
+def test_verify_passthrough(monkeypatch, argv):
+    seen = []
+    monkeypatch.setattr(compare_results, "main", lambda rest: seen.append(rest) or 7)
+    assert aix.main(argv) == 7
+    assert seen == [["e.hex", "d.bin", "--layout", "yolo", "--trim-actual"]]
+
+
+def test_all_jobs(jobs, monkeypatch, tmp_path, capsys):
+    out = tmp_path / "t" / "jobs.json"
+    argv = ["all", "--jobs", "yolo-image", "-j", "1", "--yolo-args", "--no-cache -j 2", "--json", str(out)]
+    assert aix.main(argv) == 0
+    assert jobs == [("yolo-image", (), {"args_path": aix.DEFAULT_ARGS, "root": aix.ROOT_DIR,
+                                        "yolo_argv": ["--no-cache", "-j", "2"]})]
+    doc = json.loads(out.read_text())
+    assert [(j["job"], j["ok"]) for j in doc["jobs"]] == [("yolo-image", True)]
+    assert "[OK] yolo-image" in capsys.readouterr().out
+
+    with pytest.raises(ValueError, match="unknown job"):
+        aix.main(["all", "--jobs", "yolo-image,nope"])
+    monkeypatch.setattr(aix, "ALL_JOBS", aix.ALL_JOBS + ("bad",))
+    assert aix.main(["all", "--jobs", "bad", "-j", "1", "--quiet"]) == 1
+
+
+def test_split16_roundtrip(tmp_path, capsys):
+    (tmp_path / "a.hex").write_text("deadbeef\n01234567\n")
+    assert aix.main(["split16", str(tmp_path / "a.hex"), str(tmp_path / "b.hex")]) == 0
+    assert (tmp_path / "b.hex").read_text().split() == ["beef", "dead", "4567", "0123"]
+    assert aix.main(["split16", "--join", str(tmp_path / "b.hex"), str(tmp_path / "c.hex")]) == 0
+    assert (tmp_path / "c.hex").read_text().split() == ["deadbeef", "01234567"]
+    assert "saved:" in capsys.readouterr().out
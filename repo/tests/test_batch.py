@@ -0,0 +1,68 @@
+"""
+batch 실행 == 프레임별 GraphExecutor, 입력 이미지 stack 읽기
+"""
+import numpy as np
+import pytest
+
+from aixlib.batch import BatchExecutor, load_frames
+from aixlib.feamap import FeatureMap
+from aixlib.graph import Graph, GraphExecutor
+from aixlib.io_hex import write_hex_words
+
+
+def _small_graph() -> Graph:
+    g = Graph()
+    x = g.input("ifm")
+    c0 = g.conv("c0", x, "L0", 8)
+    a0 = g.affine("a0", c0, "L0")
+    p0 = g.maxpool("p0", a0, 2)
+    c1 = g.conv("c1", p0, "L1", 6)
+    a1 = g.affine("a1", c1, "L1")
+    up = g.upsample("up", a1)
+    g.save("out0", g.route("cat", up, a0))
+    g.save("out1", a1)
+    return g
+
+
+def test_batch_executor_matches_graph_executor(rng, random_params):
+    graph = _small_graph()
+    params = random_params({"L0": (4, 8), "L1": (8, 6)})
+    frames = FeatureMap(rng.integers(0, 256, size=(5, 8, 8, 4), dtype=np.uint8), 4)
+
+    single = GraphExecutor(graph, params, log=None)
+    expect = []
+    for i in range(frames.frames):
+        outs = single.run({"ifm": frames.frame(i)})
+        expect.append(np.concatenate([fm.to_words() for fm in outs.values()]))
+
+    got = BatchExecutor(graph, params, batch_size=2, log=None).run(frames, "ifm")
+    assert len(got) == frames.frames
+    for g, e in zip(got, expect):
+        np.testing.assert_array_equal(g, e)
+
+    # fusion 없이 (run_conv / run_affine_from_conv 단계별) batch FeatureMap 그대로
+    outs = GraphExecutor(graph, params, log=None, fuse=False).run({"ifm": frames})
+    for i, e in enumerate(expect):
+        np.testing.assert_array_equal(np.concatenate([fm.frame(i).to_words() for fm in outs.values()]), e)
+
+
+def test_load_frames(rng, tmp_path):
+    frames = rng.integers(0, 256, size=(3, 2, 4, 8), dtype=np.uint8)
+    words = frames.reshape(3, -1).view("<u4")
+
+    (tmp_path / "dir").mkdir()
+    for i in range(3):
+        write_hex_words(tmp_path / "dir" / f"img{i}.hex", words[i])
+    np.save(tmp_path / "stack.npy", frames)
+    words.tofile(tmp_path / "stack.bin")
+    for src, names in ((tmp_path / "dir", ["img0", "img1", "img2"]),
+                       (tmp_path / "stack.npy", ["frame0000", "frame0001", "frame0002"]),
+                       (tmp_path / "stack.bin", ["frame0000", "frame0001", "frame0002"])):
+        batch, got = load_frames(src, 2, 4, 8)
+        assert got == names
+        np.testing.assert_array_equal(batch.data, frames)
+
+    with pytest.raises(ValueError, match="multiple of one frame"):
+        load_frames(tmp_path / "stack.bin", 2, 4, 20)
+    with pytest.raises(ValueError, match="multiple of 4"):
+        load_frames(tmp_path / "stack.bin", 2, 4, 6)
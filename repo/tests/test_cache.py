@@ -0,0 +1,87 @@
+"""
+LayerCache: hit / miss, 파라미터 변경 시 key 변경, LRU 삭제, GraphExecutor 캐시 재사용
+"""
+import os
+
+import numpy as np
+
+from aixlib.cache import LayerCache
+from aixlib.feamap import FeatureMap
+from aixlib.graph import Graph, GraphExecutor
+
+
+def _fm(rng, shape=(4, 4, 8), channels=6) -> FeatureMap:
+    return FeatureMap(rng.integers(0, 256, size=shape, dtype=np.uint8), channels)
+
+
+def test_hit_miss_roundtrip(rng, tmp_path):
+    cache = LayerCache(tmp_path)
+    fm = _fm(rng)
+    key = cache.key("conv", {"cout": 6}, [fm])
+    assert cache.get(key) is None and (cache.hits, cache.misses) == (0, 1)
+    cache.put(key, fm)
+    got = cache.get(key)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert got.channels == 6
+    np.testing.assert_array_equal(got.data, fm.data)
+
+    # 깨진 파일은 지우고 miss
+    next(tmp_path.glob(f"{key}_*.npy")).write_bytes(b"broken")
+    assert cache.get(key) is None and cache.misses == 2
+    assert not list(tmp_path.glob("*.npy"))
+
+
+def test_key_depends_on_content(rng):
+    fm = _fm(rng)
+    filt = rng.integers(0, 256, size=(48, 9), dtype=np.uint8)
+    base = LayerCache.key("conv", {"cout": 6}, filt, [fm])
+    assert LayerCache.key("conv", {"cout": 6}, filt.copy(), [FeatureMap(fm.data.copy(), 6)]) == base
+
+    changed = filt.copy()
+    changed[3, 4] ^= 1
+    assert LayerCache.key("conv", {"cout": 6}, changed, [fm]) != base
+    assert LayerCache.key("conv", {"cout": 4}, filt, [fm]) != base
+    assert LayerCache.key("conv", {"cout": 6}, filt, [FeatureMap(fm.data, 5)]) != base
+    assert LayerCache.key("conv", {"cout": 6}, filt.astype(np.int8), [fm]) != base
+
+
+def test_lru_eviction(rng, tmp_path):
+    fms = [_fm(rng) for _ in range(3)]
+    cache = LayerCache(tmp_path)
+    for i, fm in enumerate(fms):
+        cache.put(f"k{i}", fm)
+        os.utime(next(tmp_path.glob(f"k{i}_*.npy")), (1000 + i, 1000 + i))
+    entry = cache.size_bytes() // 3
+
+    cache.get("k0")                         # k0 갱신 -> k1이 가장 오래됨
+    cache.max_bytes = 2 * entry
+    assert cache.evict() == 1
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None and cache.get("k2") is not None
+
+    cache.put("k3", fms[0])                 # 넘치면 put이 바로 정리
+    assert cache.size_bytes() <= 2 * entry and cache.get("k3") is not None
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_executor_reuses_cache(rng, tmp_path, random_params):
+    g = Graph()
+    g.save("out", g.maxpool("p0", g.affine("a0", g.conv("c0", g.input("ifm"), "L0", 8), "L0"), 2))
+    params = random_params({"L0": (4, 8)})
+    ifm = FeatureMap(rng.integers(0, 256, size=(6, 6, 4), dtype=np.uint8), 4)
+    expect = GraphExecutor(g, params, log=None).run({"ifm": ifm})["out"]
+
+    cache = LayerCache(tmp_path)
+    for fuse, misses in ((True, 1), (False, 3)):
+        for _ in range(2):
+            out = GraphExecutor(g, params, log=None, cache=cache, fuse=fuse).run({"ifm": ifm})["out"]
+            np.testing.assert_array_equal(out.data, expect.data)
+        assert (cache.hits, cache.misses) == (misses, misses)
+        cache.hits = cache.misses = 0
+
+    # 파라미터가 바뀌면 다시 계산
+    params["L0"]["affine"] = params["L0"]["affine"].copy()
+    params["L0"]["affine"][0] ^= 1
+    GraphExecutor(g, params, log=None, cache=cache).run({"ifm": ifm})
+    assert (cache.hits, cache.misses) == (0, 1)
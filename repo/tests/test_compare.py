@@ -0,0 +1,103 @@
+"""
+streaming comparator: 불일치 위치 (layer / y / x / 채널 그룹 / byte lane), 길이 처리, DRAM 덤프 오프셋
+"""
+import numpy as np
+import pytest
+
+import compare_results
+from aixlib.compare import compare_files, compare_streams, format_report, make_regions, parse_layout
+from aixlib.io_hex import write_hex_words
+
+
+def _words(rng, n: int) -> np.ndarray:
+    return rng.integers(0, 1 << 32, size=n, dtype=np.uint64).astype("<u4")
+
+
+def _chunks(words: np.ndarray, n: int) -> list[np.ndarray]:
+    return [words[i:i + n] for i in range(0, words.size, n)]
+
+
+def test_parse_layout():
+    a, b = parse_layout("A=2x3x8, 4x4x6")
+    assert (a.name, a.words, a.offset) == ("A", 2 * 3 * 2, 0)
+    assert (b.name, b.groups, b.offset) == ("R1", 2, 12)
+    assert [r.name for r in parse_layout("yolo")] == ["L08", "L14"]
+    with pytest.raises(ValueError, match="HxWxC"):
+        parse_layout("8x8")
+
+
+def test_mismatch_localization(rng):
+    regions = make_regions([("A", 2, 3, 8), ("B", 4, 4, 4)])
+    expect = _words(rng, 12 + 16 + 5)                       # 뒤 5워드는 영역 밖
+    actual = expect.copy()
+    actual[12 + 2 * 4 + 1] ^= 0x00FF0000                    # B y=2 x=1, 채널 2
+    actual[3] ^= 0x01000001                                 # A y=0 x=1 cg=1, 채널 4, 7
+    actual[30] ^= 1
+    res = compare_streams(_chunks(expect, 7), _chunks(actual, 7), regions)
+    assert not res.ok and res.mismatches == 3 and res.outside == 1
+    assert [(m.layer, m.y, m.x, m.group) for m in res.records] == [("A", 0, 1, 1), ("B", 2, 1, 0), ("-", -1, -1, -1)]
+    assert res.records[1].expect ^ res.records[1].actual == 0x00FF0000
+
+    a, b = res.layers["A"], res.layers["B"]
+    assert a.by_group.tolist() == [0, 1] and a.by_lane.tolist() == [1, 0, 0, 1]
+    assert b.by_row.tolist() == [0, 0, 1, 0] and b.by_lane.tolist() == [0, 0, 1, 0]
+    report = format_report(res)
+    assert report[0] == f"MIS idx=3 layer=A y=0 x=1 cg=1 exp={expect[3]:08x} got={actual[3]:08x}"
+    assert report[-2:] == ["outside layout: 1 mismatches", "FAIL"]
+
+    stopped = compare_streams(_chunks(expect, 7), _chunks(actual, 7), regions, max_errors=2)
+    assert stopped.stopped_early and stopped.mismatches == 2
+
+
+def test_length_difference(rng):
+    regions = make_regions([("A", 4, 4, 4)])
+    words = _words(rng, 16)
+    longer = np.concatenate([words, _words(rng, 3)])
+    res = compare_streams(_chunks(words, 5), _chunks(longer, 5), regions)
+    assert (res.expect_words, res.actual_words, res.ok) == (16, 19, False)
+    assert "length differs: expect=16 actual=19 words" in format_report(res)
+
+    # 잘라서 비교하면 actual이 길어도 통과, 짧으면 실패
+    assert compare_streams(_chunks(words, 5), _chunks(longer, 5), regions, trim_actual=True).ok
+    res = compare_streams(_chunks(words, 5), _chunks(words[:11], 5), regions, trim_actual=True)
+    assert (res.expect_words, res.actual_words, res.ok) == (16, 11, False)
+
+
+@pytest.mark.parametrize("chunk_words", [16, 50, 1 << 22])
+def test_dump_with_offset(rng, tmp_path, chunk_words):
+    expect = _words(rng, 64)
+    write_hex_words(tmp_path / "expect.hex", expect)
+    dump = _words(rng, 1000)
+    dump[400:464] = expect
+    dump.tofile(tmp_path / "ofm.dump")
+    regions = parse_layout("4x4x16")
+
+    res = compare_files(tmp_path / "expect.hex", tmp_path / "ofm.dump", regions,
+                        actual_offset=400 * 4, chunk_words=chunk_words)
+    assert res.ok and (res.expect_words, res.actual_words) == (64, 64)
+
+    # offset 없이 전체를 비교하면 길이와 내용 모두 다름
+    res = compare_files(tmp_path / "expect.hex", tmp_path / "ofm.dump", regions, chunk_words=chunk_words)
+    assert not res.ok and res.actual_words == 1000
+
+    # 덤프가 expect 끝까지 안 닿으면 길이 차이
+    dump[:430].tofile(tmp_path / "short.dump")
+    res = compare_files(tmp_path / "expect.hex", tmp_path / "short.dump", regions,
+                        actual_offset=400 * 4, chunk_words=chunk_words)
+    assert not res.ok and res.mismatches == 0 and res.actual_words == 30
+
+
+def test_cli(rng, tmp_path, capsys):
+    expect = _words(rng, 64)
+    write_hex_words(tmp_path / "expect.hex", expect)
+    dump = np.concatenate([_words(rng, 400), expect, _words(rng, 536)])
+    dump.tofile(tmp_path / "ofm.dump")
+    argv = [str(tmp_path / "expect.hex"), str(tmp_path / "ofm.dump"), "--layout", "4x4x16"]
+    assert compare_results.main(argv + ["--actual-offset", "1600"]) == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "PASS"
+    assert compare_results.main(argv) == 1
+
+    dump[:464].tofile(tmp_path / "ofm.dump")
+    assert compare_results.main(argv + ["--trim-actual"]) == 1
+    dump[400:464].tofile(tmp_path / "ofm.dump")
+    assert compare_results.main(argv + ["--trim-actual"]) == 0
@@ -0,0 +1,53 @@
+"""
+하드웨어 tile 순서 conv (conv_tiled) vs conv2d_int8, psum stream 줄 순서
+"""
+import numpy as np
+import pytest
+
+from aixlib.conv_tiled import conv2d_int8_tiled, PsumStreamWriter, locate_psum_line
+from aixlib.io_hex import read_hex_words
+from aixlib.ops_conv import conv2d_int8
+
+
+@pytest.mark.parametrize("band_rows, tin, tout", [(1, 4, 4), (3, 5, 3), (16, 64, 64)])
+def test_conv2d_tiled_matches_conv2d(rng, band_rows, tin, tout):
+    ifm = rng.integers(-128, 128, size=(7, 9, 12), dtype=np.int8)
+    weights = rng.integers(-128, 128, size=(10, 12, 3, 3), dtype=np.int8)
+    tiles = []
+    out = conv2d_int8_tiled(ifm, weights, band_rows=band_rows, tin=tin, tout=tout,
+                            psum_sink=lambda t: tiles.append(t.psum.copy()))
+    np.testing.assert_array_equal(out, np.moveaxis(conv2d_int8(ifm, weights), 0, -1))
+    assert len(tiles) == -(-10 // tout) * -(-7 // band_rows) * -(-12 // tin)
+
+
+@pytest.mark.parametrize("band_rows, tin, tout", [(1, 4, 4), (2, 5, 3)])
+def test_psum_stream_order(rng, tmp_path, band_rows, tin, tout):
+    H, W, C, M = 5, 4, 12, 6
+    ifm = rng.integers(-128, 128, size=(H, W, C), dtype=np.int8)
+    weights = rng.integers(-128, 128, size=(M, C, 3, 3), dtype=np.int8)
+    path = tmp_path / "psum.hex"
+    with PsumStreamWriter(path) as writer:
+        conv2d_int8_tiled(ifm, weights, band_rows=band_rows, tin=tin, tout=tout, psum_sink=writer)
+    lines = read_hex_words(path).view(np.int32)
+    assert writer.lines == lines.size == H * W * M * -(-C // tin)
+
+    # 줄마다 (tin tile까지 누산한) partial sum = 입력 채널 [0, c1)만 쓴 conv
+    partial = [conv2d_int8(ifm[..., :c1], weights[:, :c1]) for c1 in range(tin, C + tin, tin)]
+    order = []
+    for i, v in enumerate(lines.tolist()):
+        loc = locate_psum_line(i, H, W, C, M, band_rows=band_rows, tin=tin, tout=tout)
+        assert v == partial[loc["tin"]][loc["m"], loc["row"], loc["x"]]
+        order.append((loc["tout"], loc["row"] // band_rows, loc["tin"]))
+    assert order == sorted(order)           # tout → row band → tin
+    with pytest.raises(ValueError, match="out of range"):
+        locate_psum_line(lines.size, H, W, C, M, band_rows=band_rows, tin=tin, tout=tout)
+
+
+def test_tiled_out_buffer(rng):
+    ifm = rng.integers(-128, 128, size=(4, 4, 4), dtype=np.int8)
+    weights = rng.integers(-128, 128, size=(4, 4, 3, 3), dtype=np.int8)
+    out = np.zeros((4, 4, 4), dtype=np.int32)
+    assert conv2d_int8_tiled(ifm, weights, out=out) is out
+    np.testing.assert_array_equal(out, np.moveaxis(conv2d_int8(ifm, weights), 0, -1))
+    with pytest.raises(ValueError, match="int32"):
+        conv2d_int8_tiled(ifm, weights, out=np.zeros((4, 4, 4), dtype=np.int64))
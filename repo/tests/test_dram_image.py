@@ -0,0 +1,65 @@
+"""
+binary DRAM image: header / 섹션 표, hex <-> binary 변환, memmap 섹션 view
+"""
+import numpy as np
+import pytest
+
+from aixlib.dram_image import (HEADER_BYTES, bin_to_hex, hex_to_bin, hex16_to_hex32, hex32_to_hex16, open_dram_bin,
+                               dram_section, read_dram_header, sections_from_info, update_dram_sections,
+                               write_dram_bin)
+from aixlib.io_hex import write_hex_words
+from aixlib.memory import memory_builder_monolayer
+
+
+def test_bin_image_roundtrip(rng, tmp_path):
+    words = rng.integers(0, 1 << 32, size=1000, dtype=np.uint64).astype("<u4")
+    write_hex_words(tmp_path / "m32.hex", words)
+    hex32_to_hex16(tmp_path / "m32.hex", tmp_path / "m16.hex")
+    sections = {"ifm": {"offset": 0, "bytes": 400}}
+    assert hex_to_bin(tmp_path / "m16.hex", tmp_path / "m.bin", 4, sections=sections) == words.size
+    header, mem = open_dram_bin(tmp_path / "m.bin")
+    np.testing.assert_array_equal(mem, words)
+    assert header["sections"] == sections
+    bin_to_hex(tmp_path / "m.bin", tmp_path / "back16.hex", 4)
+    bin_to_hex(tmp_path / "m.bin", tmp_path / "back32.hex", 8)
+    assert (tmp_path / "back16.hex").read_bytes() == (tmp_path / "m16.hex").read_bytes()
+    assert (tmp_path / "back32.hex").read_bytes() == (tmp_path / "m32.hex").read_bytes()
+
+
+def test_sections_and_update(rng, tmp_path):
+    secs = [rng.integers(0, 1 << 32, size=n, dtype=np.uint64).astype("<u4") for n in (20, 36, 8, 8)]
+    info = memory_builder_monolayer(*secs)
+    table = sections_from_info(info, ofm_offset=1 << 20, ofm_bytes=256)
+    assert table["filter"] == {"offset": 32 * 4, "bytes": 48 * 4}
+    path = tmp_path / "m.bin"
+    write_dram_bin(path, info["memory_32b"], table, meta={"layer": "L0"})
+    assert path.stat().st_size == HEADER_BYTES + info["total_lines"] * 4
+
+    header = read_dram_header(path)
+    assert header["total_words"] == info["total_lines"] and header["meta"] == {"layer": "L0"}
+    for name, words in zip(("ifm", "filter", "bias", "scale"), secs):
+        np.testing.assert_array_equal(dram_section(path, name)[:words.size], words)
+    with pytest.raises(ValueError, match="outside"):
+        dram_section(path, "ofm")
+    with pytest.raises(KeyError):
+        dram_section(path, "nope")
+
+    update_dram_sections(path, {"ofm": {"offset": 0, "bytes": 16}})
+    np.testing.assert_array_equal(dram_section(path, "ofm"), secs[0][:4])
+    _, mem = open_dram_bin(path)
+    np.testing.assert_array_equal(mem, info["memory_32b"])
+
+
+def test_hex16_hex32_and_bad_input(rng, tmp_path):
+    words = rng.integers(0, 1 << 32, size=33, dtype=np.uint64).astype("<u4")
+    write_hex_words(tmp_path / "m32.hex", words)
+    assert hex32_to_hex16(tmp_path / "m32.hex", tmp_path / "m16.hex") == 66
+    assert hex16_to_hex32(tmp_path / "m16.hex", tmp_path / "back.hex") == 33
+    assert (tmp_path / "back.hex").read_bytes() == (tmp_path / "m32.hex").read_bytes()
+
+    (tmp_path / "odd.hex").write_text("0001\n0002\n0003\n")
+    with pytest.raises(ValueError, match="odd"):
+        hex_to_bin(tmp_path / "odd.hex", tmp_path / "odd.bin")
+    (tmp_path / "bad.bin").write_bytes(b"x" * 64)
+    with pytest.raises(ValueError, match="magic"):
+        read_dram_header(tmp_path / "bad.bin")
@@ -0,0 +1,70 @@
+"""
+FeatureMap 배치 (y → x → 채널, 4채널 = 32b 워드 1개) 와 hex 문자열 경로 동치성
+"""
+import numpy as np
+import pytest
+
+from aixlib.feamap import FeatureMap
+from aixlib.io_hex import words_to_hex_lines
+from aixlib.ops_conv import run_conv, upsample_words, concat_words
+from aixlib.packers import pack_filter_72b
+
+
+def _words_baseline(mhw: np.ndarray) -> list[str]:
+    """기존 저장 방식: y → x → 4채널씩 LSB-first, 부족한 채널은 0"""
+    M, H, W = mhw.shape
+    out = []
+    for y in range(H):
+        for x in range(W):
+            for m in range(0, M, 4):
+                v = [int(mhw[c, y, x]) if c < M else 0 for c in range(m, m + 4)]
+                out.append(f"{v[0] | v[1] << 8 | v[2] << 16 | v[3] << 24:08x}")
+    return out
+
+
+def test_from_mhw_pads_channels(rng):
+    mhw = rng.integers(0, 256, size=(6, 3, 5), dtype=np.uint8)
+    fm = FeatureMap.from_mhw(mhw)
+    assert (fm.height, fm.width, fm.channels, fm.padded_channels) == (3, 5, 6, 8)
+    assert fm.to_hex() == _words_baseline(mhw)
+    np.testing.assert_array_equal(fm.to_mhw(), mhw)
+
+
+def test_words_roundtrip(rng):
+    words = rng.integers(0, 1 << 32, size=4 * 5 * 3, dtype=np.uint64).astype("<u4")
+    fm = FeatureMap.from_words(words, 4, 5, 12)
+    np.testing.assert_array_equal(fm.to_words(), words)
+    assert FeatureMap.from_hex(words_to_hex_lines(words), 4, 5, 12).to_hex() == fm.to_hex()
+    acc = FeatureMap.from_words(words, 4, 5, 3, dtype=np.int32)
+    assert acc.data.dtype == np.int32 and acc.data.shape == (4, 5, 3)
+    with pytest.raises(ValueError, match="not enough"):
+        FeatureMap.from_words(words[:-1], 4, 5, 12)
+
+
+def test_batch_frames(rng):
+    data = rng.integers(0, 256, size=(3, 2, 4, 8), dtype=np.uint8)
+    fm = FeatureMap(data, 7)
+    assert fm.frames == 3 and FeatureMap(data[0], 7).frames is None
+    assert (fm.height, fm.width, fm.padded_channels) == (2, 4, 8)
+    np.testing.assert_array_equal(fm.frame(1).to_words(), FeatureMap(data[1], 7).to_words())
+    np.testing.assert_array_equal(fm.to_mhw()[2], FeatureMap(data[2], 7).to_mhw())
+
+
+def test_run_conv_is_quiet(rng, capsys):
+    ifm = FeatureMap(rng.integers(0, 256, size=(4, 4, 4), dtype=np.uint8), 4)
+    filt_72b = pack_filter_72b(rng.integers(-128, 128, size=(4, 4, 3, 3), dtype=np.int8))
+    run_conv(ifm, filt_72b, 4)
+    run_conv(ifm, filt_72b, 4, tiled=True)
+    assert capsys.readouterr().out == ""
+
+
+def test_upsample_concat(rng):
+    a = FeatureMap(rng.integers(0, 256, size=(3, 4, 8), dtype=np.uint8), 6)
+    b = FeatureMap(rng.integers(0, 256, size=(6, 8, 4), dtype=np.uint8), 4)
+    up = upsample_words(a, 2, 2)
+    assert up.data.shape == (6, 8, 8) and (up.data[1::2, 1::2] == a.data).all()
+    cat = concat_words(up, b)
+    assert cat.channels == 12
+    np.testing.assert_array_equal(cat.data, np.concatenate([up.data, b.data], axis=2))
+    with pytest.raises(ValueError):
+        concat_words(a, b)
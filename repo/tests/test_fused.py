@@ -0,0 +1,32 @@
+"""
+run_layer_fused (conv → affine → maxpool 한 번에) == 단계별 계산
+"""
+import numpy as np
+import pytest
+
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import run_conv, run_affine_from_conv, run_layer_fused, maxpool_from_affine_words
+
+
+@pytest.mark.parametrize("stride", [0, 1, 2])
+def test_run_layer_fused_matches_steps(rng, random_params, stride):
+    M = 6
+    p = random_params({"L": (8, M)})["L"]
+    filt_72b, affine = p["filt_72b"], p["affine"]
+    ifm = FeatureMap(rng.integers(0, 256, size=(6, 5, 8), dtype=np.uint8), 8)
+    affine_fm = run_affine_from_conv(run_conv(ifm, filt_72b, M), affine)
+    expect = maxpool_from_affine_words(affine_fm, stride) if stride else affine_fm
+    stages = {}
+    out = run_layer_fused(ifm, filt_72b, affine, M, stride, intermediates=stages)
+    np.testing.assert_array_equal(out.to_words(), expect.to_words())
+    np.testing.assert_array_equal(stages["affine"].to_words(), affine_fm.to_words())
+
+
+def test_run_layer_fused_batch(rng, random_params):
+    p = random_params({"L": (4, 8)})["L"]
+    frames = FeatureMap(rng.integers(0, 256, size=(3, 6, 6, 4), dtype=np.uint8), 4)
+    out = run_layer_fused(frames, p["filt_72b"], p["affine"], 8, 2)
+    assert out.frames == 3
+    for i in range(3):
+        single = run_layer_fused(frames.frame(i), p["filt_72b"], p["affine"], 8, 2)
+        np.testing.assert_array_equal(out.frame(i).to_words(), single.to_words())
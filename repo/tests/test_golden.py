@@ -0,0 +1,27 @@
+"""
+체크인된 hw/inout_data testcase expect 재생성
+"""
+import numpy as np
+import pytest
+
+from aixlib.io_hex import read_hex_words
+from aixlib.ops_conv import run_conv, run_affine_from_conv, run_layer_fused, maxpool_from_affine_words
+from aixlib.packers import pack_filter_72b, pack_filter_32b
+
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_testcase_expects(inout_dir, load_testcase, n):
+    ifm, filt, weight_32b, affine, M = load_testcase(n)
+    assert np.array_equal(pack_filter_32b(ifm.padded_channels, M, filt, as_words=True), weight_32b)
+    filt_72b = pack_filter_72b(filt)
+
+    expect = {name: read_hex_words(inout_dir / "expect" / f"test{n}_{name}_result_32b.hex")
+              for name in ("conv", "affine", "maxpool_stride1", "maxpool_stride2")}
+    conv = run_conv(ifm, filt_72b, M)
+    affine_fm = run_affine_from_conv(conv, affine)
+    np.testing.assert_array_equal(conv.to_words(), expect["conv"])
+    np.testing.assert_array_equal(affine_fm.to_words(), expect["affine"])
+    np.testing.assert_array_equal(maxpool_from_affine_words(affine_fm, 1).to_words(), expect["maxpool_stride1"])
+    np.testing.assert_array_equal(run_layer_fused(ifm, filt_72b, affine, M, pool_stride=2).to_words(),
+                                  expect["maxpool_stride2"])
+    np.testing.assert_array_equal(run_conv(ifm, filt_72b, M, tiled=True).to_words(), expect["conv"])
@@ -0,0 +1,104 @@
+"""
+Graph 분석 (consumers / last_use / fusion_groups), route, GraphExecutor liveness · fusion
+"""
+import numpy as np
+import pytest
+
+from aixlib.feamap import FeatureMap
+from aixlib.graph import Graph, GraphExecutor
+from aixlib.ops_conv import run_conv, run_affine_from_conv, maxpool_from_affine_words, concat_words
+
+
+def _graph() -> Graph:
+    g = Graph()
+    x = g.input("ifm")
+    a0 = g.affine("a0", g.conv("c0", x, "L0", 8), "L0")
+    p0 = g.maxpool("p0", a0, 2)
+    a1 = g.affine("a1", g.conv("c1", p0, "L1", 4), "L1")
+    c2 = g.conv("c2", a1, "L2", 4)                        # 소비자 2개 -> fusion 안 함
+    a2 = g.affine("a2", c2, "L2")
+    g.save("out0", g.route("cat", g.upsample("up", a2), a0))
+    g.save("out1", g.route("r1", c2))
+    return g
+
+
+def test_builder_errors():
+    g = Graph()
+    x = g.input("ifm")
+    with pytest.raises(ValueError, match="duplicate"):
+        g.input("ifm")
+    with pytest.raises(ValueError, match="unknown input"):
+        g.conv("c0", "nope", "L0", 4)
+    with pytest.raises(ValueError, match="stride"):
+        g.maxpool("p0", x, 3)
+    with pytest.raises(ValueError, match="at least one"):
+        g.route("r0")
+
+
+def test_consumers_and_last_use():
+    g = _graph()
+    users = g.consumers()
+    assert users["a0"] == ["p0", "cat"] and users["c2"] == ["a2", "r1"] and users["out0"] == []
+    assert g.outputs == ["out0", "out1"]
+
+    last = g.last_use()
+    index = {n.name: i for i, n in enumerate(g.nodes)}
+    assert last["ifm"] == index["c0"]
+    assert last["a0"] == index["cat"]                     # route가 끝날 때까지 유지
+    assert last["c2"] == index["r1"]
+    assert last["out0"] == last["out1"] == len(g.nodes)   # 출력은 끝까지
+
+
+def test_fusion_groups():
+    groups = _graph().fusion_groups()
+    # a0는 소비자가 2개라 p0까지 묶지 않고, c2는 conv 결과를 r1도 쓰므로 제외
+    assert {k: [n.name for n in v] for k, v in groups.items()} == {"c0": ["c0", "a0"], "c1": ["c1", "a1"]}
+
+    # 중간 텐서 소비자가 하나뿐이면 conv → affine → maxpool 전체가 한 체인
+    g = Graph()
+    p = g.maxpool("p0", g.affine("a0", g.conv("c0", g.input("ifm"), "L0", 4), "L0"), 1)
+    g.save("out", p)
+    assert [n.name for n in g.fusion_groups()["c0"]] == ["c0", "a0", "p0"]
+
+    # affine 파라미터가 다른 레이어면 fusion 안 함
+    g = Graph()
+    g.save("out", g.affine("a0", g.conv("c0", g.input("ifm"), "L0", 4), "L1"))
+    assert g.fusion_groups() == {}
+
+
+def test_executor_matches_steps(rng, random_params):
+    params = random_params({"L0": (4, 8), "L1": (8, 4), "L2": (4, 4)})
+    ifm = FeatureMap(rng.integers(0, 256, size=(8, 8, 4), dtype=np.uint8), 4)
+
+    def step(src, key, cout):
+        return run_affine_from_conv(run_conv(src, params[key]["filt_72b"], cout), params[key]["affine"])
+
+    a0 = step(ifm, "L0", 8)
+    a1 = step(maxpool_from_affine_words(a0, 2), "L1", 4)
+    c2 = run_conv(a1, params["L2"]["filt_72b"], 4)
+    a2 = run_affine_from_conv(c2, params["L2"]["affine"])
+    up = FeatureMap(a2.data.repeat(2, axis=0).repeat(2, axis=1), a2.channels)
+
+    logged = []
+    for fuse in (True, False):
+        outs = GraphExecutor(_graph(), params, log=logged.append, fuse=fuse).run({"ifm": ifm})
+        assert list(outs) == ["out0", "out1"]
+        np.testing.assert_array_equal(outs["out0"].data, concat_words(up, a0).data)
+        assert outs["out1"].data.dtype == np.int32
+        np.testing.assert_array_equal(outs["out1"].data, c2.data)
+    assert len(logged) == 2 * 3 and logged[0].startswith("[L0] width=8 height=8 cin=4 cout=8")
+
+    with pytest.raises(KeyError, match="ifm"):
+        GraphExecutor(_graph(), params, log=None).run({})
+
+
+def test_executor_frees_dead_tensors(rng):
+    g = Graph()
+    up = g.upsample("up2", g.upsample("up1", g.input("ifm")))
+    g.save("out", up)
+    ifm = FeatureMap(rng.integers(0, 256, size=(4, 4, 4), dtype=np.uint8), 4)
+    ex = GraphExecutor(g, {}, log=None)
+    out = ex.run({"ifm": ifm})["out"]
+    assert out.data.shape == (16, 16, 4)
+    # up2 실행 시점에 ifm은 이미 해제: live = up1 (4배) + up2 (16배), save는 up2의 alias
+    assert (ex.peak_bytes, ex.peak_node) == (20 * ifm.data.nbytes, "up2")
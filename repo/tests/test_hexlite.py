@@ -0,0 +1,73 @@
+"""
+hexlite (numpy 없는 hex 경로) == io_hex / packers / memory_builder_monolayer, align_up
+"""
+import numpy as np
+import pytest
+
+from aixlib import hexlite
+from aixlib.dram_image import hex32_to_hex16
+from aixlib.io_hex import read_hex_words, read_32b_hex_lines, write_hex_words
+from aixlib.memory import memory_builder_monolayer
+from aixlib.packers import pack_filter_32b, pack_affine
+
+
+def test_align_up():
+    assert [hexlite.align_up(n) for n in (0, 1, 16, 17)] == [0, 16, 16, 32]
+    assert hexlite.align_up(65, 64) == 128 and hexlite.align_up(7, 4) == 8
+
+
+# ------------------------------
+# hex 읽기 / 16b 분할
+# ------------------------------
+def test_hexlite_matches_io_hex(rng, tmp_path):
+    src = tmp_path / "a.hex"
+    src.write_text("0x12\nAB\n\n000000001ff\n" + "".join(f"{v:08x}\n" for v in range(100)))
+    assert [int(l, 16) for l in hexlite.read_hex_lines(src)] == read_hex_words(src).tolist()
+
+    hexlite.split_hex32(src, tmp_path / "lite16.hex")
+    hex32_to_hex16(src, tmp_path / "np16.hex")
+    assert (tmp_path / "lite16.hex").read_bytes() == (tmp_path / "np16.hex").read_bytes()
+    hexlite.join_hex16(tmp_path / "lite16.hex", tmp_path / "back.hex")
+    assert (tmp_path / "back.hex").read_text().split() == read_32b_hex_lines(src)
+
+    (tmp_path / "bad.hex").write_text("12\nzz\n")
+    with pytest.raises(ValueError, match="line 2"):
+        hexlite.read_hex_lines(tmp_path / "bad.hex")
+
+
+# ------------------------------
+# 패커
+# ------------------------------
+def test_hexlite_packers(rng, tmp_path):
+    cin, cout, M = 8, 16, 16
+    w = rng.integers(-128, 128, size=cin * cout * 9).astype(np.int64) & 0xFFFFFFFF
+    write_hex_words(tmp_path / "w.hex", w.astype("<u4"))
+    hexlite.pack_weight_hex(tmp_path / "w.hex", tmp_path / "p.hex", cin, cout)
+    np.testing.assert_array_equal(read_hex_words(tmp_path / "p.hex"),
+                                  pack_filter_32b(cin, cout, w.astype("<u4"), as_words=True))
+
+    bias = rng.integers(0, 1 << 32, size=M + 3, dtype=np.uint64).astype("<u4")
+    scale = rng.integers(0, 1 << 32, size=M + 3, dtype=np.uint64).astype("<u4")
+    write_hex_words(tmp_path / "b.hex", bias)
+    write_hex_words(tmp_path / "s.hex", scale)
+    hexlite.pack_affine_hex(tmp_path / "b.hex", tmp_path / "s.hex", tmp_path / "a.hex", M)
+    np.testing.assert_array_equal(read_hex_words(tmp_path / "a.hex"), pack_affine(M, bias, scale))
+    with pytest.raises(ValueError, match="not enough"):
+        hexlite.pack_affine_hex(tmp_path / "b.hex", tmp_path / "s.hex", tmp_path / "a.hex", M + 4)
+
+
+# ------------------------------
+# memory
+# ------------------------------
+def test_memory_image_matches_hexlite(rng, tmp_path):
+    secs = [rng.integers(0, 1 << 32, size=n, dtype=np.uint64).astype("<u4") for n in (40, 37, 5, 5)]
+    paths = []
+    for i, words in enumerate(secs):
+        paths.append(tmp_path / f"s{i}.hex")
+        write_hex_words(paths[-1], words)
+    info = memory_builder_monolayer(*secs)
+    lite = hexlite.build_memory_hex(*paths, out_16b=tmp_path / "m16.hex", out_32b=tmp_path / "m32.hex")
+    assert {k: info[k] for k in lite} == lite
+    assert info["filter_offset"] == 48 and info["total_lines"] == 48 + 48 + 16 + 16
+    np.testing.assert_array_equal(read_hex_words(tmp_path / "m32.hex"), info["memory_32b"])
+    np.testing.assert_array_equal(read_hex_words(tmp_path / "m16.hex", 4), info["memory"])
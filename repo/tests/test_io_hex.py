@@ -0,0 +1,43 @@
+"""
+hex codec (io_hex) vs 기존 문자열/int 구현
+"""
+import numpy as np
+import pytest
+
+from aixlib.io_hex import (decode_hex_words, iter_hex_words, read_hex_words, read_32b_hex_lines,
+                           write_hex_words, format_hex_words, words_to_hex_lines)
+
+
+def _read_baseline(text: str, digits: int = 8) -> list[int]:
+    """기존 read_32b_hex_lines: strip 후 빈 줄 제외, int(s, 16) (하위 digits자리로)"""
+    return [int(s.strip(), 16) & ((1 << 4 * digits) - 1) for s in text.splitlines() if s.strip()]
+
+
+@pytest.mark.parametrize("text", [
+    "0000000a\n0000000b\n",
+    "a\r\nFFFFFFFF\r\n\r\n  1234 \n",
+    "0x12\n0XdeadBEEF\n000000001ff\n",
+    "\n\n00000001",
+    "",
+])
+def test_decode_matches_int_reader(text):
+    words = decode_hex_words(text.encode())
+    assert words.dtype == np.uint32
+    assert words.tolist() == _read_baseline(text)
+
+
+def test_decode_16b_and_errors():
+    assert decode_hex_words(b"ffff\n1\n", digits=4).tolist() == [0xFFFF, 1]
+    with pytest.raises(ValueError, match="line 3"):
+        decode_hex_words(b"00000001\n00000002\nzz\n")
+
+
+def test_hex_roundtrip_and_chunks(rng, tmp_path):
+    words = rng.integers(0, 1 << 32, size=5000, dtype=np.uint64).astype(np.uint32)
+    path = tmp_path / "w.hex"
+    write_hex_words(path, words)
+    assert path.read_bytes() == format_hex_words(words)
+    assert path.read_text().split() == words_to_hex_lines(words)
+    np.testing.assert_array_equal(read_hex_words(path), words)
+    np.testing.assert_array_equal(np.concatenate(list(iter_hex_words(path, chunk_bytes=1000))), words)
+    assert read_32b_hex_lines(path) == [f"{v:08x}" for v in words.tolist()]
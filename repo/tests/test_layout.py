@@ -0,0 +1,71 @@
+"""
+DRAM layout planner: 기본 배치 == yolo_layer_cfg.vh / memory_builder_monolayer, DMA burst 수, cfg 패치
+"""
+import numpy as np
+import pytest
+
+from aixlib.layout import LayoutConfig, plan_layout, build_image, dma_bursts, patch_layer_cfg
+from aixlib.memory import memory_builder_monolayer
+from aixlib.yolo import YOLO_LAYERS, ConvLayer
+
+YOLO_IFM_BYTES = 256 * 256 * 4
+
+
+def _layers() -> list[ConvLayer]:
+    return [ConvLayer("A", "P0", 4, 4, 4, 8, 3, 8), ConvLayer("B", "P1", 4, 4, 8, 4, 8, 3)]
+
+
+def test_default_plan_matches_layer_cfg():
+    plan = plan_layout(YOLO_LAYERS, YOLO_IFM_BYTES)
+    assert {s: b.offset for s, b in plan.sections.items()} == {
+        "ifm": 0, "filter": 262144, "bias": 6068800, "scale": 6078016}
+    assert plan.ofm.offset == 8388608
+    assert plan.block("filter", YOLO_LAYERS[0].name).offset == 262144
+    assert plan_layout(YOLO_LAYERS, YOLO_IFM_BYTES, LayoutConfig()).sections == plan.sections
+
+
+def test_plan_matches_memory_builder(rng):
+    layer = _layers()[0]
+    ifm = rng.integers(0, 1 << 32, size=20, dtype=np.uint64).astype("<u4")
+    filt = rng.integers(0, 1 << 32, size=layer.cout * layer.cin * 9 // 4, dtype=np.uint64).astype("<u4")
+    bias, scale = (rng.integers(0, 1 << 32, size=layer.cout, dtype=np.uint64).astype("<u4") for _ in range(2))
+    expect = memory_builder_monolayer(ifm, filt, bias, scale)
+
+    plan = plan_layout([layer], ifm.size * 4, LayoutConfig(ofm_offset=1 << 20))
+    got = build_image(plan, ifm, [filt], [bias], [scale])
+    for k in ("ifm_offset", "filter_offset", "bias_offset", "scale_offset", "total_lines"):
+        assert got[k] == expect[k], k
+    np.testing.assert_array_equal(got["memory_32b"], expect["memory_32b"])
+    with pytest.raises(ValueError, match="planned"):
+        build_image(plan, ifm, [filt[:-1]], [bias], [scale])
+
+
+def test_block_align_and_errors():
+    plan = plan_layout(_layers(), 100, LayoutConfig(block_align=64, ofm_offset=1 << 20))
+    a, b = plan.block("bias", "A"), plan.block("bias", "B")
+    assert a.offset % 64 == 0 and b.offset == a.offset + 64 and b.nbytes == 16
+    with pytest.raises(ValueError, match="power of two"):
+        LayoutConfig(section_align=48)
+    with pytest.raises(ValueError, match="overlaps"):
+        plan_layout(_layers(), 100, LayoutConfig(ofm_offset=64))
+
+
+def test_dma_bursts():
+    assert dma_bursts(0, 0) == 0
+    assert dma_bursts(0, 64) == 1 and dma_bursts(0, 65) == 2
+    assert dma_bursts(4064, 64) == 2                        # 4KB page 경계를 넘음
+    assert dma_bursts(4080, 64, LayoutConfig(burst_beats=8)) == 3    # 32B 요청 2개 중 첫 번째가 경계를 넘음
+
+
+def test_patch_layer_cfg(inout_dir):
+    text = (inout_dir.parent / "src" / "yolo_layer_cfg.vh").read_text()
+    assert patch_layer_cfg(text, plan_layout(YOLO_LAYERS, YOLO_IFM_BYTES)) == text
+
+    plan = plan_layout(YOLO_LAYERS, YOLO_IFM_BYTES, LayoutConfig(section_align=4096))
+    patched = patch_layer_cfg(text, plan, expect_lines=1234)
+    changed = [(a, b) for a, b in zip(text.splitlines(), patched.splitlines()) if a != b]
+    assert all("YOLO_DRAM_" in a or "YOLO_EXPECT_LINE" in a for a, _ in changed)
+    assert f"YOLO_DRAM_BIAS_OFFSET   {plan.sections['bias'].offset}" in patched
+    assert plan.sections["bias"].offset % 4096 == 0
+    with pytest.raises(ValueError, match="no YOLO_DRAM"):
+        patch_layer_cfg("`define OTHER 1\n", plan)
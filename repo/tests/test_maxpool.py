@@ -0,0 +1,41 @@
+"""
+2x2 maxpool (stride 1: 위/왼쪽 zero padding, stride 2) vs 기존 loop 구현
+"""
+import numpy as np
+import pytest
+
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import _maxpool_2x2, maxpool_from_affine_words
+
+
+def _maxpool_baseline(x: np.ndarray, stride: int) -> np.ndarray:
+    """기존 maxpool_from_affine_words의 loop"""
+    H, W, C = x.shape
+    if stride == 1:
+        x = np.pad(x, ((1, 0), (1, 0), (0, 0)))
+        oH, oW = H, W
+    else:
+        oH, oW = 1 + (H - 2) // stride, 1 + (W - 2) // stride
+    out = np.zeros((oH, oW, C), dtype=x.dtype)
+    for y in range(oH):
+        for xx in range(oW):
+            ys, xs = y * stride, xx * stride
+            out[y, xx] = x[ys:ys + 2, xs:xs + 2].max(axis=(0, 1))
+    return out
+
+
+@pytest.mark.parametrize("H, W", [(4, 4), (5, 7), (2, 3)])
+@pytest.mark.parametrize("stride", [1, 2])
+def test_maxpool_matches_baseline(rng, H, W, stride):
+    x = rng.integers(0, 256, size=(H, W, 8), dtype=np.uint8)
+    np.testing.assert_array_equal(_maxpool_2x2(x, stride), _maxpool_baseline(x, stride))
+    batch = np.stack([x, x[::-1]])
+    np.testing.assert_array_equal(_maxpool_2x2(batch, stride)[1], _maxpool_baseline(x[::-1], stride))
+
+
+@pytest.mark.parametrize("stride", [1, 2])
+def test_maxpool_feature_map(rng, stride):
+    fm = FeatureMap(rng.integers(0, 256, size=(6, 4, 8), dtype=np.uint8), 6)
+    out = maxpool_from_affine_words(fm, stride)
+    assert out.channels == 6
+    np.testing.assert_array_equal(out.data, _maxpool_baseline(fm.data, stride))
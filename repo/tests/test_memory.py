@@ -0,0 +1,33 @@
+"""
+memory_builder_monolayer: 체크인된 testcase DRAM 이미지 재생성, 16줄 정렬, mmap 버퍼
+"""
+import numpy as np
+import pytest
+
+from aixlib.io_hex import read_hex_words
+from aixlib.memory import memory_builder_monolayer
+
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_testcase_memory(inout_dir, load_testcase, n):
+    ifm, _, weight_32b, affine, M = load_testcase(n)
+    info = memory_builder_monolayer(ifm.to_words(), weight_32b, affine[:M], affine[M:])
+    np.testing.assert_array_equal(info["memory"], read_hex_words(inout_dir / "dram" / f"test{n}_memory_16b.hex", 4))
+
+
+def test_memory_sections_and_mmap(rng, tmp_path):
+    secs = [rng.integers(0, 1 << 32, size=n, dtype=np.uint64).astype("<u4") for n in (20, 16, 3, 3)]
+    info = memory_builder_monolayer(*secs)
+    assert [info[k] for k in ("ifm_offset", "filter_offset", "bias_offset", "scale_offset")] == [0, 32, 48, 64]
+    assert info["total_lines"] == 80 and info["total_lines_16b"] == 160
+    mem = info["memory_32b"]
+    for sec, off in zip(secs, (0, 32, 48, 64)):
+        np.testing.assert_array_equal(mem[off:off + sec.size], sec)
+    assert not mem[20:32].any() and not mem[51:64].any()
+    assert info["memory"][0] == secs[0][0] & 0xFFFF and info["memory"][1] == secs[0][0] >> 16
+
+    path = tmp_path / "sub" / "mem.raw"
+    mapped = memory_builder_monolayer(*secs, mmap_path=path)
+    assert isinstance(mapped["memory_32b"], np.memmap)
+    mapped["memory_32b"].flush()
+    np.testing.assert_array_equal(np.fromfile(path, dtype="<u4"), mem)
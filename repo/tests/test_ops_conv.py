@@ -0,0 +1,91 @@
+"""
+ops_conv conv: 벡터화 conv2d_int8 vs 기준 구현 (_conv_reference, 기존 loop 구현), 32b wrap-around, run_conv 경로
+"""
+import numpy as np
+import pytest
+
+from aixlib.conv_tiled import conv2d_int8_tiled
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import conv2d_int8, _conv_reference, run_conv
+from aixlib.packers import pack_filter_72b
+
+
+def _rand_i8(rng, shape):
+    return rng.integers(-128, 128, size=shape, dtype=np.int8)
+
+
+def _conv_wrap(ifm: np.ndarray, weights: np.ndarray, pad: int) -> np.ndarray:
+    """int64로 누산 후 32b wrap-around (하드웨어 psum과 같음). (M, H_out, W_out)"""
+    M, C, K, _ = weights.shape
+    x = np.pad(ifm.astype(np.int64), ((pad, pad), (pad, pad), (0, 0)))
+    H_out, W_out = x.shape[0] - K + 1, x.shape[1] - K + 1
+    acc = np.zeros((M, H_out, W_out), dtype=np.int64)
+    for ky in range(K):
+        for kx in range(K):
+            acc += np.einsum("hwc,mc->mhw", x[ky:ky + H_out, kx:kx + W_out], weights[:, :, ky, kx].astype(np.int64))
+    return acc.astype(np.int32)
+
+
+# ------------------------------
+# conv
+# ------------------------------
+@pytest.mark.parametrize("H, W, C, M, K, pad", [
+    (1, 1, 4, 4, 3, 1),
+    (5, 7, 3, 5, 3, 1),
+    (8, 6, 8, 12, 3, 1),
+    (6, 5, 4, 3, 3, 0),
+    (4, 4, 5, 2, 1, 0),
+    (9, 4, 16, 8, 3, 2),
+])
+def test_conv2d_matches_reference(rng, H, W, C, M, K, pad):
+    ifm = _rand_i8(rng, (H, W, C))
+    weights = _rand_i8(rng, (M, C, K, K))
+    out = conv2d_int8(ifm, weights, pad)
+    assert out.dtype == np.int32
+    np.testing.assert_array_equal(out, _conv_reference(ifm, weights, pad))
+
+
+def test_conv2d_int8_extremes(rng):
+    ifm = rng.choice(np.array([-128, 127, 0], dtype=np.int8), size=(6, 6, 16))
+    weights = rng.choice(np.array([-128, 127], dtype=np.int8), size=(8, 16, 3, 3))
+    np.testing.assert_array_equal(conv2d_int8(ifm, weights), _conv_reference(ifm, weights))
+
+
+def test_conv2d_int32_wraparound():
+    # 가운데 출력은 9 * C * 128 * 128 = 9 * 2^28 > 2^31 -> 32b wrap-around
+    C = 1 << 14
+    ifm = np.full((3, 3, C), -128, dtype=np.int8)
+    weights = np.full((2, C, 3, 3), -128, dtype=np.int8)
+    weights[1] = 127
+    out = conv2d_int8(ifm, weights)
+    expect = _conv_wrap(ifm, weights, 1)
+    assert expect[0, 1, 1] == np.int64(9 * C * 128 * 128).astype(np.int32)
+    np.testing.assert_array_equal(out, expect)
+    np.testing.assert_array_equal(np.moveaxis(conv2d_int8_tiled(ifm, weights), -1, 0), expect)
+
+
+def test_conv2d_batch_matches_frames(rng):
+    ifm = _rand_i8(rng, (3, 6, 5, 8))
+    weights = _rand_i8(rng, (6, 8, 3, 3))
+    out = conv2d_int8(ifm, weights)
+    assert out.shape == (3, 6, 6, 5)
+    for i in range(3):
+        np.testing.assert_array_equal(out[i], conv2d_int8(ifm[i], weights))
+
+
+# ------------------------------
+# FeatureMap 단위 경로
+# ------------------------------
+def _layer(rng, H=6, W=5, C=8, M=6):
+    ifm = FeatureMap(rng.integers(0, 256, size=(H, W, C), dtype=np.uint8), C)
+    w = _rand_i8(rng, (M, C, 3, 3))
+    return ifm, w, pack_filter_72b(w), M
+
+
+def test_run_conv_paths_agree(rng):
+    ifm, w, filt_72b, M = _layer(rng)
+    ref = run_conv(ifm, filt_72b, M, reference=True)
+    expect = _conv_reference(ifm.data.view(np.int8), w)
+    np.testing.assert_array_equal(ref.to_mhw(), expect)
+    for kwargs in ({}, {"tiled": True}, {"out": np.empty((6, 5, M), dtype=np.int32)}):
+        np.testing.assert_array_equal(run_conv(ifm, filt_72b, M, **kwargs).data, ref.data)
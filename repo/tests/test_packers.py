@@ -0,0 +1,52 @@
+"""
+weight / affine 패커 vs 기존 문자열 구현
+"""
+import numpy as np
+import pytest
+
+from aixlib.io_hex import words_to_hex_lines
+from aixlib.packers import pack_filter_72b, pack_filter_32b, pack_affine
+
+
+def _lsb(lines: list[str]) -> list[str]:
+    return [f"{int(s, 16) & 0xFF:02x}" for s in lines]
+
+
+def _pack_72b_baseline(lines: list[str]) -> list[str]:
+    b = _lsb(lines)
+    return ["".join(reversed(b[i:i + 9])) for i in range(0, len(b), 9)]
+
+
+def _pack_32b_baseline(cin: int, cout: int, lines: list[str]) -> list[str]:
+    b = _lsb(lines)
+    out = []
+    for cg in range(0, cout, 4):
+        for ci in range(cin):
+            for k in range(9):
+                w = [b[((co * cin) + ci) * 9 + k] for co in range(cg, cg + 4)]
+                out.append(w[3] + w[2] + w[1] + w[0])
+    return out
+
+
+def _random_weight_lines(rng, n: int) -> list[str]:
+    return [f"{v:08x}" for v in rng.integers(-128, 128, size=n).astype(np.int64) & 0xFFFFFFFF]
+
+
+@pytest.mark.parametrize("cin, cout", [(4, 4), (8, 16), (3, 8)])
+def test_packers_match_baseline(rng, cin, cout):
+    lines = _random_weight_lines(rng, cin * cout * 9)
+    assert pack_filter_72b(lines) == _pack_72b_baseline(lines)
+    assert pack_filter_32b(cin, cout, lines) == _pack_32b_baseline(cin, cout, lines)
+    words = pack_filter_32b(cin, cout, np.array([int(s, 16) for s in lines], dtype="<u4"), as_words=True)
+    assert words_to_hex_lines(words) == _pack_32b_baseline(cin, cout, lines)
+
+
+def test_pack_affine(rng):
+    M = 8
+    bias = rng.integers(-(1 << 31), 1 << 31, size=M + 3, dtype=np.int64).astype("<i4")
+    scale = rng.integers(0, 1 << 32, size=M + 3, dtype=np.uint64).astype("<u4")
+    bias_lines = words_to_hex_lines(bias.view("<u4"))
+    scale_lines = words_to_hex_lines(scale)
+    expect = bias_lines[:M] + scale_lines[:M]
+    assert pack_affine(M, bias_lines, scale_lines) == expect
+    assert words_to_hex_lines(pack_affine(M, bias, scale)) == expect
@@ -0,0 +1,48 @@
+"""
+conv2d_int8_parallel == conv2d_int8 (bit-identical), 출력 채널 tile 분할
+"""
+import numpy as np
+import pytest
+
+from aixlib import parallel
+from aixlib.feamap import FeatureMap
+from aixlib.ops_conv import conv2d_int8, run_conv
+from aixlib.packers import pack_filter_72b
+
+
+@pytest.fixture
+def always_parallel(monkeypatch):
+    """작은 conv도 프로세스 풀로 보내도록"""
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_MACS", 0)
+    yield
+    parallel.shutdown_pools()
+
+
+@pytest.mark.parametrize("M, n_chunks", [(4, 2), (10, 2), (16, 3), (64, 4), (6, 8)])
+def test_tile_ranges(M, n_chunks):
+    ranges = parallel.tile_ranges(M, n_chunks)
+    assert ranges[0][0] == 0 and ranges[-1][1] == M
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(m0 % parallel.TOUT == 0 for m0, _ in ranges)
+    assert len(ranges) <= min(n_chunks, -(-M // parallel.TOUT))
+
+
+@pytest.mark.parametrize("shape, M, workers", [
+    ((7, 9, 8), 10, 2),         # 마지막 tile이 2채널
+    ((5, 6, 12), 16, 3),        # tile 4개를 3개 worker로
+    ((2, 6, 5, 8), 12, 2),      # batch 축
+])
+def test_parallel_matches_serial(rng, always_parallel, shape, M, workers):
+    ifm = rng.integers(-128, 128, size=shape, dtype=np.int8)
+    weights = rng.integers(-128, 128, size=(M, shape[-1], 3, 3), dtype=np.int8)
+    out = parallel.conv2d_int8_parallel(ifm, weights, workers=workers)
+    assert out.dtype == np.int32
+    np.testing.assert_array_equal(out, conv2d_int8(ifm, weights))
+
+
+def test_run_conv_workers(rng, always_parallel):
+    ifm = FeatureMap(rng.integers(0, 256, size=(6, 6, 8), dtype=np.uint8), 8)
+    filt_72b = pack_filter_72b(rng.integers(-128, 128, size=(10, 8, 3, 3), dtype=np.int8))
+    serial = run_conv(ifm, filt_72b, 10)
+    np.testing.assert_array_equal(run_conv(ifm, filt_72b, 10, workers=2).data, serial.data)
+    assert parallel._pools                  # 풀을 실제로 사용
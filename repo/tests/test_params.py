@@ -0,0 +1,61 @@
+"""
+ParamStore (lazy decode / mmap archive), load_layer_params 패딩 · 줄 수 검사
+"""
+import shutil
+
+import numpy as np
+import pytest
+
+from aixlib.io_hex import read_hex_words
+from aixlib.packers import pack_affine
+from aixlib.params import ParamStore, load_layer_params
+from aixlib.yolo import ConvLayer
+
+
+def _param_dir(data_dir, tmp_path):
+    param_dir = tmp_path / "param"
+    param_dir.mkdir()
+    for kind in ("weight", "biases", "scales"):
+        shutil.copy(data_dir / f"CONV04_param_{kind}.hex", param_dir)
+    return param_dir
+
+
+def test_param_archive_roundtrip(data_dir, tmp_path):
+    param_dir = _param_dir(data_dir, tmp_path)
+    store = ParamStore(param_dir, tmp_path / "archive.bin")
+    assert not store.archive_is_fresh()
+    expect = {kind: store.get("CONV04", kind).copy() for kind in ("weight", "biases", "scales")}
+    store.save_archive()
+
+    mapped = ParamStore(param_dir, tmp_path / "archive.bin")
+    assert mapped.archive_is_fresh()
+    for kind, arr in expect.items():
+        got = mapped.get("CONV04", kind)
+        assert got.dtype == arr.dtype
+        np.testing.assert_array_equal(got, arr)
+    assert (mapped.mapped, mapped.decoded) == (3, 0)
+    np.testing.assert_array_equal(expect["weight"].view(np.uint8),
+                                  read_hex_words(data_dir / "CONV04_param_weight.hex") & 0xFF)
+
+
+def test_load_layer_params_pads_cout(data_dir, tmp_path):
+    store = ParamStore(_param_dir(data_dir, tmp_path))
+    bias = read_hex_words(data_dir / "CONV04_param_biases.hex").view("<i4")
+    scale = read_hex_words(data_dir / "CONV04_param_scales.hex")
+    layer = ConvLayer("X", "CONV04", 8, 8, 32, 68, 32, 64)
+    p = load_layer_params(layer, store)
+    np.testing.assert_array_equal(p["bias"], np.pad(bias, (0, 4)))
+    np.testing.assert_array_equal(p["scale"], np.pad(scale, (0, 4)))
+    np.testing.assert_array_equal(p["affine"], pack_affine(68, p["bias"], p["scale"]))
+    assert p["filt_32b"].size == 68 * 32 * 9 // 4 and not p["filt_32b"][-32 * 9:].any()
+    assert store._arrays == {}                  # 패킹 후 원본 배열은 놓음
+
+
+@pytest.mark.parametrize("kind, lines", [("biases", 63), ("scales", 65)])
+def test_load_layer_params_line_count(data_dir, tmp_path, kind, lines):
+    param_dir = _param_dir(data_dir, tmp_path)
+    words = read_hex_words(data_dir / f"CONV04_param_{kind}.hex")
+    path = param_dir / f"CONV04_param_{kind}.hex"
+    path.write_text("".join(f"{v:08x}\n" for v in np.resize(words, lines).tolist()))
+    with pytest.raises(ValueError, match=f"CONV04_param_{kind}.hex has {lines} lines, expected cout=64"):
+        load_layer_params(ConvLayer("L02", "CONV04", 64, 64, 32, 64, 32, 64), ParamStore(param_dir))
@@ -0,0 +1,64 @@
+"""
+성능 모델: Verilog define 읽기, 작은 레이어 표의 cycle / DRAM 합계 (손 계산 값과 비교)
+"""
+import pytest
+
+from aixlib.perf import (HwConfig, LayerCfg, estimate, eval_define, load_hw_config, load_layer_table,
+                         parse_defines, sweep)
+from aixlib.yolo import YOLO_LAYERS
+
+# clock 100MHz, 0.8GB/s -> 8 B/cycle, 요청 64B + 30 cycle, pipe_delay 9+2+3 = 14
+HW = HwConfig()
+TABLE = [
+    LayerCfg("L00", conv=True, row=4, col=4, cin=8, cout=8, maxpool=2, first=True),
+    LayerCfg("S00", conv=False, row=2, col=2, cin=8, cout=8, ofm_save=True),
+]
+
+
+def test_parse_defines():
+    defs = parse_defines("`define A 4 // tile\n`define B (`A*2 + 1)\n/* `define C 9 */\n"
+                         "`define W $clog2(`B)\n`define FLAG\n")
+    assert defs == {"A": "4", "B": "(`A*2 + 1)", "W": "$clog2(`B)", "FLAG": ""}
+    assert eval_define(defs, "B") == 9 and eval_define(defs, "W") == 4
+    with pytest.raises(KeyError):
+        eval_define(defs, "C")
+    with pytest.raises(ValueError, match="FLAG"):
+        eval_define(defs, "FLAG")
+
+
+def test_load_checked_in_headers(inout_dir):
+    src = inout_dir.parent / "src"
+    hw = load_hw_config(src / "controller_params.vh", clock_mhz=200.0)
+    assert (hw.tin, hw.tout, hw.k, hw.clock_mhz) == (4, 4, 3, 200.0)
+    table = load_layer_table(src / "yolo_layer_cfg.vh")
+    convs = [l for l in table if l.conv]
+    assert [l.name for l in convs] == [l.name for l in YOLO_LAYERS]
+    assert table[0].first and not any(l.first for l in table[1:])
+    assert (convs[0].row, convs[0].cin, convs[0].cout) == (256, 4, 16)
+
+
+def test_estimate_totals():
+    res = estimate(TABLE, HW)
+    conv, save = res["layers"]
+    # conv: tile 2개 x (DATA 4*4*2 + 14), filter tile 288B (요청 5개), affine 64B, IFM 128B
+    assert conv["macs"] == 4 * 4 * 8 * 8 * 9
+    assert conv["compute_cycles"] == 2 * (32 + 14)
+    assert conv["dram_read_bytes"] == 128 + 2 * 288 + 64
+    assert conv["dma_cycles"] == 2 * (5 * 30 + 36) + (30 + 8) + (2 * 30 + 16)
+    assert conv["cycles"] == 92 + 486 and conv["bound"] == "memory"
+    # save: 2x2x8 워드 복사 8 cycle + OFM 32B 쓰기
+    assert (save["compute_cycles"], save["dram_write_bytes"], save["stall_cycles"]) == (8, 32, 34)
+
+    assert res["cycles"] == 578 + 42
+    assert res["dram_bytes"] == 768 + 32 and res["stall_cycles"] == 486 + 34
+    assert res["fps"] == pytest.approx(100e6 / 620)
+    assert res["memory_bound"] == ["L00", "S00"]
+
+
+def test_overlap_filter_and_sweep():
+    overlap = estimate(TABLE, HwConfig(overlap_filter=True))
+    # 첫 tile filter(186)만 드러나고 두 번째는 연산(46) 뒤에 일부만 숨는다: 186 + (186 - 46)
+    assert overlap["layers"][0]["stall_cycles"] == 186 + 140 + 38 + 76
+    results = sweep(TABLE, HW, tin=[4, 8], clock_mhz=[100.0, 200.0])
+    assert [(r["hw"].tin, r["hw"].clock_mhz) for r in results] == [(4, 100.0), (4, 200.0), (8, 100.0), (8, 200.0)]
+    assert results[2]["layers"][0]["compute_cycles"] == 2 * (16 + 14)
@@ -0,0 +1,67 @@
+"""
+DRAM access trace: 작은 레이어 표의 요청 / byte 합계 (손 계산, perf.estimate와 일치), 파일, reuse distance
+"""
+import numpy as np
+import pytest
+
+from aixlib.layout import LayoutConfig, plan_layout
+from aixlib.perf import HwConfig, LayerCfg, estimate
+from aixlib.trace import (TRACE_KINDS, cache_hit_rate, iter_trace, read_trace, reuse_distances, summarize_trace,
+                          write_trace)
+from aixlib.yolo import ConvLayer
+
+# 요청 64B, DRAM 요청 하나 = 30 + 64/8 = 38 cycle
+HW = HwConfig()
+TABLE = [
+    LayerCfg("L00", conv=True, row=4, col=4, cin=8, cout=8, maxpool=2, first=True),
+    LayerCfg("S00", conv=False, row=2, col=2, cin=8, cout=8, ofm_save=True),
+]
+# IFM [0, 128) -> filter [128, 704) -> bias [704, 736) -> scale [768, 800), OFM 1MB
+PLAN = plan_layout([ConvLayer("L00", "P0", 4, 4, 8, 8, 8, 8)], 128, LayoutConfig(ofm_offset=1 << 20))
+
+
+def test_trace_schedule():
+    conv, save = iter_trace(TABLE, PLAN, HW)
+    kinds = [TRACE_KINDS[k] for k in conv["kind"]]
+    assert kinds == ["ifm"] * 2 + ["bias", "scale"] + ["filter"] * 10
+    # IFM 2개, bias, scale 다음 filter tile 0 (5 요청) -> DATA 46 cycle -> tile 1
+    assert conv["cycle"].tolist() == [0, 38, 76, 114] + list(range(152, 342, 38)) + list(range(388, 578, 38))
+    assert conv["addr"][4:].tolist() == list(range(128, 416, 64)) + list(range(416, 704, 64))
+    assert conv["nbytes"][4:].tolist() == [64, 64, 64, 64, 32] * 2          # tile 288B
+    # save: tile 1 끝(624) + 2x2x2 워드 복사 8 cycle 후 OFM 쓰기
+    assert (save["cycle"].tolist(), save["addr"].tolist(), save["op"].tolist()) == ([632], [1 << 20], [1])
+
+
+def test_summary_matches_estimate():
+    records = np.concatenate(list(iter_trace(TABLE, PLAN, HW)))
+    s = summarize_trace(records, [l.name for l in TABLE])
+    assert (s["records"], s["cycles"]) == (15, 632)
+    assert (s["dram_read_bytes"], s["dram_write_bytes"], s["onchip_bytes"]) == (768, 32, 0)
+    assert s["dram_read_bytes"] + s["dram_write_bytes"] == estimate(TABLE, HW)["dram_bytes"]
+    assert s["by_kind"] == {"ifm": 128, "filter": 576, "bias": 32, "scale": 32, "ofm": 32}
+    assert s["by_layer"] == {"L00": 768, "S00": 32}
+    assert s["burst"] == {"requests": 15, "bursts": 15, "useful_bytes": 800, "moved_bytes": 960,
+                          "utilization": pytest.approx(800 / 960), "misaligned": 5}    # filter tile 1 (416~)
+    # filter tile 0의 마지막 요청(384)과 tile 1의 첫 요청(416)이 같은 64B line
+    assert s["reuse"]["cold"] == 13 and s["reuse"]["histogram"] == {"<1": 1}
+    assert cache_hit_rate(s, 64) == pytest.approx(1 / 14)
+
+    two = summarize_trace(np.concatenate(list(iter_trace(TABLE, PLAN, HW, frames=2))), ["L00", "S00"])
+    assert two["dram_read_bytes"] == 2 * 768 and two["reuse"]["cold"] == 13
+
+
+def test_trace_file_roundtrip(tmp_path):
+    path = tmp_path / "t.trace"
+    assert write_trace(path, iter_trace(TABLE, PLAN, HW), meta={"layers": ["L00", "S00"]}) == 15
+    meta, records = read_trace(path)
+    assert meta["count"] == 15 and meta["layers"] == ["L00", "S00"] and meta["kinds"] == list(TRACE_KINDS)
+    np.testing.assert_array_equal(records, np.concatenate(list(iter_trace(TABLE, PLAN, HW))))
+    (tmp_path / "bad.trace").write_bytes(b"x" * 64)
+    with pytest.raises(ValueError, match="not a trace"):
+        read_trace(tmp_path / "bad.trace")
+
+
+def test_reuse_distances():
+    assert reuse_distances(np.array([1, 2, 1, 3, 2, 1])).tolist() == [-1, -1, 1, -1, 2, 2]
+    assert reuse_distances(np.array([5, 5, 5])).tolist() == [-1, 0, 0]
+    assert reuse_distances(np.zeros(0, dtype=np.int64)).size == 0
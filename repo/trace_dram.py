@@ -0,0 +1,96 @@
+"""
+엔진의 DRAM 접근 trace 생성 / 요약 (Verilog 없이 buffer 크기, prefetch 전략 검토용)
+
+    python repo/trace_dram.py                                     # 기본 배치로 trace + 요약
+    python repo/trace_dram.py --frames 4 --cache-kb 256,1024,8192 # 프레임 간 reuse / LRU hit 비율
+    python repo/trace_dram.py --route-dram 16777216               # route를 DRAM에 둔다고 가정
+    python repo/trace_dram.py --summary trace.bin                 # 기존 trace 요약만
+
+trace 레코드 하나 = DMA 요청 하나 (16워드, 64B): (cycle, addr, nbytes, read/write, kind, layer, space).
+주소는 make_yolo_image.py와 같은 plan_layout 배치 (--section-align / --block-align 도 같은 값으로).
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from aixlib.compare import yolo_output_regions
+from aixlib.layout import LayoutConfig, plan_layout
+from aixlib.perf import load_hw_config, load_layer_table
+from aixlib.trace import iter_trace, write_trace, read_trace, summarize_trace, cache_hit_rate, TRACE_DTYPE
+from aixlib.yolo import YOLO_LAYERS
+
+
+def print_summary(s: dict, cache_kb: list[int]) -> None:
+    print(f"records: {s['records']} ({TRACE_DTYPE.itemsize} B each), last issue at cycle {s['cycles']}")
+    print(f"DRAM read : {s['dram_read_bytes']} bytes")
+    print(f"DRAM write: {s['dram_write_bytes']} bytes")
+    print(f"on-chip   : {s['onchip_bytes']} bytes (route save / load)")
+    print("by kind   : " + ", ".join(f"{k}={v}" for k, v in s["by_kind"].items()))
+    print("by layer  : " + ", ".join(f"{k}={v}" for k, v in s["by_layer"].items()))
+    b = s["burst"]
+    print(f"burst     : {b['requests']} requests, {b['bursts']} bursts (page split {b['bursts'] - b['requests']}), "
+          f"utilization {b['utilization']:.2%}, misaligned starts {b['misaligned']}")
+    r = s["reuse"]
+    print(f"reuse     : {r['accesses']} reads ({r['line_bytes']} B lines), cold {r['cold']}, "
+          f"median distance {r['median_lines']} lines")
+    for k, c in r["histogram"].items():
+        print(f"  {k:>10} lines: {c}")
+    for kb in cache_kb:
+        print(f"LRU {kb} KB: hit {cache_hit_rate(s, kb << 10):.2%}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    root_dir = Path(__file__).resolve().parent.parent
+    ap = argparse.ArgumentParser(description="DRAM access trace of the YOLO engine")
+    ap.add_argument("--out", type=Path, default=root_dir / "hw" / "inout_data" / "yolo" / "dram" / "yolo_engine_trace.bin")
+    ap.add_argument("--summary", type=Path, default=None, help="trace를 만들지 않고 이 파일을 요약")
+    ap.add_argument("--layer-cfg", type=Path, default=root_dir / "hw" / "src" / "yolo_layer_cfg.vh")
+    ap.add_argument("--hw-params", type=Path, default=root_dir / "hw" / "src" / "controller_params.vh")
+    ap.add_argument("--section-align", type=int, default=LayoutConfig.section_align)
+    ap.add_argument("--block-align", type=int, default=LayoutConfig.block_align)
+    ap.add_argument("--frames", type=int, default=1, help="연속 프레임 수 (프레임 간 파라미터 reuse)")
+    ap.add_argument("--clock", type=float, default=100.0, help="clock (MHz)")
+    ap.add_argument("--bw", type=float, default=0.8, help="DRAM 유효 대역폭 (GB/s)")
+    ap.add_argument("--latency", type=int, default=30, help="DMA 요청당 고정 지연 (cycle)")
+    ap.add_argument("--overlap-filter", action="store_true", help="다음 tile filter를 연산 중 미리 읽기")
+    ap.add_argument("--route-dram", type=int, default=None, help="route 데이터를 이 DRAM byte 주소에 둔다고 가정")
+    ap.add_argument("--line-bytes", type=int, default=64, help="reuse distance line 크기")
+    ap.add_argument("--cache-kb", type=lambda t: [int(v) for v in t.split(",") if v], default=[],
+                    help="LRU hit 비율을 볼 cache 크기 (KB, 쉼표로 여러 개)")
+    ap.add_argument("--json", type=Path, default=None, help="요약 JSON")
+    args = ap.parse_args(argv)
+
+    if args.summary is None:
+        if args.frames <= 0:
+            raise ValueError(f"frames must be positive: {args.frames}")
+        hw = load_hw_config(args.hw_params, clock_mhz=args.clock, dram_gbps=args.bw,
+                            dma_latency=args.latency, overlap_filter=args.overlap_filter)
+        table = load_layer_table(args.layer_cfg)
+        L00 = YOLO_LAYERS[0]
+        expect_bytes = sum(r.words for r in yolo_output_regions()) * 4
+        plan = plan_layout(YOLO_LAYERS, L00.height * L00.width * L00.cin,
+                           LayoutConfig(section_align=args.section_align, block_align=args.block_align),
+                           ofm_bytes=expect_bytes)
+        meta = {"layers": [l.name for l in table], "frames": args.frames, "burst_bytes": hw.burst_words * 4,
+                "clock_mhz": hw.clock_mhz, "dram_gbps": hw.dram_gbps, "dma_latency": hw.dma_latency,
+                "overlap_filter": hw.overlap_filter, "route_dram": args.route_dram}
+        count = write_trace(args.out, iter_trace(table, plan, hw, args.frames, args.route_dram), meta)
+        print(f"saved: {args.out} ({count} records)")
+        path = args.out
+    else:
+        path = args.summary
+
+    meta, records = read_trace(path)
+    summary = summarize_trace(records, meta["layers"], args.line_bytes,
+                              burst_bytes=meta.get("burst_bytes", 64))
+    print_summary(summary, args.cache_kb)
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"meta": meta, "summary": summary}, indent=2))
+        print(f"saved: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())